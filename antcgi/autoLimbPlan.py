@@ -0,0 +1,465 @@
+#-----------------------------------------
+# Suyeon Auto Limb Tool - build plan
+# autoLimbTool 이 실행할 명령 목록을 만든다. (maya 없이 사용 가능)
+#
+# dry-run:
+#   python autoLimbPlan.py l_leg_femur l_leg_tibia l_leg_metatarsus l_leg_ankle --rear [--json plan.json]
+#   (조인트 수는 3개 이상 자유)
+#-----------------------------------------
+
+import hashlib
+import json
+import buildPlan
+import limbMath
+
+# 조인트 수를 지정하지 않았을 때 사용하는 사족 보행 다리 조인트 수 (femur, tibia, metatarsus, ankle)
+DEFAULT_LIMB_JOINTS = 4
+MIN_LIMB_JOINTS = 3
+STRETCH_NODE_PLUGIN = 'limbStretchNode.py'
+
+# plan 내용이 바뀌면 올려서 기존 리그를 전부 다시 만들게 한다
+PLAN_VERSION = 3
+FINGERPRINT_DIGITS = 4
+
+# 실행 순서와 각 섹션이 만든 노드를 지울 때 같이 다시 만들어야 하는 의존 관계
+SECTIONS = ['group', 'joints', 'blend', 'ik', 'stretch', 'roll']
+SECTION_DEPENDENCIES = {
+    'group': [],
+    'joints': ['group'],
+    'blend': ['joints'],
+    'ik': ['joints'],
+    'stretch': ['joints'],
+    'roll': ['group'],
+}
+
+def getLimbName(jointRoot: str, isRearLeg: bool) -> str:
+    whichSide = jointRoot[0:2]
+
+    if whichSide not in ('l_', 'r_'):
+        raise ValueError('Please use a joint with a usable prefix of either l_ or r_')
+
+    return whichSide + 'leg_' + ('rear' if isRearLeg else 'front')
+
+def validateChain(jointHierarchy: list[str], worldMatrices: list[list[float]] | None = None) -> dict | None:
+    """조인트 수와 (world matrix 가 있으면) 길이가 0 인 구간을 확인하고 limbMath.chainMetrics 를 반환한다."""
+    if len(jointHierarchy) < MIN_LIMB_JOINTS:
+        raise ValueError(f'A limb needs at least {MIN_LIMB_JOINTS} joints, got {len(jointHierarchy)}')
+
+    if worldMatrices is None:
+        return None
+
+    metrics = limbMath.chainMetrics(worldMatrices)
+    zeroSegments = [f'{jointHierarchy[i]} -> {jointHierarchy[i + 1]}' for i in (metrics['segmentLengths'] <= limbMath.EPSILON).nonzero()[0]]
+
+    if zeroSegments:
+        raise ValueError('Zero length limb segments: ' + ', '.join(zeroSegments))
+
+    return metrics
+
+def _addStretchNetwork(add, jointHierarchy: list[str], limbName: str, stretchEndPosLoc: str, isRearLeg: bool):
+    mainControl = limbName + '_ctrl'
+    pawControlName = limbName + '_ik_ctrl'
+
+    # 다리 관절들 사이 길이들 합
+    limbLengthPMANode = limbName + '_length'
+    add('shadingNode', 'plusMinusAverage', asUtility=True, name=limbLengthPMANode)
+    for i in range(len(jointHierarchy) - 1):
+        distanceNode = jointHierarchy[i] + '_distnode'
+        add('shadingNode', 'distanceBetween', asUtility=True, name=distanceNode)
+        add('connectAttr', jointHierarchy[i] + '_stretch.worldMatrix', distanceNode + '.inMatrix1', force=True)
+        add('connectAttr', jointHierarchy[i+1] + '_stretch.worldMatrix', distanceNode + '.inMatrix2', force=True)
+        add('connectAttr', jointHierarchy[i] + '_stretch.rotatePivotTranslate', distanceNode + '.point1', force=True)
+        add('connectAttr', jointHierarchy[i+1] + '_stretch.rotatePivotTranslate', distanceNode + '.point2', force=True)
+        add('connectAttr', distanceNode + '.distance', limbLengthPMANode + f'.input1D[{i}]', force=True)
+
+    # 첫 번째 관절과 발목 사이의 거리
+    distanceNode = limbName + '_stretch_distnode'
+    add('shadingNode', 'distanceBetween', asUtility=True, name=distanceNode)
+    add('connectAttr', jointHierarchy[0] + '_stretch.worldMatrix', distanceNode + '.inMatrix1', force=True)
+    add('connectAttr', stretchEndPosLoc + '.worldMatrix', distanceNode + '.inMatrix2', force=True)
+    add('connectAttr', jointHierarchy[0] + '_stretch.rotatePivotTranslate', distanceNode + '.point1', force=True)
+    add('connectAttr', stretchEndPosLoc + '.rotatePivotTranslate', distanceNode + '.point2', force=True)
+
+    scaleFactorCalcNode = limbName + '_scaleFactor'
+    stretchConditionNode = limbName + '_stretchCondition'
+    add('shadingNode', 'multiplyDivide', asUtility=True, name=scaleFactorCalcNode)
+    add('shadingNode', 'condition', asUtility=True, name=stretchConditionNode)
+
+    add('setAttr', scaleFactorCalcNode + '.operation', 2) # divide
+
+    # 스트레치 여부 확인
+    add('setAttr', stretchConditionNode + '.operation', 2) # greater than
+    add('setAttr', stretchConditionNode + '.secondTerm', 1)
+    add('connectAttr', distanceNode + '.distance', scaleFactorCalcNode + '.input1X', force=True)
+    add('connectAttr', limbLengthPMANode + '.output1D', scaleFactorCalcNode + '.input2X', force=True)
+
+    add('connectAttr', scaleFactorCalcNode + '.outputX', stretchConditionNode + '.firstTerm', force=True)
+    add('connectAttr', scaleFactorCalcNode + '.outputX', stretchConditionNode + '.colorIfTrueR', force=True)
+
+    for i in range(len(jointHierarchy)):
+        add('connectAttr', stretchConditionNode + '.outColorR', jointHierarchy[i] + '_ik.scaleX', force=True)
+
+        if isRearLeg:
+            add('connectAttr', stretchConditionNode + '.outColorR', jointHierarchy[i] + '_driver.scaleX', force=True)
+
+    # Stretchness 어트리뷰트 반영
+    stretchnessBlendingNode = limbName + '_blendStretchness'
+    add('shadingNode', 'blendColors', asUtility=True, name=stretchnessBlendingNode)
+    add('setAttr', stretchnessBlendingNode + '.color2', 1, 0, 0, type='double3')
+    add('connectAttr', scaleFactorCalcNode + '.outputX', stretchnessBlendingNode + '.color1R', force=True)
+    add('connectAttr', stretchnessBlendingNode + '.outputR', stretchConditionNode + '.colorIfTrueR', force=True)
+    add('connectAttr', pawControlName + '.Stretchiness', stretchnessBlendingNode + '.blender', force=True)
+
+    # Stretch_Type 어트리뷰트 반영 - 키프레임 활용
+    for stretchType, operation in [(0, 1), (1, 3), (2, 5)]: # not equal, greater than, less or equal
+        add('setAttr', pawControlName + '.Stretch_Type', stretchType)
+        add('setAttr', stretchConditionNode + '.operation', operation)
+        add('setDrivenKeyframe', stretchConditionNode + '.operation', currentDriver=pawControlName + '.Stretch_Type')
+
+    add('setAttr', pawControlName + '.Stretch_Type', 0)
+
+    #-------------------------------------
+    add('select', clear=True)
+
+    #-------------------------------------
+    # volume preservation
+    #-------------------------------------
+    volumeCalcNode = limbName + '_volume'
+    add('shadingNode', 'multiplyDivide', asUtility=True, name=volumeCalcNode)
+    add('setAttr', volumeCalcNode + '.operation', 3)
+    add('connectAttr', stretchnessBlendingNode + '.outputR', volumeCalcNode + '.input1X', force=True)
+    add('connectAttr', volumeCalcNode + '.outputX', stretchConditionNode + '.colorIfTrueG', force=True)
+
+    # TODO: 추후 리본 시스템에 맞게 변경 필요
+    for joint in jointHierarchy[1:-1]:
+        add('connectAttr', stretchConditionNode + '.outColorG', joint + '.scaleY', force=True)
+        add('connectAttr', stretchConditionNode + '.outColorG', joint + '.scaleZ', force=True)
+
+    add('connectAttr', mainControl + '.Volume_Offset', volumeCalcNode + '.input2X', force=True)
+
+def _addStretchNode(add, jointHierarchy: list[str], limbName: str, stretchEndPosLoc: str, isRearLeg: bool):
+    """nodes/limbStretchNode.py 의 limbStretch 노드 하나로 stretch / volume 계산"""
+    mainControl = limbName + '_ctrl'
+    pawControlName = limbName + '_ik_ctrl'
+
+    stretchNode = limbName + '_limbStretch'
+    add('loadPlugin', STRETCH_NODE_PLUGIN, quiet=True)
+    add('createNode', 'limbStretch', name=stretchNode)
+
+    for i in range(len(jointHierarchy)):
+        add('connectAttr', jointHierarchy[i] + '_stretch.worldMatrix', stretchNode + f'.inputMatrix[{i}]', force=True)
+
+    add('connectAttr', stretchEndPosLoc + '.worldMatrix', stretchNode + '.endMatrix', force=True)
+    add('connectAttr', pawControlName + '.Stretchiness', stretchNode + '.stretchiness', force=True)
+    add('connectAttr', pawControlName + '.Stretch_Type', stretchNode + '.stretchType', force=True)
+    add('connectAttr', mainControl + '.Volume_Offset', stretchNode + '.volumeOffset', force=True)
+
+    for i in range(len(jointHierarchy)):
+        add('connectAttr', stretchNode + '.outputScale', jointHierarchy[i] + '_ik.scaleX', force=True)
+
+        if isRearLeg:
+            add('connectAttr', stretchNode + '.outputScale', jointHierarchy[i] + '_driver.scaleX', force=True)
+
+    # TODO: 추후 리본 시스템에 맞게 변경 필요
+    for joint in jointHierarchy[1:-1]:
+        add('connectAttr', stretchNode + '.outputVolume', joint + '.scaleY', force=True)
+        add('connectAttr', stretchNode + '.outputVolume', joint + '.scaleZ', force=True)
+
+def _addGroupSection(add, jointHierarchy: list[str], limbName: str, isRearLeg: bool):
+    jointRoot = jointHierarchy[0]
+    rootControl = limbName + '_root_ctrl'
+
+    add('select', clear=True)
+
+    #-------------------------------------
+    # organize the hierarchy
+    #-------------------------------------
+    add('group', empty=True, name=limbName + "_grp")
+    add('matchTransform', limbName + "_grp", jointRoot)
+    add('makeIdentity', limbName + "_grp", apply=True, translate=True, rotate=True)
+
+    add('parentConstraint', rootControl, limbName + '_grp', name=limbName + '_grp_parentConstraint1', weight=1, maintainOffset=True)
+
+    add('parent', limbName + '_grp', 'rig_systems')
+    add('select', clear=True)
+
+def _addJointsSection(add, jointHierarchy: list[str], limbName: str, isRearLeg: bool):
+    jointRoot = jointHierarchy[0]
+
+    add('select', clear=True)
+
+    #-------------------------------------
+    # Duplicate the main joint chain and rename each joint
+    #-------------------------------------
+    newJointList=["_ik", "_fk", "_stretch"]
+
+    if isRearLeg:
+        newJointList.append('_driver')
+
+    for newJoint in newJointList:
+        for i in range(len(jointHierarchy)):
+            newJointName = jointHierarchy[i] + newJoint
+            add('joint', name=newJointName)
+            add('matchTransform', newJointName, jointHierarchy[i])
+            add('makeIdentity', newJointName, apply=True, rotate=True)
+
+        add('select', clear=True)
+
+    add('parent', *[jointRoot + newJoint for newJoint in newJointList], limbName + '_grp')
+    add('select', clear=True)
+
+def _addBlendSection(add, jointHierarchy: list[str], limbName: str, isRearLeg: bool):
+    mainControl = limbName + '_ctrl'
+
+    #-------------------------------------
+    # Constrain the main joints to the ik and fk joints so we can blend between them
+    #-------------------------------------
+    for i in range(len(jointHierarchy)):
+        add('parentConstraint', jointHierarchy[i] + "_fk", jointHierarchy[i] + "_ik", jointHierarchy[i], name=jointHierarchy[i] + '_parentConstraint1', weight=1, maintainOffset=False)
+
+    #-------------------------------------
+    # setup fk
+    #-------------------------------------
+    for i in range(len(jointHierarchy)):
+        add('parentConstraint', jointHierarchy[i] + "_fk_ctrl", jointHierarchy[i] + "_fk", name=jointHierarchy[i] + '_fk_parentConstraint1', weight=1, maintainOffset=False)
+
+    #-------------------------------------
+    # ik fk blending
+    #-------------------------------------
+    for i in range(len(jointHierarchy)):
+        constraint = jointHierarchy[i] + '_parentConstraint1'
+
+        add('connectAttr', mainControl + '.FK_IK_Switch', f'{constraint}.{jointHierarchy[i]}_ikW1', force=True)
+        add('connectAttr', limbName + '_fkik_reverse.outputX', f'{constraint}.{jointHierarchy[i]}_fkW0', force=True)
+
+def _addIkSection(add, jointHierarchy: list[str], limbName: str, isRearLeg: bool):
+    pawControlName = limbName + '_ik_ctrl'
+    kneeControlName = limbName + '_tibia_ctrl'
+    hockControlName = limbName + '_hock_ctrl'
+
+    #-------------------------------------
+    # setup ik
+    #-------------------------------------
+    if isRearLeg:
+        add('ikHandle', name=limbName + '_driver_ikHandle', solver='ikRPsolver', startJoint=jointHierarchy[0] + "_driver", endEffector=jointHierarchy[-1] + "_driver")
+
+    # 3 조인트 다리는 hock 없이 RP 하나로 끝까지 푼다
+    hasHock = len(jointHierarchy) > MIN_LIMB_JOINTS
+    kneeEndJoint = jointHierarchy[-2] if hasHock else jointHierarchy[-1]
+
+    add('ikHandle', name=limbName + '_knee_ikHandle', solver='ikRPsolver', startJoint=jointHierarchy[0] + "_ik", endEffector=kneeEndJoint + "_ik")
+
+    if hasHock:
+        add('ikHandle', name=limbName + '_hock_ikHandle', solver='ikSCsolver', startJoint=jointHierarchy[-2] + "_ik", endEffector=jointHierarchy[-1] + "_ik")
+
+    add('group', limbName + '_knee_ikHandle', name=limbName + '_knee_ctrl')
+    add('group', limbName + '_knee_ctrl', name=limbName + '_knee_ctrl_offset')
+
+    add('matchTransform', limbName + '_knee_ctrl', limbName + '_knee_ctrl_offset', jointHierarchy[-1], pivots=True)
+
+    if hasHock:
+        add('parent', limbName + '_hock_ikHandle', pawControlName)
+
+    if isRearLeg:
+        # knee IK 가 끝나는 driver 조인트를 따라간다 (hock 이 없으면 끝 조인트)
+        add('parent', limbName + '_knee_ctrl_offset', kneeEndJoint + "_driver")
+
+        if hasHock:
+            add('parent', limbName + '_hock_ikHandle', jointHierarchy[-1] + "_driver")
+
+        add('parent', limbName + '_driver_ikHandle', pawControlName)
+    else:
+        add('parent', limbName + '_knee_ctrl_offset', 'root_ctrl')
+        add('pointConstraint', pawControlName, limbName + '_knee_ctrl_offset', name=limbName + '_knee_ctrl_offset_pointConstraint1', weight=1)
+
+    add('orientConstraint', pawControlName, jointHierarchy[-1] + '_ik', name=jointHierarchy[-1] + '_ik_orientConstraint1', weight=1, maintainOffset=True)
+
+    # pv
+    poleVectorIkHandle = limbName + ('_driver_ikHandle' if isRearLeg else '_knee_ikHandle')
+    add('poleVectorConstraint', kneeControlName, poleVectorIkHandle, name=poleVectorIkHandle + '_poleVectorConstraint1', weight=1)
+
+    #-------------------------------------
+    # add hock control
+    #-------------------------------------
+    add('shadingNode', 'multiplyDivide', asUtility=True, name=limbName + '_hock_multi')
+
+    add('connectAttr', hockControlName + '.translate', limbName + '_hock_multi.input1', force=True)
+    add('connectAttr', limbName + '_hock_multi.outputZ', limbName + '_knee_ctrl.rotateX', force=True)
+    add('connectAttr', limbName + '_hock_multi.outputX', limbName + '_knee_ctrl.rotateZ', force=True)
+
+    multiValue = 4 if isRearLeg else 5
+
+    add('setAttr', limbName + '_hock_multi.input2Z', multiValue)
+    add('setAttr', limbName + '_hock_multi.input2X', -multiValue)
+
+def _addStretchSection(add, jointHierarchy: list[str], limbName: str, isRearLeg: bool, useStretchNode: bool):
+    pawControlName = limbName + '_ik_ctrl'
+
+    add('select', clear=True)
+
+    #-------------------------------------
+    # make stertch
+    #-------------------------------------
+    stretchEndPosLoc = limbName + '_stertchEndPos_loc'
+    add('spaceLocator', name=stretchEndPosLoc)
+    add('matchTransform', stretchEndPosLoc, jointHierarchy[-1])
+    add('parent', stretchEndPosLoc, pawControlName)
+
+    if useStretchNode:
+        _addStretchNode(add, jointHierarchy, limbName, stretchEndPosLoc, isRearLeg)
+    else:
+        _addStretchNetwork(add, jointHierarchy, limbName, stretchEndPosLoc, isRearLeg)
+
+def _addRollSection(add, jointHierarchy: list[str], limbName: str, isRearLeg: bool, metrics: dict | None = None):
+    whichSide = jointHierarchy[0][0:2]
+
+    add('select', clear=True)
+
+    #-------------------------------------
+    # make roll joints & systems
+    #-------------------------------------
+    if whichSide == 'l_':
+        flipSide = 1
+    else:
+        flipSide = -1
+
+    # femur 롤 조인트 생성
+    rollJointList = [jointHierarchy[0], jointHierarchy[-1], jointHierarchy[0], jointHierarchy[0]]
+    for i in range(len(rollJointList)):
+        rollJointName = rollJointList[i]
+
+        if i == 3:
+            rollJointName += '_follow_tip'
+        elif i == 2:
+            rollJointName += '_follow'
+        else:
+            rollJointName += '_roll'
+
+        add('joint', name=rollJointName, radius=2)
+        add('matchTransform', rollJointName, rollJointList[i])
+        add('makeIdentity', rollJointName, apply=True, rotate=True)
+
+        if i < 2:
+            add('parent', rollJointName, rollJointList[i])
+
+        if i != 2:
+            add('select', clear=True)
+
+    # femur 롤 시스템 생성
+    # follow tip 은 첫 구간의 중점. world matrix 를 알면 바로 배치하고 모르면 임시 point constraint 사용
+    if metrics is not None:
+        add('xform', rollJointList[2] + '_follow_tip', worldSpace=True, translation=[float(value) for value in metrics['midpoints'][0]])
+    else:
+        tempConstraint = rollJointList[2] + '_follow_tip_tempPointConstraint'
+        add('pointConstraint', jointHierarchy[0], jointHierarchy[1], rollJointList[2] + '_follow_tip', name=tempConstraint, weight=1, maintainOffset=False)
+        add('delete', tempConstraint)
+    add('move', 0, 0, -5 * flipSide, rollJointList[2] + '_follow', relative=True, objectSpace=True, worldSpaceDistance=True)
+
+    rollAimLocator = rollJointList[0] + '_roll_aim'
+    add('spaceLocator', name=rollAimLocator)
+    add('matchTransform', rollAimLocator, rollJointList[2] + '_follow')
+    add('parent', rollAimLocator, rollJointList[2] + '_follow')
+    add('move', 0, 0, -5 * flipSide, rollAimLocator, relative=True, objectSpace=True, worldSpaceDistance=True)
+
+    add('aimConstraint', jointHierarchy[1], rollJointList[0] + '_roll', name=rollJointList[0] + '_roll_aimConstraint1', weight=True, aimVector=(1, 0, 0), upVector=(0, 0, -1), worldUpType='object', worldUpObject=rollAimLocator, maintainOffset=True)
+
+    followIkHandle = limbName + '_follow_ikHandle'
+    add('ikHandle', name=followIkHandle, solver="ikRPsolver", startJoint=rollJointList[2] + '_follow', endEffector=rollJointList[2] + '_follow_tip')
+    add('parent', followIkHandle, jointHierarchy[1])
+    add('matchTransform', followIkHandle, jointHierarchy[1])
+
+    add('setAttr', followIkHandle + '.poleVectorX', 0)
+    add('setAttr', followIkHandle + '.poleVectorY', 0)
+    add('setAttr', followIkHandle + '.poleVectorZ', 0)
+
+    # metacarpus 롤 시스템 생성
+    rollAimLocator = rollJointList[1] + '_roll_aim'
+    add('spaceLocator', name=rollAimLocator)
+    add('matchTransform', rollAimLocator, rollJointList[1] + '_roll')
+    add('parent', rollAimLocator, jointHierarchy[-1])
+    add('move', 5 * flipSide, 0, 0, rollAimLocator, relative=True, objectSpace=True, worldSpaceDistance=True)
+
+    add('aimConstraint', jointHierarchy[-2], rollJointList[1] + '_roll', name=rollJointList[1] + '_roll_aimConstraint1', weight=True, aimVector=(0, 1, 0), upVector=(1, 0, 0), worldUpType='object', worldUpObject=rollAimLocator, maintainOffset=True)
+
+    # hierarchy
+    add('parent', rollJointList[0] + '_follow', limbName + '_grp')
+
+    add('select', clear=True)
+
+def buildAutoLimbSections(jointHierarchy: list[str], isRearLeg: bool, useStretchNode=False, worldMatrices: list[list[float]] | None = None) -> dict[str, list]:
+    """
+    섹션 이름 -> plan. SECTIONS 순서대로 실행해야 한다.
+    jointHierarchy 는 root 부터 끝까지 MIN_LIMB_JOINTS 개 이상의 조인트 체인이다.
+    """
+    limbName = getLimbName(jointHierarchy[0], isRearLeg)
+    metrics = validateChain(jointHierarchy, worldMatrices)
+
+    sectionBuilders = {
+        'group': _addGroupSection,
+        'joints': _addJointsSection,
+        'blend': _addBlendSection,
+        'ik': _addIkSection,
+        'stretch': lambda add, *args: _addStretchSection(add, *args, useStretchNode),
+        'roll': lambda add, *args: _addRollSection(add, *args, metrics),
+    }
+
+    sections = {}
+    for section in SECTIONS:
+        plan = sections[section] = []
+        sectionBuilders[section](lambda command, *args, **kwargs: buildPlan.add(plan, command, *args, **kwargs), jointHierarchy, limbName, isRearLeg)
+
+    return sections
+
+def buildAutoLimbPlan(jointHierarchy: list[str], isRearLeg: bool, useStretchNode=False, worldMatrices: list[list[float]] | None = None) -> list:
+    sections = buildAutoLimbSections(jointHierarchy, isRearLeg, useStretchNode, worldMatrices)
+    return [op for section in SECTIONS for op in sections[section]]
+
+def getSectionFingerprints(jointHierarchy: list[str], worldMatrices: list[list[float]], isRearLeg: bool, useStretchNode=False) -> dict[str, str]:
+    """
+    섹션마다 입력(조인트 이름, 섹션이 쓰는 world matrix, 옵션)과 의존하는 섹션의 fingerprint 를 합친 해시.
+    의존하는 섹션이 바뀌면 그 섹션도 다시 만들어진다.
+    worldMatrices 는 리그가 움직이는 현재 pose 가 아닌 bind pose 값이어야 한다. (utils.getBindPoseMatrices)
+    """
+    names = list(jointHierarchy)
+    matrices = [[round(value, FINGERPRINT_DIGITS) + 0.0 for value in matrix] for matrix in worldMatrices]
+
+    # blend / ik / stretch 는 joints 섹션의 조인트에 맞춰 만들거나 연결만 하므로 위치는 joints 의존으로 충분하다
+    inputs = {
+        'group': {'matrices': matrices[:1]},
+        'joints': {'matrices': matrices},
+        'blend': {},
+        'ik': {},
+        'stretch': {'useStretchNode': useStretchNode},
+        'roll': {'matrices': [matrices[0], matrices[1], matrices[-1]]},
+    }
+
+    fingerprints = {}
+    for section in SECTIONS:
+        data = {
+            'version': PLAN_VERSION,
+            'section': section,
+            'names': names,
+            'isRearLeg': isRearLeg,
+            'inputs': inputs[section],
+            'dependencies': [fingerprints[dependency] for dependency in SECTION_DEPENDENCIES[section]],
+        }
+        fingerprints[section] = hashlib.sha1(json.dumps(data, sort_keys=True).encode('utf-8')).hexdigest()
+
+    return fingerprints
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Print the autoLimb build plan without Maya')
+    parser.add_argument('joints', nargs='+', help=f'limb joints from root to end (at least {MIN_LIMB_JOINTS})')
+    parser.add_argument('--rear', action='store_true', help='build a rear leg')
+    parser.add_argument('--stretch-node', action='store_true', help='use the limbStretch node for stretch / volume')
+    parser.add_argument('--json', help='save the plan to this path')
+    options = parser.parse_args()
+
+    limbPlan = buildAutoLimbPlan(options.joints, options.rear, options.stretch_node)
+
+    if options.json:
+        buildPlan.save(limbPlan, options.json)
+
+    buildPlan.printPlan(limbPlan)
@@ -0,0 +1,71 @@
+#-----------------------------------------
+# Build plan
+# 리그 빌더가 바로 cmds 를 호출하는 대신 실행할 명령 목록(plan)을 만든다. (maya 없이 사용 가능)
+# 각 op 는 {'command': cmds 함수 이름, 'args': [...], 'kwargs': {...}} 형태이며
+# planExecutor.execute() 로 실행한다.
+# 섹션별로 나눈 plan 은 입력 fingerprint 와 함께 planExecutor.executeSections() 로 바뀐 섹션만 다시 만든다.
+#-----------------------------------------
+
+import json
+from collections import Counter
+
+# 노드를 만드는 명령과 생성되는 노드 타입
+NODE_COMMANDS = {
+    'joint': 'joint',
+    'group': 'transform',
+    'spaceLocator': 'locator',
+    'ikHandle': 'ikHandle',
+    'parentConstraint': 'parentConstraint',
+    'pointConstraint': 'pointConstraint',
+    'orientConstraint': 'orientConstraint',
+    'aimConstraint': 'aimConstraint',
+    'poleVectorConstraint': 'poleVectorConstraint',
+}
+
+def add(plan: list, command: str, *args, **kwargs) -> dict:
+    op = {'command': command, 'args': list(args), 'kwargs': kwargs}
+    plan.append(op)
+    return op
+
+def getNodeType(op: dict) -> str | None:
+    if op['command'] in ('shadingNode', 'createNode'):
+        return op['args'][0]
+
+    return NODE_COMMANDS.get(op['command'])
+
+def summarize(plan: list) -> dict:
+    """명령별 호출 수와 타입별 생성 노드 수"""
+    commands = Counter(op['command'] for op in plan)
+    nodes = Counter(nodeType for nodeType in map(getNodeType, plan) if nodeType)
+
+    return {'ops': len(plan), 'commands': dict(commands), 'nodes': dict(nodes)}
+
+def formatOp(op: dict) -> str:
+    args = [json.dumps(arg) for arg in op['args']]
+    args += [f'{key}={json.dumps(value)}' for key, value in op['kwargs'].items()]
+    return f"{op['command']}({', '.join(args)})"
+
+def formatPlan(plan: list) -> str:
+    """한 줄에 op 하나씩 출력 (버전 간 diff 용)"""
+    return '\n'.join(formatOp(op) for op in plan)
+
+def printPlan(plan: list):
+    print(formatPlan(plan))
+
+    summary = summarize(plan)
+    print(f"\n# {summary['ops']} ops")
+    for nodeType, count in sorted(summary['nodes'].items()):
+        print(f'#   {nodeType}: {count}')
+
+def getDirtySections(record: dict, fingerprints: dict[str, str]) -> list[str]:
+    """빌드 기록(record)에 저장된 fingerprint 와 다른 섹션 (fingerprints 순서)"""
+    sections = record.get('sections', {}) if record else {}
+    return [section for section, fingerprint in fingerprints.items() if sections.get(section, {}).get('fingerprint') != fingerprint]
+
+def save(plan: list, path: str):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(plan, f, indent=1)
+
+def load(path: str) -> list:
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
@@ -0,0 +1,167 @@
+#-----------------------------------------
+# Curve geometry
+# curveGenerator 에서 사용하는 커브 형태를 numpy 배열로 계산한다. (maya 없이 사용 가능)
+# 모든 함수는 shape 하나당 {'points', 'knots', 'degree', 'periodic'} 딕셔너리의 리스트를 반환한다.
+#-----------------------------------------
+
+import numpy as np
+
+def knots(degree: int, numPoints: int, periodic=False) -> np.ndarray:
+    if periodic:
+        return np.arange(-(degree - 1), numPoints, dtype=float)
+
+    spans = numPoints - degree
+    return np.concatenate([np.zeros(degree - 1), np.arange(spans + 1), np.full(degree - 1, spans)]).astype(float)
+
+def shape(points, degree=1, periodic=False) -> dict:
+    points = np.asarray(points, dtype=float)
+
+    if periodic:
+        points = np.concatenate([points, points[:degree]])
+
+    return {
+        'points': points,
+        'knots': knots(degree, len(points), periodic),
+        'degree': degree,
+        'periodic': periodic,
+    }
+
+def evaluate(shape: dict, samplesPerSpan=32) -> np.ndarray:
+    """커브 위의 점을 span 마다 samplesPerSpan 개씩 계산한다. (Maya knot 규칙: knot 수 = CV 수 + degree - 1)"""
+    points = np.asarray(shape['points'], dtype=float)
+    degree = shape['degree']
+    numPoints = len(points)
+
+    # Maya knot 양 끝에 하나씩 더해서 일반적인 B-spline knot 벡터로 만든다
+    knotVector = np.asarray(shape['knots'], dtype=float)
+    knotVector = np.concatenate([knotVector[:1], knotVector, knotVector[-1:]])
+
+    spanKnots = np.unique(knotVector[degree:numPoints + 1])
+    params = np.unique(np.concatenate([np.linspace(a, b, samplesPerSpan + 1) for a, b in zip(spanKnots[:-1], spanKnots[1:])]))
+    # 끝 parameter 는 마지막 span 안으로 넣는다
+    params = np.minimum(params, np.nextafter(spanKnots[-1], -np.inf))
+
+    u = params[:, None]
+    basis = ((knotVector[:-1] <= u) & (u < knotVector[1:])).astype(float)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for p in range(1, degree + 1):
+            left = np.nan_to_num((u - knotVector[:-p - 1]) / (knotVector[p:-1] - knotVector[:-p - 1]), posinf=0, neginf=0)
+            right = np.nan_to_num((knotVector[p + 1:] - u) / (knotVector[p + 1:] - knotVector[1:-p]), posinf=0, neginf=0)
+            basis = left * basis[:, :-1] + right * basis[:, 1:]
+
+    return basis @ points
+
+def boundingBox(shapes: list[dict]) -> tuple[np.ndarray, np.ndarray]:
+    """CV 가 아닌 실제 커브 위의 점으로 계산한 (min, max). 3차 커브는 CV 박스보다 작다."""
+    points = np.concatenate([evaluate(s) if s['degree'] > 1 else np.asarray(s['points'], dtype=float) for s in shapes])
+    return points.min(axis=0), points.max(axis=0)
+
+def boundingBoxCenter(shapes: list[dict]) -> np.ndarray:
+    points = np.concatenate([s['points'] for s in shapes])
+    return (points.min(axis=0) + points.max(axis=0)) / 2
+
+def _planeAxes(normal) -> tuple[np.ndarray, np.ndarray]:
+    normal = np.asarray(normal, dtype=float)
+    normal = normal / np.linalg.norm(normal)
+
+    helper = np.array([0.0, 0.0, 1.0]) if abs(normal[2]) < 0.9 else np.array([1.0, 0.0, 0.0])
+    uAxis = np.cross(normal, helper)
+    uAxis /= np.linalg.norm(uAxis)
+    vAxis = np.cross(uAxis, normal)
+
+    return uAxis, vAxis
+
+def circle(radius=1.0, sections=8, normal=(0, 1, 0)) -> list[dict]:
+    # 주기적 3차 B-spline 이 radius 를 지나도록 CV 반지름을 보정 (sections=8 일 때 1.108194)
+    cvRadius = 6 * radius / (4 + 2 * np.cos(2 * np.pi / sections))
+    angles = np.linspace(0, 2 * np.pi, sections, endpoint=False)
+
+    uAxis, vAxis = _planeAxes(normal)
+    points = cvRadius * (np.cos(angles)[:, None] * uAxis + np.sin(angles)[:, None] * vAxis)
+
+    return [shape(points, degree=3, periodic=True)]
+
+_CUBE = np.array([
+    [-1,  1, -1], [ 1,  1, -1], [ 1,  1,  1], [-1,  1,  1],
+    [-1,  1, -1], [-1, -1, -1], [-1, -1,  1], [ 1, -1,  1],
+    [ 1, -1, -1], [-1, -1, -1], [-1, -1,  1], [-1,  1,  1],
+    [ 1,  1,  1], [ 1, -1,  1], [ 1, -1, -1], [ 1,  1, -1],
+], dtype=float)
+
+def cube(width=1.0) -> list[dict]:
+    return [shape(_CUBE * (width / 2.0))]
+
+# top, bl, top, br, top, tr, top, tl, bl, br, tr, tl, bl
+_PYRAMID_ORDER = [0, 1, 0, 2, 0, 3, 0, 4, 1, 2, 3, 4, 1]
+
+def pyramid(width=1.0) -> list[dict]:
+    half = width / 2.0
+    height = np.sqrt(2.0 / 3.0) * width
+
+    corners = np.array([
+        [0, height, 0],
+        [-half, 0, -half],
+        [half, 0, -half],
+        [half, 0, half],
+        [-half, 0, half],
+    ])
+
+    return [shape(corners[_PYRAMID_ORDER])]
+
+def arrow(shaftWidth=1.0, shaftHeight: float | None = None, headWidth: float | None = None, headHeight: float | None = None) -> list[dict]:
+    shaftHeight = shaftHeight or round(shaftWidth * 0.5, 2)
+    headWidth = headWidth or round(shaftWidth * 0.8, 2)
+    headHeight = headHeight or round(shaftWidth * 1, 2)
+
+    zOffset = (shaftWidth + headWidth) / 2.0
+    halfShaftH = shaftHeight / 2.0
+    halfHeadH = headHeight / 2.0
+
+    x = np.array([-halfShaftH, -halfShaftH, -halfHeadH, 0, halfHeadH, halfShaftH, halfShaftH, -halfShaftH])
+    z = np.array([0, shaftWidth, shaftWidth, shaftWidth + headWidth, shaftWidth, shaftWidth, 0, 0]) - zOffset
+
+    return [shape(np.stack([x, np.zeros_like(x), z], axis=1))]
+
+def twoDirArrow(shaftWidth=1.0, shaftHeight: float | None = None, headWidth: float | None = None, headHeight: float | None = None) -> list[dict]:
+    shaftHeight = shaftHeight or round(shaftWidth * 0.3, 2)
+    headWidth = headWidth or round(shaftWidth * 0.4, 2)
+    headHeight = headHeight or round(shaftWidth * 0.6, 2)
+
+    halfShaft = shaftWidth / 2.0
+    halfShaftH = shaftHeight / 2.0
+    halfHeadH = headHeight / 2.0
+
+    x = np.array([-halfShaft - headWidth, -halfShaft, -halfShaft, halfShaft, halfShaft, halfShaft + headWidth,
+                  halfShaft, halfShaft, -halfShaft, -halfShaft, -halfShaft - headWidth])
+    z = np.array([0, halfHeadH, halfShaftH, halfShaftH, halfHeadH, 0,
+                  -halfHeadH, -halfShaftH, -halfShaftH, -halfHeadH, 0])
+
+    return [shape(np.stack([x, np.zeros_like(x), z], axis=1))]
+
+def radialArrow(centerRadius=2.0, numArrows=8, sections=16) -> list[dict]:
+    arrowLength = round(centerRadius * 0.6, 2)
+    arrowHeadWidth = round(centerRadius * 0.15, 2)
+    arrowThickness = round(centerRadius * 0.08, 2)
+    circleArrowGap = round(centerRadius * 0.1, 2)
+
+    startDistance = centerRadius + circleArrowGap
+    endDistance = startDistance + arrowLength
+    headStartDistance = endDistance - arrowHeadWidth * 0.7
+
+    halfThick = arrowThickness * 0.5
+    halfHead = arrowHeadWidth * 0.5
+
+    # 화살표 하나의 포인트를 (방향 거리, 수직 거리) 로 정의
+    radial = np.array([startDistance, headStartDistance, headStartDistance, endDistance,
+                       headStartDistance, headStartDistance, startDistance, startDistance])
+    lateral = np.array([halfThick, halfThick, halfHead, 0, -halfHead, -halfThick, -halfThick, halfThick])
+
+    angles = np.linspace(0, 2 * np.pi, numArrows, endpoint=False)
+    directions = np.stack([np.cos(angles), np.zeros_like(angles), np.sin(angles)], axis=1)
+    perpendiculars = np.stack([-np.sin(angles), np.zeros_like(angles), np.cos(angles)], axis=1)
+
+    # (numArrows, 8, 3)
+    arrowPoints = radial[None, :, None] * directions[:, None, :] + lateral[None, :, None] * perpendiculars[:, None, :]
+
+    return circle(centerRadius, sections) + [shape(points) for points in arrowPoints]
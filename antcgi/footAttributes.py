@@ -1,3 +1,16 @@
+#-----------------------------------------
+# Foot attributes
+# 발(paw) 어트리뷰트 네트워크를 FOOT_SPEC 으로 한 번만 기술하고
+# 네 다리(l/r, front/rear)에 맞게 펼친 build plan 을 planExecutor 로 한 번에 적용한다.
+#
+# FOOT_SPEC
+#   nodes       : 이름 템플릿 -> {'type', 'set': 값, 'mirror': 오른쪽에서 부호가 바뀌는 값, 'sides': 만들 쪽}
+#   sideSources : 쪽마다 다른 연결 source ({toeTap}, {toeCurl} 로 사용)
+#   connections : (source, destination[, sides]) 템플릿
+#   fingers     : 손가락 -> {spread}, {output} 값. fingerConnections 를 손가락마다 펼친다.
+#   템플릿에서 {ctrl} = ik 컨트롤러, {dir} = 발 이름 접두사 (예: l_front)
+#-----------------------------------------
+
 import sys
 import maya.mel as mel
 
@@ -5,63 +18,101 @@ modulePath = mel.eval('getenv "MAYA_MY_SCRIPT_PATH"')
 if modulePath not in sys.path:
     sys.path.append(modulePath)
 
-import maya.cmds as cmds
-import utils
-
-ctrl = 'l_leg_front_ik_ctrl'
-dir = 'l_front'
-
-cmds.connectAttr(f'{ctrl}.Heel_Twist', f'{dir}_heel_rev.rotateY')
-cmds.connectAttr(f'{ctrl}.Toe_Twist', f'{dir}_tip_rev.rotateY')
-
-spreadMultiInner = cmds.shadingNode('multiplyDivide', asUtility=True, name=f'{dir}_inner_toes_multi')
-factor = 0.5 * 1 if dir.startswith('l_') else -1
-cmds.setAttr(f'{spreadMultiInner}.input2X', factor)
-cmds.setAttr(f'{spreadMultiInner}.input2Y', -1 * factor)
-spreadMultiOuter = cmds.shadingNode('multiplyDivide', asUtility=True, name=f'{dir}_outer_toes_multi')
-factor = 1 * 1 if dir.startswith('l_') else -1
-cmds.setAttr(f'{spreadMultiOuter}.input2X', factor)
-cmds.setAttr(f'{spreadMultiOuter}.input2Y', -1 * factor)
-
-cmds.connectAttr(f'{ctrl}.Paw_Spread', f'{spreadMultiInner}.input1X')
-cmds.connectAttr(f'{ctrl}.Paw_Spread', f'{spreadMultiInner}.input1Y')
-cmds.connectAttr(f'{ctrl}.Paw_Spread', f'{spreadMultiOuter}.input1X')
-cmds.connectAttr(f'{ctrl}.Paw_Spread', f'{spreadMultiOuter}.input1Y')
-
-for finger in ['index', 'middle', 'ring', 'pinky']:
-    toeTapAttr = f'{ctrl}.Toe_Tap'
-    toeCurlAttr = f'{ctrl}.Toe_Curl'
-
-    if dir.startswith('r_'):
-        multiNode = f'{dir}_toe_tap_curl_multi'
-
-        if not cmds.objExists(multiNode):
-            cmds.shadingNode('multiplyDivide', asUtility=True, name=multiNode)
-            cmds.setAttr(f'{multiNode}.input2X', -1)
-            cmds.setAttr(f'{multiNode}.input2Y', -1)
-            cmds.connectAttr(toeTapAttr, f'{multiNode}.input1X')
-            cmds.connectAttr(toeCurlAttr, f'{multiNode}.input1Y')
-        
-        toeTapAttr = f'{multiNode}.outputX'
-        toeCurlAttr = f'{multiNode}.outputY'
-
-    cmds.connectAttr(toeTapAttr, f'{dir}_{finger}_end_ikHandle.translateY')
-    cmds.connectAttr(toeCurlAttr, f'{dir}_{finger}_tip_ikHandle.translateY')
-
-    if finger == 'middle' or finger == 'ring':
-        spreadMulti = spreadMultiInner
-    else:
-        spreadMulti = spreadMultiOuter
-
-    if finger == 'index' or finger == 'middle':
-        output = 'outputX'
+import importlib
+import buildPlan
+import planExecutor
+
+importlib.reload(buildPlan)
+importlib.reload(planExecutor)
+
+SIDES = ['l_', 'r_']
+PARTS = ['front', 'rear']
+
+FOOT_SPEC = {
+    'nodes': {
+        '{dir}_inner_toes_multi': {'type': 'multiplyDivide', 'mirror': {'input2X': 0.5, 'input2Y': -0.5}},
+        '{dir}_outer_toes_multi': {'type': 'multiplyDivide', 'mirror': {'input2X': 1, 'input2Y': -1}},
+        '{dir}_toe_tap_curl_multi': {'type': 'multiplyDivide', 'set': {'input2X': -1, 'input2Y': -1}, 'sides': ['r_']},
+    },
+    'sideSources': {
+        'l_': {'toeTap': '{ctrl}.Toe_Tap', 'toeCurl': '{ctrl}.Toe_Curl'},
+        'r_': {'toeTap': '{dir}_toe_tap_curl_multi.outputX', 'toeCurl': '{dir}_toe_tap_curl_multi.outputY'},
+    },
+    'connections': [
+        ('{ctrl}.Heel_Twist', '{dir}_heel_rev.rotateY'),
+        ('{ctrl}.Toe_Twist', '{dir}_tip_rev.rotateY'),
+        ('{ctrl}.Paw_Spread', '{dir}_inner_toes_multi.input1X'),
+        ('{ctrl}.Paw_Spread', '{dir}_inner_toes_multi.input1Y'),
+        ('{ctrl}.Paw_Spread', '{dir}_outer_toes_multi.input1X'),
+        ('{ctrl}.Paw_Spread', '{dir}_outer_toes_multi.input1Y'),
+        ('{ctrl}.Toe_Tap', '{dir}_toe_tap_curl_multi.input1X', ['r_']),
+        ('{ctrl}.Toe_Curl', '{dir}_toe_tap_curl_multi.input1Y', ['r_']),
+    ],
+    'fingers': {
+        'index': {'spread': 'outer', 'output': 'outputX'},
+        'middle': {'spread': 'inner', 'output': 'outputX'},
+        'ring': {'spread': 'inner', 'output': 'outputY'},
+        'pinky': {'spread': 'outer', 'output': 'outputY'},
+    },
+    'fingerConnections': [
+        ('{toeTap}', '{dir}_{finger}_end_ikHandle.translateY'),
+        ('{toeCurl}', '{dir}_{finger}_tip_ikHandle.translateY'),
+        ('{dir}_{spread}_toes_multi.{output}', '{dir}_{finger}_end_ikHandle.translateZ'),
+        ('{dir}_{spread}_toes_multi.{output}', '{dir}_{finger}_tip_ikHandle.translateZ'),
+    ],
+}
+
+def getLegs(sides: list[str] = SIDES, parts: list[str] = PARTS) -> list[tuple[str, str]]:
+    """(ik 컨트롤러, 발 이름 접두사) 목록"""
+    return [(f'{side}leg_{part}_ik_ctrl', f'{side}{part}') for side in sides for part in parts]
+
+def compileFootSpec(spec: dict = FOOT_SPEC, legs: list[tuple[str, str]] | None = None) -> list:
+    """
+    spec 을 legs 마다 펼쳐서 build plan 을 만든다.
+    노드 생성을 먼저, 값 설정과 연결을 그 뒤에 모아서 planExecutor 가 두 번의 modifier 로 적용하게 한다.
+    """
+    createPlan, wirePlan = [], []
+
+    for ctrl, dir in legs or getLegs():
+        side = dir[0:2]
+        sign = 1 if side == 'l_' else -1
+        values = {'ctrl': ctrl, 'dir': dir}
+        values.update({key: source.format(**values) for key, source in spec['sideSources'][side].items()})
+
+        for nameTemplate, nodeSpec in spec['nodes'].items():
+            if side not in nodeSpec.get('sides', SIDES):
+                continue
+
+            node = nameTemplate.format(**values)
+            buildPlan.add(createPlan, 'shadingNode', nodeSpec['type'], asUtility=True, name=node)
+
+            for attr, value in nodeSpec.get('set', {}).items():
+                buildPlan.add(wirePlan, 'setAttr', f'{node}.{attr}', value)
+
+            for attr, value in nodeSpec.get('mirror', {}).items():
+                buildPlan.add(wirePlan, 'setAttr', f'{node}.{attr}', value * sign)
+
+        for source, destination, *sides in spec['connections']:
+            if sides and side not in sides[0]:
+                continue
+
+            buildPlan.add(wirePlan, 'connectAttr', source.format(**values), destination.format(**values))
+
+        for finger, fingerValues in spec['fingers'].items():
+            for source, destination in spec['fingerConnections']:
+                buildPlan.add(wirePlan, 'connectAttr', source.format(finger=finger, **fingerValues, **values), destination.format(finger=finger, **fingerValues, **values))
+
+    return createPlan + wirePlan
+
+def setupFeet(legs: list[tuple[str, str]] | None = None, dryRun=False) -> list:
+    plan = compileFootSpec(FOOT_SPEC, legs)
+
+    if dryRun:
+        buildPlan.printPlan(plan)
     else:
-        output = 'outputY'
-
-    cmds.connectAttr(f'{spreadMulti}.{output}', f'{dir}_{finger}_end_ikHandle.translateZ')
-    cmds.connectAttr(f'{spreadMulti}.{output}', f'{dir}_{finger}_tip_ikHandle.translateZ')
-
-    
-
+        # 노드 생성과 연결은 다른 modifier 이므로 연결에서 실패하면 만든 노드까지 되돌린다
+        planExecutor.execute(plan, chunkName='footAttributes', rollbackOnError=True)
 
+    return plan
 
+setupFeet()
@@ -0,0 +1,125 @@
+#-----------------------------------------
+# Glyph cache
+# (font, 문자) 별 textCurves 아웃라인 CV 를 메모리와 디스크에 한 번만 저장해두고
+# 라벨을 만들 때는 캐시된 글리프를 옆으로 이어 붙여서 사용한다.
+#-----------------------------------------
+
+import json
+import os
+import numpy as np
+import maya.cmds as cmds
+import maya.api.OpenMaya as om
+import curveGeometry
+
+CACHE_FILE_NAME = 'syGlyphCache.json'
+# 공백처럼 shape 이 없는 글리프는 이 문자의 advance 를 사용한다
+BLANK_ADVANCE_CHAR = 'n'
+
+_glyphs = None
+
+def getCachePath() -> str:
+    return os.path.join(cmds.internalVar(userAppDir=True), CACHE_FILE_NAME)
+
+def _load() -> dict:
+    global _glyphs
+
+    if _glyphs is None:
+        _glyphs = {}
+        path = getCachePath()
+
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                _glyphs = json.load(f)
+
+    return _glyphs
+
+def _save():
+    with open(getCachePath(), 'w', encoding='utf-8') as f:
+        json.dump(_glyphs, f)
+
+def _getDagPath(name: str) -> om.MDagPath:
+    selList = om.MSelectionList()
+    selList.add(name)
+    return selList.getDagPath(0)
+
+def _extractGlyph(font: str, char: str) -> dict:
+    # 같은 문자를 두 번 써서 두 번째 문자 위치로 글자 간격(advance)을 구한다
+    result = cmds.textCurves(text=char * 2, font=font)
+    charParents = cmds.listRelatives(result[0], fullPath=True) or []
+
+    shapes = []
+    advance = 0.0
+
+    if charParents:
+        origin = om.MFnTransform(_getDagPath(charParents[0])).translation(om.MSpace.kWorld)
+
+        if len(charParents) > 1:
+            advance = om.MFnTransform(_getDagPath(charParents[1])).translation(om.MSpace.kWorld).x - origin.x
+
+        for curveShape in cmds.listRelatives(charParents[0], allDescendents=True, type='nurbsCurve', fullPath=True) or []:
+            curveFn = om.MFnNurbsCurve(_getDagPath(curveShape))
+            points = [[p.x - origin.x, p.y - origin.y, p.z - origin.z] for p in curveFn.cvPositions(om.MSpace.kWorld)]
+
+            shapes.append({
+                'points': points,
+                'knots': list(curveFn.knots()),
+                'degree': curveFn.degree,
+                'periodic': curveFn.form == om.MFnNurbsCurve.kPeriodic,
+            })
+
+    cmds.delete(result)
+
+    if not advance and shapes:
+        xs = [p[0] for shape in shapes for p in shape['points']]
+        advance = max(xs) - min(xs)
+
+    return {'advance': advance, 'shapes': shapes}
+
+def getGlyph(font: str, char: str) -> dict:
+    glyphs = _load()
+    fontGlyphs = glyphs.setdefault(font, {})
+
+    if char not in fontGlyphs:
+        fontGlyphs[char] = _extractGlyph(font, char)
+        _save()
+
+    return fontGlyphs[char]
+
+def layoutText(text: str, font='Arial') -> list[dict]:
+    """글리프를 advance 만큼 옆으로 옮겨 이어 붙이고 실제 커브 범위의 중심을 원점에 맞춘 shape 리스트를 반환한다."""
+    shapes = []
+    cursor = 0.0
+
+    for char in text:
+        glyph = getGlyph(font, char)
+
+        for shape in glyph['shapes']:
+            shapes.append({
+                'points': np.asarray(shape['points'], dtype=float) + (cursor, 0, 0),
+                'knots': np.asarray(shape['knots'], dtype=float),
+                'degree': shape['degree'],
+                'periodic': shape['periodic'],
+            })
+
+        advance = glyph['advance']
+        if not glyph['shapes'] and not advance and char != BLANK_ADVANCE_CHAR:
+            advance = getGlyph(font, BLANK_ADVANCE_CHAR)['advance']
+
+        cursor += advance
+
+    if shapes:
+        minPoint, maxPoint = curveGeometry.boundingBox(shapes)
+        center = (minPoint + maxPoint) / 2
+        center[2] = 0
+
+        for shape in shapes:
+            shape['points'] -= center
+
+    return shapes
+
+def clear(deleteFile=False):
+    global _glyphs
+    _glyphs = None
+
+    if deleteFile and os.path.exists(getCachePath()):
+        os.remove(getCachePath())
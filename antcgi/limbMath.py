@@ -0,0 +1,81 @@
+#-----------------------------------------
+# Limb math
+# 다리(limb) 빌드에 필요한 계산을 numpy 로 처리한다. (maya 없이 사용 가능)
+# 행렬은 maya 와 같은 row-major (행 = 축, 마지막 행 = 위치) 형식이다.
+#-----------------------------------------
+
+import numpy as np
+
+EPSILON = 1e-8
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    lengths = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return np.divide(vectors, lengths, out=np.zeros_like(vectors), where=lengths > EPSILON)
+
+def aimMatrices(aimVectors, upVector=(0, 1, 0), positions=None) -> np.ndarray:
+    """
+    x 축이 aimVectors, y 축이 upVector 를 향하는 (N, 4, 4) 행렬 (aimVector=(1,0,0), upVector=(0,1,0) 인 constraint 와 동일)
+    aimVector 가 upVector 와 평행하면 aimVector 와 가장 덜 평행한 world 축을 up 으로 쓴다.
+    """
+    xAxes = _normalize(np.asarray(aimVectors, dtype=float))
+    upVectors = np.array(np.broadcast_to(_normalize(np.asarray(upVector, dtype=float)), xAxes.shape))
+
+    parallel = np.linalg.norm(np.cross(xAxes, upVectors), axis=-1) <= 1e-6
+    fallbackUps = np.eye(3)[np.argmin(np.abs(xAxes), axis=-1)]
+    upVectors[parallel] = fallbackUps[parallel]
+
+    zAxes = _normalize(np.cross(xAxes, upVectors))
+    yAxes = np.cross(zAxes, xAxes)
+
+    matrices = np.zeros(xAxes.shape[:-1] + (4, 4))
+    matrices[..., 0, :3] = xAxes
+    matrices[..., 1, :3] = yAxes
+    matrices[..., 2, :3] = zAxes
+    matrices[..., 3, 3] = 1
+
+    if positions is not None:
+        matrices[..., 3, :3] = positions
+
+    return matrices
+
+def solvePoleVectors(jointPositions, distance=0.0, upVector=(0, 1, 0)) -> np.ndarray:
+    """
+    (N, 3, 3) 형태의 세 관절(시작, 무릎, 끝) world 위치로 pole vector 행렬 (N, 4, 4) 을 구한다.
+    x 축은 세 관절이 이루는 평면의 normal, 위치는 무릎에서 무릎 방향으로 distance 만큼 떨어진 곳이다.
+    세 관절이 한 직선 위에 있으면 평면이 정해지지 않으므로 ValueError 를 발생시킨다.
+    """
+    jointPositions = np.asarray(jointPositions, dtype=float).reshape(-1, 3, 3)
+    start, knee, end = jointPositions[:, 0], jointPositions[:, 1], jointPositions[:, 2]
+
+    # polyCreateFacet 과 같은 winding 의 면 normal
+    normals = np.cross(knee - start, end - start)
+
+    # 구간 길이에 대한 상대값으로 판단해서 캐릭터 크기와 관계없이 같은 기준을 쓴다
+    scales = np.linalg.norm(knee - start, axis=1) * np.linalg.norm(end - start, axis=1)
+    collinear = np.linalg.norm(normals, axis=1) <= EPSILON * np.maximum(scales, 1.0)
+    if collinear.any():
+        raise ValueError(f'Joints are collinear, cannot solve pole vector for limb index {np.flatnonzero(collinear).tolist()}')
+
+    # 시작-끝 선분에서 무릎으로 향하는 방향
+    chain = end - start
+    chainLengthSq = np.einsum('ij,ij->i', chain, chain)
+    t = np.divide(np.einsum('ij,ij->i', knee - start, chain), chainLengthSq, out=np.zeros_like(chainLengthSq), where=chainLengthSq > EPSILON)
+    kneeDirections = _normalize(knee - (start + t[:, None] * chain))
+
+    positions = knee + kneeDirections * np.asarray(distance, dtype=float).reshape(-1, 1)
+
+    return aimMatrices(normals, upVector, positions)
+
+def chainMetrics(worldMatrices) -> dict:
+    """
+    조인트 체인 world matrix (N, 16) 로 위치, 구간 길이, rest length (구간 길이 합), 구간 중점을 구한다.
+    """
+    positions = np.asarray(worldMatrices, dtype=float).reshape(-1, 4, 4)[:, 3, :3]
+    segmentLengths = np.linalg.norm(np.diff(positions, axis=0), axis=1)
+
+    return {
+        'positions': positions,
+        'segmentLengths': segmentLengths,
+        'restLength': float(segmentLengths.sum()),
+        'midpoints': (positions[:-1] + positions[1:]) * 0.5,
+    }
@@ -1,29 +1,141 @@
+#-----------------------------------------
+# Scene lock
+# 씬의 transform 을 한 번만 순회하면서 이름 패턴 테이블로 분류하고
+# 매칭된 노드(조인트 제외)의 채널 lock / keyable 상태를 MPlug 로 한 번에 바꾼다.
+# 이미 원하는 상태인 plug 는 건드리지 않는다.
+#
+# plug 마다 이전 lock / keyable 상태를 저장해서 apiUndo 로 undo 큐에 기록하므로 Ctrl+Z 한 번에 이전 상태로 돌아간다.
+# (unlockScene() 은 이전 상태와 관계없이 모두 unlock / keyable 로 바꾼다)
+#-----------------------------------------
+
+import sys
+import maya.mel as mel
+
+modulePath = mel.eval('getenv "MAYA_MY_SCRIPT_PATH"')
+if modulePath not in sys.path:
+    sys.path.append(modulePath)
+
+import re
+import fnmatch
+import importlib
+from collections import Counter
 import maya.cmds as cmds
+import maya.api.OpenMaya as om
+import apiUndo
+
+importlib.reload(apiUndo)
 
 locked = True
 keyable = False
 
 searchList = ["*_grp", "*_ikHandle", "*_offset", "*_rot", "*Constraint1", "*Constraint", "*_aim", "*_clstrtop", "*_rev", "*_loc", "*_cluster", "*_cluster*", "*_driver"]
 
-for search in searchList:
-    selList = cmds.ls(search, transforms=True, showType=True)
+channels = ['tx', 'ty', 'tz', 'rx', 'ry', 'rz', 'sx', 'sy', 'sz', 'v']
+
+def compilePatterns(patterns: list[str]) -> re.Pattern:
+    """패턴들을 정규식 하나로 합친다. 매칭된 그룹 이름 p{index} 로 어떤 패턴인지 알 수 있다."""
+    return re.compile('|'.join(f'(?P<p{i}>{fnmatch.translate(pattern)})' for i, pattern in enumerate(patterns)))
+
+def classifyName(name: str, compiled: re.Pattern, patterns: list[str]) -> str | None:
+    # cmds.ls 의 * 처럼 namespace 는 넘지 않는다
+    if ':' in name:
+        return None
+
+    match = compiled.match(name)
+    return patterns[int(match.lastgroup[1:])] if match else None
+
+def collectNodes(patterns: list[str] = searchList) -> list[tuple[str, str, om.MObject]]:
+    """씬의 transform 을 한 번 순회해서 (이름, 매칭된 패턴, MObject) 목록을 만든다. 인스턴스는 한 번만 포함한다."""
+    compiled = compilePatterns(patterns)
 
-    for i in range(0, len(selList), 2):
-        sel, nodeType = selList[i], selList[i+1]
+    nodes = []
+    visited = set()
 
-        if nodeType == 'joint':
+    dagIter = om.MItDag(om.MItDag.kDepthFirst, om.MFn.kTransform)
+    while not dagIter.isDone():
+        node = dagIter.currentItem()
+        dagIter.next()
+
+        if node.hasFn(om.MFn.kJoint):
+            continue
+
+        handle = om.MObjectHandle(node)
+        if handle.hashCode() in visited:
             continue
+        visited.add(handle.hashCode())
+
+        name = om.MFnDependencyNode(node).name()
+        pattern = classifyName(name, compiled, patterns)
+
+        if pattern:
+            nodes.append((name, pattern, node))
+
+    return nodes
+
+def _setPlugState(plug: om.MPlug, locked: bool, keyable: bool):
+    # locked plug 의 keyable 을 바꿀 수 있도록 unlock 먼저
+    plug.isLocked = False
+    plug.isKeyable = keyable
+    plug.isLocked = locked
+
+def applyLockState(nodes: list[tuple[str, str, om.MObject]], locked: bool, keyable: bool, channels: list[str] = channels, dryRun=False) -> dict:
+    """nodes 의 channels 를 locked / keyable 로 바꾸고 바뀐 (dryRun 이면 바뀔) plug 수를 반환한다."""
+    changedPlugs = []
+
+    for name, pattern, node in nodes:
+        fnNode = om.MFnDependencyNode(node)
+
+        for channel in channels:
+            plug = fnNode.findPlug(channel, False)
+
+            if plug.isLocked != locked or plug.isKeyable != keyable:
+                changedPlugs.append(plug)
+
+    if not dryRun and changedPlugs:
+        previousStates = [(plug.isLocked, plug.isKeyable) for plug in changedPlugs]
+
+        def undo():
+            for plug, (plugLocked, plugKeyable) in zip(changedPlugs, previousStates):
+                _setPlugState(plug, plugLocked, plugKeyable)
+
+        def redo():
+            for plug in changedPlugs:
+                _setPlugState(plug, locked, keyable)
+
+        cmds.undoInfo(openChunk=True, chunkName='applyLockState')
+
+        try:
+            redo()
+            apiUndo.commit(undo, redo)
+        finally:
+            cmds.undoInfo(closeChunk=True)
+
+    return {
+        'nodes': len(nodes),
+        'plugs': len(changedPlugs),
+        'patterns': dict(Counter(pattern for name, pattern, node in nodes)),
+        'changed': sorted({plug.name() for plug in changedPlugs}) if dryRun else [],
+    }
+
+def printReport(report: dict, dryRun=False):
+    for pattern, count in sorted(report['patterns'].items()):
+        print(f'  {pattern}: {count}')
+
+    for plugName in report['changed']:
+        print(f'  {plugName}')
+
+    print(f"{'[dry run] ' if dryRun else ''}{report['nodes']} nodes, {report['plugs']} plugs {'to change' if dryRun else 'changed'}")
+
+def lockScene(locked=True, keyable=False, patterns: list[str] = searchList, dryRun=False, verbose=True) -> dict:
+    nodes = collectNodes(patterns)
+    report = applyLockState(nodes, locked, keyable, dryRun=dryRun)
 
-        cmds.setAttr((sel + ".tx"), k=keyable, l=locked)
-        cmds.setAttr((sel + ".ty"), k=keyable, l=locked)
-        cmds.setAttr((sel + ".tz"), k=keyable, l=locked)
+    if verbose:
+        printReport(report, dryRun)
 
-        cmds.setAttr((sel + ".rx"), k=keyable, l=locked)
-        cmds.setAttr((sel + ".ry"), k=keyable, l=locked)
-        cmds.setAttr((sel + ".rz"), k=keyable, l=locked)
+    return report
 
-        cmds.setAttr((sel + ".sx"), k=keyable, l=locked)
-        cmds.setAttr((sel + ".sy"), k=keyable, l=locked)
-        cmds.setAttr((sel + ".sz"), k=keyable, l=locked)
+def unlockScene(patterns: list[str] = searchList, dryRun=False, verbose=True) -> dict:
+    return lockScene(locked=False, keyable=True, patterns=patterns, dryRun=dryRun, verbose=verbose)
 
-        cmds.setAttr((sel + ".v"), k=keyable, l=locked)
+lockScene(locked, keyable)
@@ -0,0 +1,192 @@
+#-----------------------------------------
+# Build plan executor
+# buildPlan 으로 만든 op 목록을 하나의 undo chunk 안에서 실행한다.
+# 연속된 utility 노드 생성 / connectAttr / 숫자 setAttr 는 MDGModifier 에 모아서 한 번에 적용하고
+# 나머지 명령(joint, ikHandle, constraint 등)은 순서대로 cmds 로 실행한다.
+# MDGModifier 는 apiUndo 로 같은 undo chunk 에 기록되므로 Ctrl+Z 한 번에 cmds 명령과 함께 되돌려진다.
+#-----------------------------------------
+
+import json
+import maya.cmds as cmds
+import maya.api.OpenMaya as om
+import apiUndo
+import buildPlan
+
+# 섹션별 fingerprint 와 만든 노드를 저장하는 string 어트리뷰트
+BUILD_RECORD_ATTR = 'buildRecord'
+
+def _getPlug(plugName: str) -> om.MPlug:
+    selList = om.MSelectionList()
+    selList.add(plugName)
+    return selList.getPlug(0)
+
+def _setPlugValue(modifier: om.MDGModifier, plug: om.MPlug, value):
+    attribute = plug.attribute()
+
+    if attribute.hasFn(om.MFn.kEnumAttribute) or isinstance(value, bool):
+        modifier.newPlugValueInt(plug, int(value))
+    elif attribute.hasFn(om.MFn.kNumericAttribute) and om.MFnNumericAttribute(attribute).numericType() in (om.MFnNumericData.kBoolean, om.MFnNumericData.kShort, om.MFnNumericData.kInt, om.MFnNumericData.kLong, om.MFnNumericData.kByte, om.MFnNumericData.kChar):
+        modifier.newPlugValueInt(plug, int(value))
+    elif attribute.hasFn(om.MFn.kUnitAttribute) and om.MFnUnitAttribute(attribute).unitType() == om.MFnUnitAttribute.kAngle:
+        modifier.newPlugValueMAngle(plug, om.MAngle(value, om.MAngle.kDegrees))
+    else:
+        modifier.newPlugValueDouble(plug, float(value))
+
+def _isModifierOp(op: dict) -> bool:
+    command, args, kwargs = op['command'], op['args'], op['kwargs']
+
+    if command == 'shadingNode':
+        return kwargs.get('asUtility', False) and 'name' in kwargs and set(kwargs) <= {'asUtility', 'name'}
+
+    if command == 'createNode':
+        return 'name' in kwargs and set(kwargs) <= {'name'}
+
+    if command == 'connectAttr':
+        return len(args) == 2 and set(kwargs) <= {'force'}
+
+    if command == 'setAttr':
+        return len(args) == 2 and not kwargs and isinstance(args[1], (int, float))
+
+    return False
+
+def _isCreateOp(op: dict) -> bool:
+    return op['command'] in ('shadingNode', 'createNode')
+
+def _applyModifierOps(ops: list[dict]) -> dict:
+    """
+    같은 종류끼리 모인 op 묶음을 MDGModifier 하나로 적용한다.
+    뒤의 op 는 계획된 이름으로 노드를 찾으므로 이름이 겹쳐 Maya 가 다른 이름을 붙이면 되돌리고 RuntimeError 를 발생시킨다.
+    """
+    modifier = om.MDGModifier()
+    created = {}
+
+    for op in ops:
+        command, args, kwargs = op['command'], op['args'], op['kwargs']
+
+        if command in ('shadingNode', 'createNode'):
+            node = modifier.createNode(args[0])
+            modifier.renameNode(node, kwargs['name'])
+            created[kwargs['name']] = node
+
+        elif command == 'connectAttr':
+            source, destination = _getPlug(args[0]), _getPlug(args[1])
+
+            if kwargs.get('force') and destination.isDestination:
+                modifier.disconnect(destination.source(), destination)
+
+            modifier.connect(source, destination)
+
+        elif command == 'setAttr':
+            _setPlugValue(modifier, _getPlug(args[0]), args[1])
+
+    modifier.doIt()
+
+    createdNames = {name: om.MFnDependencyNode(node).name() for name, node in created.items()}
+    renamed = {name: actual for name, actual in createdNames.items() if name != actual}
+
+    if renamed:
+        modifier.undoIt()
+        raise RuntimeError(f'Node names already exist in the scene: {renamed}')
+
+    apiUndo.commitModifier(modifier)
+
+    return createdNames
+
+def execute(plan: list, chunkName='buildPlan', rollbackOnError=False) -> dict:
+    """
+    plan 을 실행하고 {명령 결과 이름} 을 반환한다.
+    노드 생성은 생성 op 끼리, 연결/값 설정은 그 다음 op 끼리 묶어서 modifier 로 처리한다.
+    rollbackOnError 면 중간에 실패했을 때 그때까지 실행한 chunk 를 undo 해서 반쯤 만들어진 상태를 남기지 않는다.
+    """
+    if not rollbackOnError:
+        return _execute(plan, chunkName)
+
+    try:
+        return _execute(plan, chunkName)
+    except:
+        # chunk 에 기록된 것이 없으면 이전 작업을 되돌리지 않도록 이름을 확인한다
+        if cmds.undoInfo(query=True, undoName=True) == chunkName:
+            cmds.undo()
+        raise
+
+def _execute(plan: list, chunkName: str) -> dict:
+    cmds.undoInfo(openChunk=True, chunkName=chunkName)
+
+    try:
+        created = {}
+        batch = []
+
+        def flush():
+            if batch:
+                created.update(_applyModifierOps(batch))
+                batch.clear()
+
+        for op in plan:
+            if _isModifierOp(op):
+                # 노드 생성과 그 노드를 사용하는 연결은 다른 doIt 으로 나눠서 이름으로 찾을 수 있게 한다
+                if batch and _isCreateOp(op) != _isCreateOp(batch[-1]):
+                    flush()
+
+                batch.append(op)
+                continue
+
+            flush()
+            result = getattr(cmds, op['command'])(*op['args'], **op['kwargs'])
+
+            if 'name' in op['kwargs'] and result:
+                created[op['kwargs']['name']] = result[0] if isinstance(result, list) else result
+
+        flush()
+
+        return created
+    finally:
+        cmds.undoInfo(closeChunk=True)
+
+def readBuildRecord(node: str) -> dict:
+    """node 에 저장된 빌드 기록 {'sections': {섹션: {'fingerprint', 'nodes'}}}"""
+    if not cmds.objExists(f'{node}.{BUILD_RECORD_ATTR}'):
+        return {}
+
+    return json.loads(cmds.getAttr(f'{node}.{BUILD_RECORD_ATTR}') or '{}')
+
+def writeBuildRecord(node: str, record: dict):
+    if not cmds.objExists(f'{node}.{BUILD_RECORD_ATTR}'):
+        cmds.addAttr(node, longName=BUILD_RECORD_ATTR, dataType='string')
+
+    cmds.setAttr(f'{node}.{BUILD_RECORD_ATTR}', json.dumps(record), type='string')
+
+def _deleteNodes(nodes: list[str]):
+    # 부모와 함께 이미 지워진 노드는 건너뛴다
+    for node in reversed(nodes):
+        if cmds.objExists(node):
+            cmds.delete(node)
+
+def executeSections(sections: dict[str, list], fingerprints: dict[str, str], recordNode: str, chunkName='buildPlan') -> list[str]:
+    """
+    recordNode 에 저장된 fingerprint 와 다른 섹션만 다시 만들고 다시 만든 섹션 목록을 반환한다.
+    바뀐 섹션이 만들었던 노드는 뒤 섹션부터 지운 뒤 sections 순서대로 다시 실행한다.
+    빌드가 끝나면 recordNode (보통 첫 섹션이 만든 그룹) 에 새 기록을 저장한다.
+    """
+    record = readBuildRecord(recordNode) if cmds.objExists(recordNode) else {}
+    dirtySections = buildPlan.getDirtySections(record, fingerprints)
+
+    if not dirtySections:
+        return []
+
+    cmds.undoInfo(openChunk=True, chunkName=chunkName)
+
+    try:
+        recordSections = record.setdefault('sections', {})
+
+        for section in reversed(dirtySections):
+            _deleteNodes(recordSections.pop(section, {}).get('nodes', []))
+
+        for section in dirtySections:
+            created = execute(sections[section], chunkName=f'{chunkName}_{section}')
+            recordSections[section] = {'fingerprint': fingerprints[section], 'nodes': list(created.values())}
+
+        writeBuildRecord(recordNode, record)
+    finally:
+        cmds.undoInfo(closeChunk=True)
+
+    return dirtySections
@@ -6,12 +6,15 @@ if modulePath not in sys.path:
     sys.path.append(modulePath)
 
 import importlib
+import numpy as np
 import maya.cmds as cmds
 import utils
 import curveGenerator
+import limbMath
 
 importlib.reload(utils)
 importlib.reload(curveGenerator)
+importlib.reload(limbMath)
 
 ############# Constants
 COLOR_INDEX_RED = 13
@@ -33,14 +36,17 @@ def getCtrlColorByName(name):
 def setControllerColor(ctrlName: str):
     utils.setShapeColor(ctrlName, getCtrlColorByName(ctrlName))
 
-def getLegJoints():
-    selection = cmds.ls(selection=True, type='joint')
+def getLegJoints(root: str | None = None):
+    if root is None:
+        selection = cmds.ls(selection=True, type='joint')
 
-    if len(selection) != 1:
-        raise Exception("Please select a root joint!")
+        if len(selection) != 1:
+            raise Exception("Please select a root joint!")
+
+        root = selection[0]
         
-    joints = cmds.listRelatives(selection[0], type='joint', allDescendents=True)[-3:]
-    joints.append(selection[0])
+    joints = cmds.listRelatives(root, type='joint', allDescendents=True)[-3:]
+    joints.append(root)
     joints.reverse()
 
     return joints
@@ -66,7 +72,11 @@ def createFKControllers(legJoints: list[str], modelRelativeHorizontalAxes: str,
     
     return rootObjects
 
-def createIKControllers(legJoints: list[str], isRear: bool, scaleMulti=1) -> list[str]:
+def createIKControllers(legJoints: list[str], isRear: bool, scaleMulti=1, poleVectorLimbs: list | None = None) -> list[str]:
+    """
+    poleVectorLimbs 를 주면 pole vector 위치를 바로 계산하지 않고 (세 관절, offset 그룹) 을 추가만 한다.
+    여러 다리를 만든 뒤 positionPoleVectorCtrls(poleVectorLimbs) 로 한 번에 계산한다.
+    """
     rootObjects = []
 
     direction = legJoints[0][0]
@@ -113,24 +123,32 @@ def createIKControllers(legJoints: list[str], isRear: bool, scaleMulti=1) -> lis
     cmds.xform(pvCtrlOffsetGrp, centerPivots=True)
     cmds.makeIdentity(pvCtrl, apply=True, rotate=True)
 
-    positionPoleVectorCtrl(legJoints[0:3], pvCtrlOffsetGrp)
+    if poleVectorLimbs is None:
+        positionPoleVectorCtrl(legJoints[0:3], pvCtrlOffsetGrp)
+    else:
+        poleVectorLimbs.append((legJoints[0:3], pvCtrlOffsetGrp))
 
     rootObjects.append(pvCtrlOffsetGrp)
 
     return rootObjects
 
-def positionPoleVectorCtrl(joints: list[str], ctrlOffsetGrp: str):
+def positionPoleVectorCtrl(joints: list[str], ctrlOffsetGrp: str, distance=0.0):
     if len(joints) != 3:
         raise Exception("Error occured during get pole vector position")
-    
-    cmds.matchTransform(ctrlOffsetGrp, joints[1], position=True)
 
-    positions = [cmds.xform(jnt, query=True, worldSpace=True, translation=True) for jnt in joints]
-    tempTriangle = cmds.polyCreateFacet(p=positions, name=f'{ctrlOffsetGrp}_pv_temp_tri')[0]
-    tempConstraint = cmds.normalConstraint(f'{tempTriangle}.vtx[1]', ctrlOffsetGrp)[0]
+    positionPoleVectorCtrls([(joints, ctrlOffsetGrp)], distance)
 
-    cmds.delete(tempConstraint, tempTriangle)
+def positionPoleVectorCtrls(limbs: list[tuple[list[str], str]], distance=0.0):
+    """(세 관절, offset 그룹) 목록의 pole vector 행렬을 한 번에 계산해서 offset 그룹에 바로 넣는다."""
+    joints = [joint for limbJoints, _ in limbs for joint in limbJoints]
+    positions = np.array(utils.getWorldPositions(joints)).reshape(-1, 3, 3)
+    matrices = limbMath.solvePoleVectors(positions, distance)
 
+    for (_, ctrlOffsetGrp), matrix in zip(limbs, matrices):
+        # centerPivots 로 옮긴 피벗이 목표 위치에 오도록 translate 를 맞춘다
+        pivot = np.array(cmds.xform(ctrlOffsetGrp, query=True, objectSpace=True, rotatePivot=True))
+        matrix[3, :3] -= pivot @ matrix[:3, :3]
+        cmds.xform(ctrlOffsetGrp, worldSpace=True, matrix=matrix.flatten().tolist())
 
 def createFKIKSwitchController(legJoints: list[str], fkRootObjs: list[str], ikRootObjs: list[str], isRear: bool, scaleMulti=1):
     direction = legJoints[0][0]
@@ -258,15 +276,31 @@ def createRootController(scaleMulti: int) -> str:
 
 def createControllers(modelRelativeHorizontalAxes: str, isRear: bool, scaleMulti=1):
     legJoints = getLegJoints()
+    createLegsControllers([(legJoints, isRear)], modelRelativeHorizontalAxes, scaleMulti)
 
+def createLegsControllers(legs: list[tuple[list[str], bool]], modelRelativeHorizontalAxes: str, scaleMulti=1):
+    """
+    (다리 조인트, isRear) 목록의 컨트롤러를 만든다.
+    모든 다리의 pole vector 는 마지막에 positionPoleVectorCtrls 한 번으로 계산한다.
+    """
     rootGroup = ROOT_CTRL_NAME
     if not cmds.ls(rootGroup, type='transform'):
         rootGroup = createRootController(scaleMulti)
 
-    fkRoots = createFKControllers(legJoints, modelRelativeHorizontalAxes, scaleMulti)
-    ikRoots = createIKControllers(legJoints, isRear, scaleMulti)
-    switchRoots = createFKIKSwitchController(legJoints, fkRoots, ikRoots, isRear, scaleMulti)
+    poleVectorLimbs = []
+
+    for legJoints, isRear in legs:
+        fkRoots = createFKControllers(legJoints, modelRelativeHorizontalAxes, scaleMulti)
+        ikRoots = createIKControllers(legJoints, isRear, scaleMulti, poleVectorLimbs)
+        switchRoots = createFKIKSwitchController(legJoints, fkRoots, ikRoots, isRear, scaleMulti)
+
+        cmds.parent(*fkRoots, *ikRoots, *switchRoots, rootGroup)
+
+    positionPoleVectorCtrls(poleVectorLimbs)
 
-    cmds.parent(*fkRoots, *ikRoots, *switchRoots, rootGroup)
+def createQuadrupedControllers(frontRoots: list[str], rearRoots: list[str], modelRelativeHorizontalAxes: str, scaleMulti=1):
+    """앞다리 / 뒷다리 root 조인트들로 네 다리의 컨트롤러를 한 번에 만든다."""
+    legs = [(getLegJoints(root), False) for root in frontRoots] + [(getLegJoints(root), True) for root in rearRoots]
+    createLegsControllers(legs, modelRelativeHorizontalAxes, scaleMulti)
 
-createControllers('z', False)
\ No newline at end of file
+createControllers('z', False)
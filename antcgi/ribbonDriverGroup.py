@@ -1,5 +1,11 @@
 #-----------------------------------------
 # antcgi 리본 툴 사용 시 Driver Group 옵션이 제대로 작동하지 않아 이를 대체하기 위한 스크립트
+# (offset 그룹, driver 조인트) 쌍마다 offset 그룹의 부모 아래에 driver 그룹을 만들어
+# 조인트의 위치 / 회전에 맞추고 offset 그룹을 그 아래로 옮긴다. (world transform 유지)
+#
+# 사용법: offset 그룹들을 선택하고 마지막에 driver 조인트를 선택한 뒤 실행
+# 행렬은 한 번에 읽고, 생성 / parent / 값 설정은 MDagModifier 하나로 적용한 뒤 apiUndo 로 undo 큐에 기록한다.
+# offset 그룹에 pivot 이 있으면 pivot 은 그대로 두고 translate 로 보정한다.
 #-----------------------------------------
 
 import sys
@@ -9,14 +15,133 @@ modulePath = mel.eval('getenv "MAYA_MY_SCRIPT_PATH"')
 if modulePath not in sys.path:
     sys.path.append(modulePath)
 
+import importlib
 import maya.cmds as cmds
+import maya.api.OpenMaya as om
+import apiUndo
 
-offsetGrps = cmds.ls(selection=True)
-joint = 'jaw_base' ########### NEED TO UPDATE
+importlib.reload(apiUndo)
 
-parent = cmds.listRelatives(offsetGrps[0], parent=True)[0]
+def _getDagPaths(objects: list[str]) -> list[om.MDagPath]:
+    selList = om.MSelectionList()
+    for object in objects:
+        selList.add(object)
 
-for offsetGrp in offsetGrps:
-    driverGrp = cmds.group(empty=True, name=offsetGrp.replace('_offset', '_driver'), parent=parent)
-    cmds.matchTransform(driverGrp, joint, position=True, rotation=True)
-    cmds.parent(offsetGrp, driverGrp)
\ No newline at end of file
+    return [selList.getDagPath(i) for i in range(selList.length())]
+
+def _getPivotOffset(node: om.MObject, rotation: om.MEulerRotation, scale, shear) -> om.MVector:
+    """node 의 pivot 과 rotation / scale / shear 로 생기는 이동량. (pivot 이 0 이면 0)"""
+    fnTransform = om.MFnTransform(node)
+
+    pivotMatrix = om.MTransformationMatrix()
+    pivotMatrix.setScale(scale, om.MSpace.kTransform)
+    pivotMatrix.setShear(shear, om.MSpace.kTransform)
+    pivotMatrix.setRotation(rotation)
+    pivotMatrix.setScalePivot(fnTransform.scalePivot(om.MSpace.kTransform), om.MSpace.kTransform, False)
+    pivotMatrix.setScalePivotTranslation(fnTransform.scalePivotTranslation(om.MSpace.kTransform), om.MSpace.kTransform)
+    pivotMatrix.setRotatePivot(fnTransform.rotatePivot(om.MSpace.kTransform), om.MSpace.kTransform, False)
+    pivotMatrix.setRotatePivotTranslation(fnTransform.rotatePivotTranslation(om.MSpace.kTransform), om.MSpace.kTransform)
+
+    # translate 가 0 인 행렬의 이동 성분
+    matrix = pivotMatrix.asMatrix()
+    return om.MVector(matrix[12], matrix[13], matrix[14])
+
+def _setTransformPlugs(modifier: om.MDGModifier, node: om.MObject, matrix: om.MMatrix, scale=True):
+    """matrix 를 node 의 rotateOrder 로 분해해서 translate / rotate (/ scale / shear) 값을 modifier 에 추가한다."""
+    fnNode = om.MFnDependencyNode(node)
+    transformMatrix = om.MTransformationMatrix(matrix)
+
+    # rotateOrder 어트리뷰트 (xyz = 0) 와 MTransformationMatrix 의 순서 (kXYZ = 1)
+    transformMatrix.reorderRotation(fnNode.findPlug('rotateOrder', False).asInt() + 1)
+
+    rotation = transformMatrix.rotation()
+    scaleValue = transformMatrix.scale(om.MSpace.kTransform) if scale else [1.0, 1.0, 1.0]
+    shearValue = transformMatrix.shear(om.MSpace.kTransform) if scale else [0.0, 0.0, 0.0]
+
+    # pivot 은 3x3 부분에는 영향이 없고 이동량만 바꾸므로 translate 에서 빼준다
+    values = {
+        'translate': transformMatrix.translation(om.MSpace.kTransform) - _getPivotOffset(node, rotation, scaleValue, shearValue),
+        'rotate': rotation,
+    }
+
+    if scale:
+        values['scale'] = scaleValue
+        values['shear'] = shearValue
+
+    for attr, value in values.items():
+        plug = fnNode.findPlug(attr, False)
+
+        for i in range(3):
+            if attr == 'rotate':
+                modifier.newPlugValueMAngle(plug.child(i), om.MAngle(value[i]))
+            else:
+                modifier.newPlugValueDouble(plug.child(i), value[i])
+
+def createDriverGroups(pairs: list[tuple[str, str]]) -> list[str]:
+    """
+    (offset 그룹, driver 조인트) 쌍마다 driver 그룹을 만들고 만든 이름을 반환한다.
+    driver 그룹은 offset 그룹의 현재 부모 아래에 조인트의 world 위치 / 회전 (scale 제외) 으로 배치된다.
+    """
+    offsetPaths = _getDagPaths([offsetGrp for offsetGrp, joint in pairs])
+
+    # rotateAxis 는 rotate 와 3x3 부분에서 섞이므로 분해할 수 없다
+    rotateAxisGrps = [offsetPath.partialPathName() for offsetPath in offsetPaths
+                      if not om.MFnTransform(offsetPath).rotateOrientation(om.MSpace.kTransform).isEquivalent(om.MQuaternion())]
+    if rotateAxisGrps:
+        raise ValueError(f'Offset groups with a rotate axis are not supported: {rotateAxisGrps}')
+
+    # 같은 조인트는 한 번만 읽는다
+    joints = list(dict.fromkeys(joint for offsetGrp, joint in pairs))
+    jointMatrices = {}
+    for joint, jointPath in zip(joints, _getDagPaths(joints)):
+        jointMatrix = om.MTransformationMatrix(jointPath.inclusiveMatrix())
+
+        driverMatrix = om.MTransformationMatrix()
+        driverMatrix.setTranslation(jointMatrix.translation(om.MSpace.kWorld), om.MSpace.kWorld)
+        driverMatrix.setRotation(jointMatrix.rotation(asQuaternion=True))
+        jointMatrices[joint] = driverMatrix.asMatrix()
+
+    modifier = om.MDagModifier()
+    drivers = []
+
+    for (offsetGrp, joint), offsetPath in zip(pairs, offsetPaths):
+        parentMatrix = offsetPath.exclusiveMatrix()
+        parentPath = om.MDagPath(offsetPath)
+        parentPath.pop()
+
+        driverNode = modifier.createNode('transform', parentPath.node() if parentPath.length() else om.MObject.kNullObj)
+        modifier.renameNode(driverNode, offsetPath.partialPathName().split('|')[-1].replace('_offset', '_driver'))
+        modifier.reparentNode(offsetPath.node(), driverNode)
+
+        drivers.append((driverNode, offsetPath.node(), jointMatrices[joint] * parentMatrix.inverse(), parentMatrix, offsetPath.inclusiveMatrix()))
+
+    modifier.doIt()
+
+    for driverNode, offsetNode, targetMatrix, parentMatrix, offsetWorldMatrix in drivers:
+        # driver 그룹의 scale 은 1 이므로 translate / rotate 만 쓴 실제 world matrix 로 offset 의 local 을 구한다
+        target = om.MTransformationMatrix(targetMatrix)
+        driverLocal = om.MTransformationMatrix()
+        driverLocal.setTranslation(target.translation(om.MSpace.kTransform), om.MSpace.kTransform)
+        driverLocal.setRotation(target.rotation(asQuaternion=True))
+        driverLocalMatrix = driverLocal.asMatrix()
+        driverWorldMatrix = driverLocalMatrix * parentMatrix
+
+        _setTransformPlugs(modifier, driverNode, driverLocalMatrix, scale=False)
+        _setTransformPlugs(modifier, offsetNode, offsetWorldMatrix * driverWorldMatrix.inverse())
+
+    modifier.doIt()
+    apiUndo.commitModifier(modifier)
+
+    return [om.MFnDependencyNode(driverNode).name() for driverNode, *_ in drivers]
+
+def createDriverGroupsFromSelection() -> list[str]:
+    """선택한 offset 그룹들을 마지막에 선택한 driver 조인트에 맞춘다."""
+    selection = cmds.ls(selection=True)
+
+    if len(selection) < 2 or cmds.nodeType(selection[-1]) != 'joint':
+        cmds.error('Please select offset groups and then the driver joint last.')
+
+    offsetGrps, joint = selection[:-1], selection[-1]
+    return createDriverGroups([(offsetGrp, joint) for offsetGrp in offsetGrps])
+
+createDriverGroupsFromSelection()
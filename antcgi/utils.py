@@ -1,4 +1,6 @@
 import maya.cmds as cmds
+import maya.api.OpenMaya as om
+import curveGeometry
 
 def getJointDisplayRadius(jointName):
    radius = cmds.getAttr(f"{jointName}.radius")
@@ -14,16 +16,190 @@ def overrideDisplayTypeToReference(object: str):
     cmds.setAttr(f"{object}.overrideEnabled", True)
     cmds.setAttr(f"{object}.overrideDisplayType", 2)
 
+#-----------------------------------------
+# World bounding box cache
+# 오브젝트별 bbox 를 한 번만 계산해서 width/height/depth/center 를 같은 결과로 돌려준다.
+# 노드(또는 하위 shape)가 dirty 되거나 invalidateBoundingBoxes() 로 generation 이 바뀌면 다시 계산한다.
+# 노드가 삭제되면 캐시와 콜백을 함께 지운다.
+# 커브는 CV 가 아닌 커브 위의 점으로 계산하므로 exactWorldBoundingBox 와 같은 범위가 된다.
+#-----------------------------------------
+# importlib.reload 시 이전 모듈에서 등록한 콜백 제거
+for callbackIds in globals().get('_bboxCallbackIds', {}).values():
+    om.MMessage.removeCallbacks(callbackIds)
+
+_bboxGeneration = 0
+_bboxCache = {}
+_bboxCallbackIds = {}
+
+def invalidateBoundingBoxes():
+    global _bboxGeneration
+    _bboxGeneration += 1
+
+def clearBoundingBoxCache():
+    _bboxCache.clear()
+
+    for callbackIds in _bboxCallbackIds.values():
+        om.MMessage.removeCallbacks(callbackIds)
+
+    _bboxCallbackIds.clear()
+
+def _onBoundingBoxDirty(node, key):
+    _bboxCache.pop(key, None)
+
+def _onBoundingBoxNodeDelete(node, modifier, key):
+    _bboxCache.pop(key, None)
+
+    callbackIds = _bboxCallbackIds.pop(key, None)
+    if callbackIds:
+        om.MMessage.removeCallbacks(callbackIds)
+
+def _computeBoundingBox(rootPath: om.MDagPath, key: int) -> list[float]:
+    bbox = om.MBoundingBox()
+    nodes = [rootPath.node()]
+
+    dagIt = om.MItDag(om.MItDag.kDepthFirst, om.MFn.kShape)
+    dagIt.reset(rootPath, om.MItDag.kDepthFirst, om.MFn.kShape)
+
+    while not dagIt.isDone():
+        shapePath = dagIt.getPath()
+        dagIt.next()
+
+        if om.MFnDagNode(shapePath).isIntermediateObject:
+            continue
+
+        nodes.append(shapePath.node())
+
+        if shapePath.hasFn(om.MFn.kMesh):
+            points = om.MFnMesh(shapePath).getPoints(om.MSpace.kWorld)
+        elif shapePath.hasFn(om.MFn.kNurbsCurve):
+            curveFn = om.MFnNurbsCurve(shapePath)
+            curvePoints = curveGeometry.evaluate({
+                'points': [list(p)[:3] for p in curveFn.cvPositions(om.MSpace.kWorld)],
+                'knots': list(curveFn.knots()),
+                'degree': curveFn.degree,
+            })
+            points = [om.MPoint(p.tolist()) for p in (curvePoints.min(axis=0), curvePoints.max(axis=0))]
+        else:
+            shapeBox = om.MFnDagNode(shapePath).boundingBox
+            shapeBox.transformUsing(shapePath.inclusiveMatrix())
+            points = [shapeBox.min, shapeBox.max]
+
+        for point in points:
+            bbox.expand(point)
+
+    if key in _bboxCallbackIds:
+        om.MMessage.removeCallbacks(_bboxCallbackIds[key])
+
+    _bboxCallbackIds[key] = [om.MNodeMessage.addNodeDirtyCallback(node, _onBoundingBoxDirty, key) for node in nodes] + \
+                            [om.MNodeMessage.addNodeAboutToDeleteCallback(node, _onBoundingBoxNodeDelete, key) for node in nodes]
+
+    return [bbox.min.x, bbox.min.y, bbox.min.z, bbox.max.x, bbox.max.y, bbox.max.z]
+
+def getBoundingBoxesInWorld(objects: list[str]) -> list[list[float]]:
+    """여러 오브젝트의 world bbox 를 한 번의 API 패스로 구한다. (xmin, ymin, zmin, xmax, ymax, zmax)"""
+    selList = om.MSelectionList()
+    for object in objects:
+        selList.add(object)
+
+    result = []
+
+    for i in range(selList.length()):
+        path = selList.getDagPath(i)
+        handle = om.MObjectHandle(path.node())
+        key = handle.hashCode()
+
+        entry = _bboxCache.get(key)
+        if entry is None or entry[0] != _bboxGeneration or entry[2] != handle:
+            entry = (_bboxGeneration, _computeBoundingBox(path, key), handle)
+            _bboxCache[key] = entry
+
+        result.append(entry[1])
+
+    return result
+
+def getBoundingBoxInWorld(object: str) -> list[float]:
+    return getBoundingBoxesInWorld([object])[0]
+
 def getWidthInWorld(object: str):
-    bbox = cmds.exactWorldBoundingBox(object)
+    bbox = getBoundingBoxInWorld(object)
     width = bbox[3] - bbox[0]
     return width
 
 def getHeightInWorld(object: str):
-    bbox = cmds.exactWorldBoundingBox(object)
+    bbox = getBoundingBoxInWorld(object)
     height = bbox[4] - bbox[1]
     return height
 
+def getDepthInWorld(object: str):
+    bbox = getBoundingBoxInWorld(object)
+    depth = bbox[5] - bbox[2]
+    return depth
+
+def getCenterInWorld(object: str):
+    bbox = getBoundingBoxInWorld(object)
+    return [(bbox[0] + bbox[3]) / 2, (bbox[1] + bbox[4]) / 2, (bbox[2] + bbox[5]) / 2]
+
+def getWorldMatrices(objects: list[str]) -> list[list[float]]:
+    """여러 오브젝트의 world matrix 를 한 번의 API 패스로 구한다. (16개 float, row-major)"""
+    selList = om.MSelectionList()
+    for object in objects:
+        selList.add(object)
+
+    return [list(selList.getDagPath(i).inclusiveMatrix()) for i in range(selList.length())]
+
+def getJointChain(root: str, maxJoints: int | None = None) -> tuple[list[str], list[list[float]]]:
+    """
+    root 부터 첫 번째 자식 조인트를 따라 내려가며 조인트 이름과 world matrix 를 한 번의 API 패스로 구한다.
+    maxJoints 가 있으면 그 개수에서 멈춘다.
+    """
+    selList = om.MSelectionList()
+    selList.add(root)
+    dagPath = selList.getDagPath(0)
+
+    names, matrices = [], []
+
+    while dagPath is not None:
+        names.append(dagPath.partialPathName())
+        matrices.append(list(dagPath.inclusiveMatrix()))
+
+        if maxJoints and len(names) >= maxJoints:
+            break
+
+        childPath = None
+        for i in range(dagPath.childCount()):
+            child = dagPath.child(i)
+
+            if child.hasFn(om.MFn.kJoint):
+                childPath = om.MDagPath(dagPath)
+                childPath.push(child)
+                break
+
+        dagPath = childPath
+
+    return names, matrices
+
+def getBindPoseMatrices(joints: list[str], matrices: list[list[float]]) -> list[list[float]]:
+    """
+    joints 의 bind pose (dagPose) 에 저장된 world matrix.
+    리그가 조인트를 움직여도 바뀌지 않으므로 fingerprint 에 쓴다. bind pose 가 없는 조인트는 matrices 값을 그대로 쓴다.
+    """
+    bindMatrices = []
+
+    for joint, matrix in zip(joints, matrices):
+        for plug in cmds.listConnections(f'{joint}.message', type='dagPose', source=False, destination=True, plugs=True) or []:
+            pose, member = plug.split('.', 1)
+
+            if cmds.getAttr(f'{pose}.bindPose') and member.startswith('members['):
+                matrix = cmds.getAttr(f"{pose}.worldMatrix[{member[len('members['):-1]}]")
+                break
+
+        bindMatrices.append(list(matrix))
+
+    return bindMatrices
+
+def getWorldPositions(objects: list[str]) -> list[list[float]]:
+    return [matrix[12:15] for matrix in getWorldMatrices(objects)]
+
 def addSeparatorAttribute(object: str, attrName: str):
     cmds.addAttr(object, longName=attrName, attributeType='enum', enumName='----------')
     cmds.setAttr(f'{object}.{attrName}', edit=True, channelBox=True, lock=True)
\ No newline at end of file
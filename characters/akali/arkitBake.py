@@ -0,0 +1,102 @@
+#-----------------------------------------
+# ARKit capture baker
+# 캡처 파일 (.csv / .npy / .bin, arkitCapture.loadFrames 참고) 을 *_arkit52 blendShape weight 에 키로 굽는다.
+# alias 마다 animCurve 하나를 만들고 MFnAnimCurve.addKeys 한 번으로 모든 키를 넣는다.
+# tolerance 를 주면 선형 보간 오차가 tolerance 이하가 되도록 키를 줄인다. (키는 linear tangent)
+#
+#   arkitBake.bakeCapture('D:/capture/shot010.csv', captureFps=60, startFrame=1001, tolerance=0.005)
+#
+# 기존 weight 의 animCurve 는 교체되고, 굽기는 undo 큐에 기록되지 않는다.
+#-----------------------------------------
+
+import sys
+import maya.mel as mel
+
+modulePath = mel.eval('getenv "MAYA_MY_SCRIPT_PATH"')
+if modulePath not in sys.path:
+    sys.path.append(modulePath)
+
+import time
+import importlib
+import numpy as np
+import maya.api.OpenMaya as om
+import maya.api.OpenMayaAnim as oma
+import arkitShapes
+import arkitCapture
+import arkitWeights
+
+# arkitStream 은 reload 할 때 돌고 있는 스트림을 멈추므로 여기서 import 하지 않는다
+importlib.reload(arkitShapes)
+importlib.reload(arkitCapture)
+importlib.reload(arkitWeights)
+
+def _getAnimCurve(plug: om.MPlug) -> om.MObject | None:
+    """plug 에 연결된 animCurve (없으면 None, 다른 노드가 연결돼 있으면 RuntimeError)"""
+    source = plug.source()
+    if source.isNull:
+        return None
+
+    if not source.node().hasFn(om.MFn.kAnimCurve):
+        raise RuntimeError(f'{plug.name()} is driven by {source.name()}')
+
+    return source.node()
+
+def bakeCapture(path: str, captureFps=60.0, startFrame: float | None = None, meshes: list[str] = arkitShapes.MAIN_MESHES, tolerance=0.005) -> dict:
+    """
+    캡처 프레임 i 를 씬 프레임 startFrame + i * (씬 fps / captureFps) 에 굽는다. (startFrame 기본값은 재생 범위 시작)
+    tolerance 가 0 이나 None 이면 모든 프레임에 키를 넣는다.
+    반환: {'curves', 'frames', 'keys', 'seconds'}
+    """
+    startTime = time.perf_counter()
+    frames = arkitCapture.loadFrames(path)
+    weightPlugs = arkitWeights.getWeightPlugs(meshes)
+
+    if not weightPlugs:
+        raise RuntimeError('No *_arkit52 blendShape weights found. Run blendshapeApplier first.')
+
+    unit = om.MTime.uiUnit()
+    if startFrame is None:
+        startFrame = om.MAnimControl.minTime().asUnits(unit)
+
+    sceneFrames = startFrame + np.arange(len(frames)) * (om.MTime(1.0, om.MTime.k1Second).asUnits(unit) / captureFps)
+    mtimes = [om.MTime(float(frame), unit) for frame in sceneFrames]
+
+    # 같은 shape 는 메쉬가 달라도 같은 키를 쓰므로 shape 마다 한 번만 줄인다
+    keptKeys = {}
+    for plug, index in weightPlugs:
+        if index not in keptKeys:
+            keptKeys[index] = arkitCapture.reduceKeys(sceneFrames, frames[:, index], tolerance)
+
+    # 기존 animCurve 는 지우고 새로 만든다
+    modifier = om.MDGModifier()
+    for plug, index in weightPlugs:
+        oldCurve = _getAnimCurve(plug)
+        if oldCurve is not None:
+            modifier.deleteNode(oldCurve)
+    modifier.doIt()
+
+    modifier = om.MDGModifier()
+    fnCurve = oma.MFnAnimCurve()
+    curves = []
+
+    for plug, index in weightPlugs:
+        curve = fnCurve.create(plug, oma.MFnAnimCurve.kAnimCurveTU, modifier)
+        modifier.renameNode(curve, f'{om.MFnDependencyNode(plug.node()).name()}_{arkitShapes.ARKIT_SHAPES[index]}')
+        curves.append((curve, index))
+
+    # create 가 예약한 연결을 먼저 실행한 다음 키를 넣는다
+    modifier.doIt()
+
+    keyCount = 0
+    for curve, index in curves:
+        kept = keptKeys[index]
+        fnCurve.setObject(curve)
+        fnCurve.addKeys(om.MTimeArray([mtimes[i] for i in kept]), om.MDoubleArray(frames[kept, index].tolist()),
+                        oma.MFnAnimCurve.kTangentLinear, oma.MFnAnimCurve.kTangentLinear)
+        keyCount += len(kept)
+
+    result = {'curves': len(curves), 'frames': len(frames), 'keys': keyCount, 'seconds': time.perf_counter() - startTime}
+    print(f"ARKit bake: {result['frames']} frames -> {result['curves']} curves, {result['keys']} keys "
+          f"({result['keys'] / max(1, result['curves'] * result['frames']):.1%}) in {result['seconds']:.2f} s")
+
+    return result
@@ -0,0 +1,63 @@
+#-----------------------------------------
+# ARKit capture frames
+# 캡처 파일 읽기와 키 줄이기. (maya 없이 사용 가능, import 해도 부작용 없음)
+# 파일: (프레임 수, 52) .npy, 첫 줄이 shape 이름인 .csv 또는 float32 x 52 를 이어 붙인 .bin (ARKIT_SHAPES 순서)
+#-----------------------------------------
+
+import numpy as np
+import arkitShapes
+
+FRAME_SIZE = len(arkitShapes.ARKIT_SHAPES)
+
+def loadFrames(path: str) -> np.ndarray:
+    """(프레임 수, 52) weight. csv 는 첫 줄의 shape 이름으로 열을 맞춘다."""
+    if path.endswith('.bin'):
+        return np.fromfile(path, dtype='<f4').reshape(-1, FRAME_SIZE)
+
+    if not path.endswith('.csv'):
+        return np.load(path).astype(np.float32).reshape(-1, FRAME_SIZE)
+
+    with open(path, 'r', encoding='utf-8') as f:
+        columns = f.readline().strip().split(',')
+
+    values = np.loadtxt(path, delimiter=',', skiprows=1, dtype=np.float32, ndmin=2)
+    frames = np.zeros((len(values), FRAME_SIZE), dtype=np.float32)
+
+    for column, name in enumerate(columns):
+        if name in arkitShapes.ARKIT_SHAPES:
+            frames[:, arkitShapes.ARKIT_SHAPES.index(name)] = values[:, column]
+
+    return frames
+
+def reduceKeys(times: np.ndarray, values: np.ndarray, tolerance: float) -> np.ndarray:
+    """
+    남길 키 인덱스. 처음 / 마지막 키에서 시작해서 남은 키 사이의 선형 보간 오차가 가장 큰 키를
+    구간마다 동시에 추가한다. (Douglas-Peucker 를 구간 단위로 한꺼번에 돌리는 방식)
+    """
+    count = len(values)
+    if count <= 2 or tolerance is None or tolerance <= 0:
+        return np.arange(count)
+
+    times = np.asarray(times, dtype=np.float64)
+    values = np.asarray(values, dtype=np.float64)
+    keep = np.zeros(count, dtype=bool)
+    keep[[0, -1]] = True
+
+    while True:
+        kept = np.flatnonzero(keep)
+
+        # 키마다 속한 구간 (kept[segment], kept[segment + 1])
+        segment = np.minimum(np.searchsorted(kept, np.arange(count), side='right') - 1, len(kept) - 2)
+        start, end = kept[segment], kept[segment + 1]
+
+        blend = (times - times[start]) / (times[end] - times[start])
+        errors = np.abs(values - (values[start] + (values[end] - values[start]) * blend))
+        errors[keep] = 0.0
+
+        segmentMax = np.maximum.reduceat(errors, kept[:-1])
+        add = (errors > tolerance) & (errors == segmentMax[segment])
+
+        if not add.any():
+            return kept
+
+        keep |= add
@@ -0,0 +1,19 @@
+#-----------------------------------------
+# ARKit 52 blendshape 이름과 순서 (캡처 프레임의 weight 순서) 와 blendShape 노드 이름 규칙
+#-----------------------------------------
+
+ARKIT_SHAPES = [
+    'eyeBlinkLeft', 'eyeLookDownLeft', 'eyeLookInLeft', 'eyeLookOutLeft', 'eyeLookUpLeft', 'eyeSquintLeft', 'eyeWideLeft', 'eyeBlinkRight', 'eyeLookDownRight', 'eyeLookInRight', 'eyeLookOutRight', 'eyeLookUpRight', 'eyeSquintRight', 'eyeWideRight',
+    'jawForward', 'jawLeft', 'jawRight', 'jawOpen',
+    'mouthClose', 'mouthFunnel', 'mouthPucker', 'mouthLeft', 'mouthRight', 'mouthSmileLeft', 'mouthSmileRight', 'mouthFrownLeft', 'mouthFrownRight', 'mouthDimpleLeft', 'mouthDimpleRight', 'mouthStretchLeft', 'mouthStretchRight', 'mouthRollLower', 'mouthRollUpper', 'mouthShrugLower', 'mouthShrugUpper', 'mouthPressLeft', 'mouthPressRight', 'mouthLowerDownLeft', 'mouthLowerDownRight', 'mouthUpperUpLeft', 'mouthUpperUpRight',
+    'browDownLeft', 'browDownRight', 'browInnerUp', 'browOuterUpLeft', 'browOuterUpRight',
+    'cheekPuff', 'cheekSquintLeft', 'cheekSquintRight',
+    'noseSneerLeft', 'noseSneerRight',
+    'tongueOut'
+]
+
+# blendshapeApplier 가 *_arkit52 blendShape 를 만드는 메쉬
+MAIN_MESHES = ['Face_Mesh', 'Eyelash_Mesh', 'Eyebrow_Mesh', 'Teeth2_Mesh', 'Tongue_Mesh', 'Corneas_Mesh', 'Eyes_Mesh']
+
+def getBlendshapeName(mesh: str) -> str:
+    return mesh.split('_')[0].lower() + '_arkit52'
@@ -0,0 +1,194 @@
+#-----------------------------------------
+# ARKit weight stream
+# 페이스 캡처의 ARKit 52 weight 프레임을 백그라운드 스레드에서 받아서 (UDP 또는 파일 재생)
+# 가장 최근 프레임만 남기고, 메인 스레드 타이머에서 *_arkit52 blendShape 의 weight 를 MDGModifier 하나로 적용한다.
+#
+# UDP 패킷: little-endian [float64 캡처 시간 (time.time(), 선택)] + float32 x 52 (ARKIT_SHAPES 순서)
+# 파일 재생: (프레임 수, 52) .npy, 첫 줄이 shape 이름인 .csv 또는 UDP 패킷과 같은 float32 x 52 를 이어 붙인 .bin
+#
+#   arkitStream.start('udp', port=9052)
+#   arkitStream.start('D:/capture/shot010.csv', fps=60, loop=True)
+#   arkitStream.printStats()
+#   arkitStream.stop()
+#
+# 스트림으로 바꾼 weight 는 undo 큐에 기록되지 않는다.
+#-----------------------------------------
+
+import sys
+import maya.mel as mel
+
+modulePath = mel.eval('getenv "MAYA_MY_SCRIPT_PATH"')
+if modulePath not in sys.path:
+    sys.path.append(modulePath)
+
+import time
+import socket
+import struct
+import threading
+import importlib
+import numpy as np
+import maya.api.OpenMaya as om
+import arkitShapes
+import arkitCapture
+import arkitWeights
+
+importlib.reload(arkitShapes)
+importlib.reload(arkitCapture)
+importlib.reload(arkitWeights)
+
+FRAME_SIZE = arkitCapture.FRAME_SIZE
+DEFAULT_PORT = 9052
+
+# importlib.reload 전에 돌던 스트림은 멈춘다
+if globals().get('_stream'):
+    globals()['stop']()
+
+_stream = None
+
+def _newStats() -> dict:
+    return {'received': 0, 'applied': 0, 'dropped': 0, 'stale': 0, 'latencySum': 0.0, 'latencyMax': 0.0, 'startTime': time.perf_counter()}
+
+def _pushFrame(stream: dict, weights: np.ndarray, captureTime: float | None = None):
+    """수신 스레드: 아직 적용되지 않은 이전 프레임은 버리고 최신 프레임만 남긴다."""
+    receivedTime = time.perf_counter()
+
+    # 캡처 앱이 보낸 time.time() 을 perf_counter 기준으로 바꾼다
+    if captureTime is not None:
+        receivedTime -= max(0.0, time.time() - captureTime)
+
+    with stream['lock']:
+        stats = stream['stats']
+        stats['received'] += 1
+
+        if stream['latest'] is not None:
+            stats['dropped'] += 1
+
+        stream['latest'] = (weights, receivedTime)
+
+def _udpLoop(stream: dict, host: str, port: int):
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        sock.bind((host, port))
+        sock.settimeout(0.2)
+
+        while not stream['stopEvent'].is_set():
+            try:
+                packet = sock.recv(1024)
+            except socket.timeout:
+                continue
+
+            if len(packet) == FRAME_SIZE * 4:
+                _pushFrame(stream, np.frombuffer(packet, dtype='<f4'))
+            elif len(packet) == 8 + FRAME_SIZE * 4:
+                _pushFrame(stream, np.frombuffer(packet, dtype='<f4', offset=8), struct.unpack('<d', packet[:8])[0])
+
+def _replayLoop(stream: dict, frames: np.ndarray, fps: float, loop: bool):
+    startTime = time.perf_counter()
+    frame = 0
+
+    while not stream['stopEvent'].is_set():
+        if frame >= len(frames):
+            if not loop:
+                break
+
+            startTime += frame / fps
+            frame = 0
+
+        _pushFrame(stream, frames[frame])
+        frame += 1
+
+        # 캡처 앱처럼 fps 에 맞춰서 보낸다 (밀리면 따라잡는다)
+        stream['stopEvent'].wait(max(0.0, startTime + frame / fps - time.perf_counter()))
+
+def _applyLatest(elapsedTime, lastTime, stream):
+    """메인 스레드 타이머: 최신 프레임 하나를 모든 메쉬에 적용한다."""
+    with stream['lock']:
+        latest, stream['latest'] = stream['latest'], None
+
+    if latest is None:
+        return
+
+    weights, receivedTime = latest
+    stats = stream['stats']
+    age = time.perf_counter() - receivedTime
+
+    if age > stream['maxAge']:
+        stats['stale'] += 1
+        return
+
+    modifier = om.MDGModifier()
+    for plug, index in stream['plugs']:
+        modifier.newPlugValueFloat(plug, float(weights[index]))
+    modifier.doIt()
+
+    latency = time.perf_counter() - receivedTime
+    stats['applied'] += 1
+    stats['latencySum'] += latency
+    stats['latencyMax'] = max(stats['latencyMax'], latency)
+
+def start(source='udp', port=DEFAULT_PORT, host='127.0.0.1', fps=60.0, loop=False, meshes: list[str] = arkitShapes.MAIN_MESHES, maxAge=0.1) -> dict:
+    """
+    source 가 'udp' 면 host:port 로 받고, 아니면 파일 경로로 보고 fps 로 재생한다.
+    적용은 1 / fps 간격의 메인 스레드 타이머에서 하고, maxAge 초보다 오래된 프레임은 버린다.
+    """
+    global _stream
+    stop()
+
+    plugs = arkitWeights.getWeightPlugs(meshes)
+    if not plugs:
+        raise RuntimeError('No *_arkit52 blendShape weights found. Run blendshapeApplier first.')
+
+    stream = {
+        'lock': threading.Lock(),
+        'stopEvent': threading.Event(),
+        'latest': None,
+        'plugs': plugs,
+        'maxAge': maxAge,
+        'stats': _newStats(),
+    }
+
+    if source == 'udp':
+        stream['thread'] = threading.Thread(target=_udpLoop, args=(stream, host, port), daemon=True)
+    else:
+        stream['thread'] = threading.Thread(target=_replayLoop, args=(stream, arkitCapture.loadFrames(source), fps, loop), daemon=True)
+
+    stream['thread'].start()
+    stream['callbackId'] = om.MTimerMessage.addTimerCallback(1.0 / fps, _applyLatest, stream)
+    _stream = stream
+
+    print(f'ARKit stream started ({source}, {len(plugs)} weights)')
+    return stream
+
+def stop():
+    global _stream
+
+    if not _stream:
+        return
+
+    _stream['stopEvent'].set()
+    om.MMessage.removeCallback(_stream['callbackId'])
+    _stream['thread'].join(1.0)
+
+    printStats()
+    _stream = None
+
+def getStats() -> dict:
+    """받은 / 적용한 / 덮어써서 버린 / 오래돼서 버린 프레임 수, 평균 / 최대 지연 (ms), 적용 fps"""
+    if not _stream:
+        return {}
+
+    stats = dict(_stream['stats'])
+    elapsed = time.perf_counter() - stats.pop('startTime')
+    latencySum = stats.pop('latencySum')
+
+    stats['latencyAvgMs'] = latencySum / stats['applied'] * 1000 if stats['applied'] else 0.0
+    stats['latencyMaxMs'] = stats.pop('latencyMax') * 1000
+    stats['appliedFps'] = stats['applied'] / elapsed if elapsed > 0 else 0.0
+
+    return stats
+
+def printStats():
+    stats = getStats()
+
+    if stats:
+        print(f"ARKit stream: received {stats['received']}, applied {stats['applied']} ({stats['appliedFps']:.1f} fps), "
+              f"dropped {stats['dropped']}, stale {stats['stale']}, latency avg {stats['latencyAvgMs']:.1f} ms / max {stats['latencyMaxMs']:.1f} ms")
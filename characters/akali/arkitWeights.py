@@ -0,0 +1,29 @@
+#-----------------------------------------
+# ARKit blendShape weight plug
+# *_arkit52 blendShape 의 weight plug 을 ARKit shape 순서와 함께 찾는다. (import 해도 부작용 없음)
+#-----------------------------------------
+
+import maya.api.OpenMaya as om
+import arkitShapes
+
+def getWeightPlugs(meshes: list[str]) -> list[tuple[om.MPlug, int]]:
+    """blendShape weight plug 과 프레임에서의 인덱스 목록 (alias 이름으로 찾는다)"""
+    weightPlugs = []
+
+    for mesh in meshes:
+        selList = om.MSelectionList()
+
+        try:
+            selList.add(arkitShapes.getBlendshapeName(mesh))
+        except RuntimeError:
+            continue
+
+        fnNode = om.MFnDependencyNode(selList.getDependNode(0))
+        weightPlug = fnNode.findPlug('weight', False)
+
+        for alias, plugName in fnNode.getAliasList():
+            if alias in arkitShapes.ARKIT_SHAPES and plugName.startswith('weight['):
+                index = int(plugName[len('weight['):-1])
+                weightPlugs.append((weightPlug.elementByLogicalIndex(index), arkitShapes.ARKIT_SHAPES.index(alias)))
+
+    return weightPlugs
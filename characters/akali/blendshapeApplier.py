@@ -1,23 +1,88 @@
+import sys
+import maya.mel as mel
+
+modulePath = mel.eval('getenv "MAYA_MY_SCRIPT_PATH"')
+if modulePath not in sys.path:
+    sys.path.append(modulePath)
+
+import importlib
+import hashlib
+import numpy as np
 import maya.cmds as cmds
+import maya.api.OpenMaya as om
+import arkitShapes
 
-mainMeshs = ['Face_Mesh', 'Eyelash_Mesh', 'Eyebrow_Mesh', 'Teeth2_Mesh', 'Tongue_Mesh', 'Corneas_Mesh', 'Eyes_Mesh']
+importlib.reload(arkitShapes)
 
-for mainMesh in mainMeshs:
-    blsh = mainMesh.split('_')[0].lower() + '_arkit52'
-    cmds.blendShape(mainMesh, name=blsh, frontOfChain=True)
+mainMeshs = arkitShapes.MAIN_MESHES
+targetNamespace = 'akali_facial_arkit52'
+
+def _getMeshFn(mesh: str) -> om.MFnMesh:
+    selList = om.MSelectionList()
+    selList.add(mesh)
+    return om.MFnMesh(selList.getDagPath(0))
+
+def _hashConnectivity(fnMesh: om.MFnMesh) -> str:
+    counts, connects = fnMesh.getVertices()
+
+    digest = hashlib.blake2b(np.array(counts, dtype=np.int32).tobytes(), digest_size=16)
+    digest.update(np.array(connects, dtype=np.int32).tobytes())
+    return digest.hexdigest()
+
+def getTopology(mesh: str) -> tuple:
+    """메쉬 토폴로지 비교용 (버텍스 수, 면 수, 면별 버텍스 수와 인덱스의 해시)"""
+    fnMesh = _getMeshFn(mesh)
+    return fnMesh.numVertices, fnMesh.numPolygons, _hashConnectivity(fnMesh)
+
+def validateTargets(mainMesh: str, targets: list[str]):
+    """
+    base 토폴로지 해시는 메쉬마다 한 번만 구하고 타겟은 버텍스 / 면 수가 같을 때만 해시를 비교한다.
+    """
+    numVertices, numPolygons, connectivityHash = getTopology(mainMesh)
+    mismatches = []
+
+    for target in targets:
+        fnMesh = _getMeshFn(target)
 
-    targets = cmds.listRelatives(f'akali_facial_arkit52:{mainMesh}_ARKit')
+        if (fnMesh.numVertices, fnMesh.numPolygons) != (numVertices, numPolygons) or _hashConnectivity(fnMesh) != connectivityHash:
+            mismatches.append(target)
 
-    for i in range(len(targets)):
-        target = targets[i]
-        targetName = target.rsplit('_', 1)[-1]
+    if mismatches:
+        raise RuntimeError(f'{mainMesh} 와 토폴로지가 다른 타겟: {", ".join(mismatches)}')
 
-        cmds.blendShape(
-            blsh,
-            edit=True,
-            topologyCheck=True,
-            target=(mainMesh, i, target, 1),
-            weight=(0, 0)
-        )
+def setWeightAliases(blsh: str, aliases: list[str]):
+    """weight[i] 의 alias 를 한 번에 설정한다."""
+    selList = om.MSelectionList()
+    selList.add(blsh)
+    fnNode = om.MFnDependencyNode(selList.getDependNode(0))
+    weightPlug = fnNode.findPlug('weight', False)
 
-        cmds.aliasAttr(targetName, f'{blsh}.w[{i}]')
+    for i, alias in enumerate(aliases):
+        # 생성 시 붙은 타겟 이름 alias 를 지우고 새 이름으로 교체
+        plug = weightPlug.elementByLogicalIndex(i)
+        oldAlias = fnNode.plugsAlias(plug)
+        if oldAlias:
+            fnNode.setAlias(oldAlias, plug.partialName(), plug, False)
+
+        fnNode.setAlias(alias, plug.partialName(), plug, True)
+
+def applyBlendshapes(mainMesh: str) -> str | None:
+    blsh = arkitShapes.getBlendshapeName(mainMesh)
+    targetGroup = f'{targetNamespace}:{mainMesh}_ARKit'
+
+    # exporter 가 영향 받는 shape 가 없는 메쉬는 내보내지 않는다
+    targets = cmds.listRelatives(targetGroup) if cmds.objExists(targetGroup) else None
+    if not targets:
+        print(f'{mainMesh}: 타겟 없음, 건너뜀')
+        return None
+
+    validateTargets(mainMesh, targets)
+
+    # 타겟 전체를 생성 시 한 번에 추가한다 (weight 인덱스 = targets 순서)
+    cmds.blendShape(*targets, mainMesh, name=blsh, frontOfChain=True, topologyCheck=False)
+    setWeightAliases(blsh, [target.rsplit('_', 1)[-1] for target in targets])
+
+    return blsh
+
+for mainMesh in mainMeshs:
+    applyBlendshapes(mainMesh)
@@ -0,0 +1,172 @@
+#-----------------------------------------
+# Blendshape delta archive
+# 블렌드쉐입 타겟을 메쉬 전체 대신 움직인 버텍스의 (인덱스, delta) 만 저장한다. (maya 없이 사용 가능)
+#
+# .npz 키
+#   {mesh}/{shape}/indices : int32 (K,)   움직인 버텍스 인덱스
+#   {mesh}/{shape}/deltas  : float32 (K, 3) object space delta
+#   {mesh}/{shape}/scale   : 양자화된 delta 의 scale (양자화했을 때만, delta = 저장값 * scale)
+#   {mesh}/basePoints      : float32 (N, 3) 기본 버텍스 위치 (있을 때만)
+#   meshes, baseMeshes, vertexCounts, shapes, tolerance, controlValue, version
+#
+# 양자화 (encoding)
+#   float32 : 그대로
+#   int16   : 타겟마다 scale = 최대 |delta| / 32767
+#   float16 : half float
+#   버텍스 위치 오차가 maxError 를 넘는 타겟은 float32 로 저장한다.
+#
+# 검증:
+#   python blendshapeDeltas.py akali_arkit52_deltas.npz --encoding int16 --max-error 0.001 [--out encoded.npz]
+#-----------------------------------------
+
+import numpy as np
+
+FORMAT_VERSION = 1
+ENCODINGS = ['float32', 'int16', 'float16']
+
+def getKey(mesh: str, shape: str, field: str) -> str:
+    return f'{mesh}/{shape}/{field}'
+
+def extractSparseDelta(basePoints, deformedPoints, tolerance=1e-4) -> tuple[np.ndarray, np.ndarray]:
+    """delta 길이가 tolerance 보다 큰 버텍스의 인덱스와 delta"""
+    deltas = np.asarray(deformedPoints, dtype=float) - np.asarray(basePoints, dtype=float)
+    indices = np.flatnonzero(np.einsum('ij,ij->i', deltas, deltas) > tolerance * tolerance)
+
+    return indices.astype(np.int32), deltas[indices].astype(np.float32)
+
+def decodeDeltas(data: np.ndarray, scale=1.0) -> np.ndarray:
+    if data.dtype == np.float32 and scale == 1.0:
+        return data
+
+    return data.astype(np.float32) * np.float32(scale)
+
+def getVertexErrors(deltas, data: np.ndarray, scale=1.0) -> np.ndarray:
+    """양자화 전후 버텍스별 위치 오차"""
+    return np.linalg.norm(decodeDeltas(data, scale) - np.asarray(deltas, dtype=np.float32), axis=1)
+
+def encodeDeltas(deltas, encoding='float32', maxError=1e-3) -> tuple[np.ndarray, float]:
+    """
+    deltas 를 encoding 으로 양자화해서 (저장값, scale) 을 반환한다.
+    버텍스 위치 오차가 maxError 를 넘으면 float32 그대로 반환한다.
+    """
+    deltas = np.asarray(deltas, dtype=np.float32)
+
+    if encoding not in ENCODINGS:
+        raise ValueError(f'Unknown delta encoding: {encoding}')
+
+    if encoding == 'float32' or not len(deltas):
+        return deltas, 1.0
+
+    if encoding == 'int16':
+        maxAbs = float(np.abs(deltas).max())
+        scale = maxAbs / 32767 if maxAbs > 0 else 1.0
+        data = np.round(deltas / scale).astype(np.int16)
+    else:
+        scale = 1.0
+        data = deltas.astype(np.float16)
+
+    if getVertexErrors(deltas, data, scale).max() > maxError:
+        return deltas, 1.0
+
+    return data, scale
+
+def verifyEncoding(targets: dict, encoding='int16', maxError=1e-3) -> dict:
+    """타겟마다 {(mesh, shape): (최대 오차, 그 버텍스 인덱스, 저장 dtype)}"""
+    report = {}
+
+    for key, (indices, deltas) in targets.items():
+        data, scale = encodeDeltas(deltas, encoding, maxError)
+        errors = getVertexErrors(deltas, data, scale)
+        worst = int(errors.argmax()) if len(errors) else 0
+
+        report[key] = (float(errors[worst]) if len(errors) else 0.0, int(indices[worst]) if len(indices) else -1, data.dtype.name)
+
+    return report
+
+def saveArchive(path: str, targets: dict, vertexCounts: dict, baseMeshes: dict | None = None, tolerance=1e-4, controlValue=10.0, basePoints: dict | None = None, encoding='float32', maxError=1e-3):
+    """
+    targets      : {(mesh, shape): (indices, deltas)}
+    vertexCounts : {mesh: 버텍스 수}
+    baseMeshes   : {mesh: 블렌드쉐입을 적용할 메쉬 이름} (없으면 mesh 와 같음)
+    basePoints   : {mesh: (N, 3) 기본 버텍스 위치} (deltaStore 로 변환할 때 필요)
+    encoding     : delta 양자화 방식 (ENCODINGS), maxError 는 허용하는 버텍스 위치 오차
+    """
+    meshes = list(vertexCounts)
+    shapes = list(dict.fromkeys(shape for mesh, shape in targets))
+    baseMeshes = baseMeshes or {}
+
+    arrays = {
+        'version': np.array(FORMAT_VERSION),
+        'meshes': np.array(meshes),
+        'baseMeshes': np.array([baseMeshes.get(mesh, mesh) for mesh in meshes]),
+        'vertexCounts': np.array([vertexCounts[mesh] for mesh in meshes], dtype=np.int64),
+        'shapes': np.array(shapes),
+        'tolerance': np.array(tolerance),
+        'controlValue': np.array(controlValue),
+    }
+
+    for mesh, points in (basePoints or {}).items():
+        arrays[f'{mesh}/basePoints'] = np.asarray(points, dtype=np.float32)
+
+    for (mesh, shape), (indices, deltas) in targets.items():
+        arrays[getKey(mesh, shape, 'indices')] = np.asarray(indices, dtype=np.int32)
+        data, scale = encodeDeltas(deltas, encoding, maxError)
+        arrays[getKey(mesh, shape, 'deltas')] = data
+
+        if data.dtype != np.float32:
+            arrays[getKey(mesh, shape, 'scale')] = np.array(scale)
+
+    np.savez_compressed(path, **arrays)
+
+def loadArchive(path: str) -> dict:
+    """
+    saveArchive 로 저장한 파일을 {'targets', 'basePoints', 'vertexCounts', 'baseMeshes', 'shapes', 'tolerance', 'controlValue'} 로 읽는다.
+    양자화된 delta 는 float32 로 복원한다.
+    """
+    with np.load(path) as archive:
+        meshes = archive['meshes'].tolist()
+        shapes = archive['shapes'].tolist()
+
+        targets = {}
+        for mesh in meshes:
+            for shape in shapes:
+                key = getKey(mesh, shape, 'indices')
+
+                if key in archive.files:
+                    scaleKey = getKey(mesh, shape, 'scale')
+                    scale = float(archive[scaleKey]) if scaleKey in archive.files else 1.0
+                    targets[(mesh, shape)] = (archive[key], decodeDeltas(archive[getKey(mesh, shape, 'deltas')], scale))
+
+        return {
+            'targets': targets,
+            'basePoints': {mesh: archive[f'{mesh}/basePoints'] for mesh in meshes if f'{mesh}/basePoints' in archive.files},
+            'vertexCounts': dict(zip(meshes, archive['vertexCounts'].tolist())),
+            'baseMeshes': dict(zip(meshes, archive['baseMeshes'].tolist())),
+            'shapes': shapes,
+            'tolerance': float(archive['tolerance']),
+            'controlValue': float(archive['controlValue']),
+        }
+
+if __name__ == '__main__':
+    import os
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Report the worst vertex error of quantized blendshape deltas')
+    parser.add_argument('archive', help='.npz saved by saveArchive')
+    parser.add_argument('--encoding', choices=ENCODINGS, default='int16')
+    parser.add_argument('--max-error', type=float, default=1e-3, help='maximum vertex position error')
+    parser.add_argument('--out', help='save the quantized archive to this path')
+    options = parser.parse_args()
+
+    archive = loadArchive(options.archive)
+    report = verifyEncoding(archive['targets'], options.encoding, options.max_error)
+
+    for (mesh, shape), (error, vertex, dtype) in report.items():
+        print(f'{mesh} {shape}: {error:.6g} (vtx {vertex}, {dtype})')
+
+    fallbacks = sum(dtype == 'float32' for error, vertex, dtype in report.values())
+    print(f'# worst error {max((error for error, vertex, dtype in report.values()), default=0):.6g}, {fallbacks} / {len(report)} targets kept as float32')
+
+    if options.out:
+        saveArchive(options.out, archive['targets'], archive['vertexCounts'], archive['baseMeshes'], archive['tolerance'], archive['controlValue'], archive['basePoints'], options.encoding, options.max_error)
+        print(f'# {os.path.getsize(options.archive)} -> {os.path.getsize(options.out)} bytes')
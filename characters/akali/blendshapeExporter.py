@@ -1,84 +1,177 @@
+import os
+import sys
+import maya.mel as mel
+
+modulePath = mel.eval('getenv "MAYA_MY_SCRIPT_PATH"')
+if modulePath not in sys.path:
+    sys.path.append(modulePath)
+
+import importlib
+from contextlib import contextmanager
+import numpy as np
 import maya.cmds as cmds
+import maya.api.OpenMaya as om
+import arkitShapes
+import blendshapeDeltas
+import deltaStore
 
-allShapes = [
-    'eyeBlinkLeft', 'eyeLookDownLeft', 'eyeLookInLeft', 'eyeLookOutLeft', 'eyeLookUpLeft', 'eyeSquintLeft', 'eyeWideLeft', 'eyeBlinkRight', 'eyeLookDownRight', 'eyeLookInRight', 'eyeLookOutRight', 'eyeLookUpRight', 'eyeSquintRight', 'eyeWideRight', 
-    'jawForward', 'jawLeft', 'jawRight', 'jawOpen', 
-    'mouthClose', 'mouthFunnel', 'mouthPucker', 'mouthLeft', 'mouthRight', 'mouthSmileLeft', 'mouthSmileRight', 'mouthFrownLeft', 'mouthFrownRight', 'mouthDimpleLeft', 'mouthDimpleRight', 'mouthStretchLeft', 'mouthStretchRight', 'mouthRollLower', 'mouthRollUpper', 'mouthShrugLower', 'mouthShrugUpper', 'mouthPressLeft', 'mouthPressRight', 'mouthLowerDownLeft', 'mouthLowerDownRight', 'mouthUpperUpLeft', 'mouthUpperUpRight',
-    'browDownLeft', 'browDownRight', 'browInnerUp', 'browOuterUpLeft', 'browOuterUpRight', 
-    'cheekPuff', 'cheekSquintLeft', 'cheekSquintRight', 
-    'noseSneerLeft', 'noseSneerRight', 
-    'tongueOut'
-]
+importlib.reload(arkitShapes)
+importlib.reload(blendshapeDeltas)
+importlib.reload(deltaStore)
+
+# 'duplicate' : 타겟마다 메쉬를 복제해서 씬에 배치 (blendshapeApplier 용)
+# 'sparse'    : 움직인 버텍스의 delta 만 deltaPath (.npz) 로 저장하고 storePath 에 memory-map 용 store 도 만든다
+exportMode = 'duplicate'
+deltaPath = cmds.workspace(query=True, rootDirectory=True) + 'data/akali_arkit52_deltas.npz'
+storePath = cmds.workspace(query=True, rootDirectory=True) + 'data/akali_arkit52.deltas'
 
-meshs = [
-    [
-        'Face_Main_Mesh', 
-        [
-            'eyeBlinkLeft', 'eyeLookDownLeft', 'eyeLookInLeft', 'eyeLookOutLeft', 'eyeLookUpLeft', 'eyeSquintLeft', 'eyeWideLeft', 'eyeBlinkRight', 'eyeLookDownRight', 'eyeLookInRight', 'eyeLookOutRight', 'eyeLookUpRight', 'eyeSquintRight', 'eyeWideRight', 
-            'jawForward', 'jawLeft', 'jawRight', 'jawOpen', 
-            'mouthClose', 'mouthFunnel', 'mouthPucker', 'mouthLeft', 'mouthRight', 'mouthSmileLeft', 'mouthSmileRight', 'mouthFrownLeft', 'mouthFrownRight', 'mouthDimpleLeft', 'mouthDimpleRight', 'mouthStretchLeft', 'mouthStretchRight', 'mouthRollLower', 'mouthRollUpper', 'mouthShrugLower', 'mouthShrugUpper', 'mouthPressLeft', 'mouthPressRight', 'mouthLowerDownLeft', 'mouthLowerDownRight', 'mouthUpperUpLeft', 'mouthUpperUpRight',
-            'browDownLeft', 'browDownRight', 'browInnerUp', 'browOuterUpLeft', 'browOuterUpRight', 
-            'cheekPuff', 'cheekSquintLeft', 'cheekSquintRight', 
-            'noseSneerLeft', 'noseSneerRight', 
-            'tongueOut'
-        ]
-    ],
-    [
-        'Eyelash_Main_Mesh',
-        [
-            'eyeBlinkLeft', 'eyeLookDownLeft', 'eyeLookInLeft', 'eyeLookOutLeft', 'eyeLookUpLeft', 'eyeSquintLeft', 'eyeWideLeft', 'eyeBlinkRight', 'eyeLookDownRight', 'eyeLookInRight', 'eyeLookOutRight', 'eyeLookUpRight', 'eyeSquintRight', 'eyeWideRight', 
-            'cheekSquintLeft', 'cheekSquintRight'
-        ]
-    ],
-    [
-        'Eyebrow_Main_Mesh',
-        [
-            'eyeSquintLeft', 'eyeSquintRight',
-            'browDownLeft', 'browDownRight', 'browInnerUp', 'browOuterUpLeft', 'browOuterUpRight', 
-            'cheekSquintLeft', 'cheekSquintRight'
-        ]
-    ],
-    [
-        'Teeth2_Mesh',
-        [
-            'jawForward', 'jawLeft', 'jawRight', 'jawOpen'
-        ]
-    ],
-    [   
-        'Tongue_Mesh',
-        [ 
-            'jawForward', 'jawLeft', 'jawRight', 'jawOpen',
-            'tongueOut'
-        ]
-    ],
-    [
-        'Corneas_Mesh',
-        ['eyeLookDownLeft', 'eyeLookInLeft', 'eyeLookOutLeft', 'eyeLookUpLeft', 'eyeLookDownRight', 'eyeLookInRight', 'eyeLookOutRight', 'eyeLookUpRight']
-    ],
-    [
-        'Eyes_Mesh',
-        ['eyeLookDownLeft', 'eyeLookInLeft', 'eyeLookOutLeft', 'eyeLookUpLeft', 'eyeLookDownRight', 'eyeLookInRight', 'eyeLookOutRight', 'eyeLookUpRight']
-    ]
+# sparse delta 양자화 ('float32', 'int16', 'float16') 와 허용 버텍스 위치 오차
+deltaEncoding = 'float32'
+maxDeltaError = 1e-3
+
+allShapes = arkitShapes.ARKIT_SHAPES
+
+# (export 할 메쉬, 블렌드쉐입을 적용할 메쉬 / 그룹 이름)
+# 어떤 shape 가 어떤 메쉬를 움직이는지는 export 중에 포즈를 잡을 때 같이 확인한다. (표만 필요하면 analyzeAffinity())
+meshGroups = [
+    ('Face_Main_Mesh', 'Face_Mesh'),
+    ('Eyelash_Main_Mesh', 'Eyelash_Mesh'),
+    ('Eyebrow_Main_Mesh', 'Eyebrow_Mesh'),
+    ('Teeth2_Mesh', 'Teeth2_Mesh'),
+    ('Tongue_Mesh', 'Tongue_Mesh'),
+    ('Corneas_Mesh', 'Corneas_Mesh'),
+    ('Eyes_Mesh', 'Eyes_Mesh'),
 ]
-grps = ['Face_Mesh', 'Eyelash_Mesh', 'Eyebrow_Mesh', 'Teeth2_Mesh', 'Tongue_Mesh', 'Corneas_Mesh', 'Eyes_Mesh']
 
-topGrp = cmds.group(empty=True, name='akali_facial_arkit52')
+def getMeshPoints(mesh: str) -> np.ndarray:
+    """메쉬의 (deform 된) object space 버텍스 위치를 한 번에 읽는다."""
+    selList = om.MSelectionList()
+    selList.add(mesh)
+    points = om.MFnMesh(selList.getDagPath(0)).getPoints(om.MSpace.kObject)
 
-for i in range(len(meshs)):
-    grp = grps[i] + '_ARKit'
-    cmds.group(empty=True, name=grp)
-    cmds.parent(grp, topGrp)
+    return np.array(points, dtype=float)[:, :3]
 
-    mesh = meshs[i][0]
-    mesh_shapes = meshs[i][1]
+@contextmanager
+def posedShape(shape: str, controlValue=10):
+    """ARKit 컨트롤의 shape 값을 올리고 export 가 중간에 실패해도 0 으로 되돌린다."""
+    cmds.setAttr(f"ctrlARKit_M.{shape}", controlValue)
 
-    isFirst = True
-    for shape in mesh_shapes:
-        cmds.setAttr(f"ctrlARKit_M.{shape}", 10)
-        name = f"{mesh}_{shape}"
-        cmds.duplicate(mesh, name=name)
-        cmds.parent(name, grp)
-        cmds.move(15 * allShapes.index(shape), 0, 0, name)
+    try:
+        yield
+    finally:
         cmds.setAttr(f"ctrlARKit_M.{shape}", 0)
 
-    cmds.move(15, 0, 0, grp)
\ No newline at end of file
+def analyzeAffinity(meshes: list[str] | None = None, shapes: list[str] = allShapes, controlValue=10, threshold=1e-4, relativeThreshold=0.0) -> dict:
+    """
+    ARKit 컨트롤을 shape 마다 한 번씩 올리고 모든 메쉬의 버텍스 이동량을 한 번에 계산해서
+    메쉬마다 영향을 받는 shape 목록을 만든다.
+    shape 의 최대 이동량이 threshold 와 (relativeThreshold * 그 메쉬의 가장 큰 이동량) 보다 커야 포함된다.
+
+    반환: {'table': [[mesh, [shape, ...]], ...], 'magnitudes': (메쉬 수, shape 수) 최대 이동량}
+    """
+    meshes = meshes or [mesh for mesh, group in meshGroups]
+    basePoints = [getMeshPoints(mesh) for mesh in meshes]
+
+    # 모든 메쉬를 이어 붙여서 버텍스 이동량을 한 번에 구하고 메쉬 구간별 최대값을 구한다
+    offsets = np.cumsum([0] + [len(points) for points in basePoints[:-1]])
+    allBasePoints = np.concatenate(basePoints)
+    magnitudes = np.zeros((len(meshes), len(shapes)))
+
+    for i, shape in enumerate(shapes):
+        with posedShape(shape, controlValue):
+            deltas = np.concatenate([getMeshPoints(mesh) for mesh in meshes]) - allBasePoints
+
+        magnitudes[:, i] = np.maximum.reduceat(np.linalg.norm(deltas, axis=1), offsets)
+
+    limits = np.maximum(threshold, relativeThreshold * magnitudes.max(axis=1, keepdims=True))
+    affected = magnitudes > limits
+
+    table = [[mesh, [shape for shape, isAffected in zip(shapes, affected[m]) if isAffected]] for m, mesh in enumerate(meshes)]
+
+    return {'table': table, 'magnitudes': magnitudes}
+
+def printAffinityTable(table: list):
+    for mesh, shapes in table:
+        print(f"{mesh} ({len(shapes)}): {', '.join(shapes) if shapes else '-'}")
+
+def exportDuplicates(meshTable: list | None = None, threshold=1e-4):
+    """
+    shape 마다 컨트롤을 한 번 올리고 그 포즈에서 움직인 메쉬만 복제한다.
+    meshTable 이 있으면 움직임을 확인하지 않고 표에 있는 (메쉬, shape) 만 복제한다.
+    움직임은 analyzeAffinity 와 같이 버텍스 이동 거리의 최대값을 threshold 와 비교한다.
+    """
+    meshes = [mesh for mesh, group in meshGroups]
+    meshShapes = {mesh: set(shapes) for mesh, shapes in meshTable} if meshTable is not None else None
+    basePoints = {mesh: getMeshPoints(mesh) for mesh in meshes} if meshTable is None else {}
+
+    groups = dict(meshGroups)
+    topGrp = cmds.group(empty=True, name='akali_facial_arkit52')
+    meshGrps = {}
+
+    for shape in allShapes:
+        with posedShape(shape, 10):
+            for mesh in meshes:
+                if meshShapes is not None:
+                    if shape not in meshShapes.get(mesh, ()):
+                        continue
+                elif np.linalg.norm(getMeshPoints(mesh) - basePoints[mesh], axis=1).max(initial=0) <= threshold:
+                    continue
+
+                # 영향을 받는 shape 가 없는 메쉬는 그룹도 만들지 않는다
+                if mesh not in meshGrps:
+                    grp = meshGrps[mesh] = groups.get(mesh, mesh) + '_ARKit'
+                    cmds.group(empty=True, name=grp)
+                    cmds.parent(grp, topGrp)
+
+                name = f"{mesh}_{shape}"
+                cmds.duplicate(mesh, name=name)
+                cmds.parent(name, meshGrps[mesh])
+                cmds.move(15 * allShapes.index(shape), 0, 0, name)
+
+    for grp in meshGrps.values():
+        cmds.move(15, 0, 0, grp)
+
+def exportSparseDeltas(path: str, meshTable: list | None = None, tolerance=1e-4, controlValue=10, storePath: str | None = None, encoding='float32', maxError=1e-3) -> dict:
+    """
+    ARKit 컨트롤 값을 하나씩 올리고 그 shape 를 사용하는 메쉬들의 버텍스를 읽어서
+    tolerance 보다 많이 움직인 버텍스의 (인덱스, delta) 만 path 에 저장한다.
+    meshTable 이 없으면 모든 메쉬를 읽고 움직인 버텍스가 없는 (메쉬, shape) 는 저장하지 않는다.
+    storePath 가 있으면 headless 평가용 deltaStore 파일도 저장한다.
+    encoding 이 float32 가 아니면 버텍스 위치 오차 maxError 안에서 delta 를 양자화한다.
+    """
+    if meshTable is None:
+        meshTable = [[mesh, allShapes] for mesh, group in meshGroups]
+
+    meshShapes = {mesh: set(shapes) for mesh, shapes in meshTable if shapes}
+    basePoints = {mesh: getMeshPoints(mesh) for mesh in meshShapes}
+
+    targets = {}
+    for shape in allShapes:
+        shapeMeshes = [mesh for mesh in meshShapes if shape in meshShapes[mesh]]
+        if not shapeMeshes:
+            continue
+
+        with posedShape(shape, controlValue):
+            for mesh in shapeMeshes:
+                indices, deltas = blendshapeDeltas.extractSparseDelta(basePoints[mesh], getMeshPoints(mesh), tolerance)
+
+                if len(indices):
+                    targets[(mesh, shape)] = (indices, deltas)
+
+    vertexCounts = {mesh: len(points) for mesh, points in basePoints.items()}
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    blendshapeDeltas.saveArchive(path, targets, vertexCounts, dict(meshGroups), tolerance, controlValue, basePoints, encoding, maxError)
+
+    if storePath:
+        deltaStore.writeStore(storePath, basePoints, targets, allShapes, dict(meshGroups), controlValue, encoding, maxError)
+
+    storedVertices = sum(len(indices) for indices, deltas in targets.values())
+    fullVertices = sum(vertexCounts[mesh] for mesh, shape in targets)
+    print(f'{len(targets)} targets, {storedVertices} / {fullVertices} vertices stored -> {path}')
+
+    return targets
+
+if exportMode == 'sparse':
+    exportSparseDeltas(deltaPath, storePath=storePath, encoding=deltaEncoding, maxError=maxDeltaError)
+else:
+    exportDuplicates()
@@ -0,0 +1,163 @@
+#-----------------------------------------
+# Blendshape symmetry
+# 메쉬의 좌우 대칭 버텍스 맵을 KD-tree 로 만들고 (토폴로지 해시로 디스크에 캐시)
+# sparse delta 를 반대쪽으로 미러하거나 대칭 타겟을 falloff 를 두고 Left / Right 로 나눈다. (maya 없이 사용 가능)
+#
+#   python blendshapeSymmetry.py akali_arkit52_deltas.npz --out mirrored.npz [--source Left] [--split mouthClose ...]
+#-----------------------------------------
+
+import os
+import hashlib
+import numpy as np
+from scipy.spatial import cKDTree
+import blendshapeDeltas
+
+SIDES = ('Left', 'Right')
+
+def getTopologyHash(basePoints, polygonCounts=None, polygonConnects=None, digits=4) -> str:
+    """버텍스 수, 반올림한 기본 위치, (있으면) 면 구성으로 만든 해시"""
+    sha = hashlib.sha1()
+    points = np.round(np.asarray(basePoints, dtype=np.float64), digits) + 0.0
+    sha.update(np.int64(len(points)).tobytes())
+    sha.update(points.tobytes())
+
+    for array in (polygonCounts, polygonConnects):
+        if array is not None:
+            sha.update(np.asarray(array, dtype=np.int64).tobytes())
+
+    return sha.hexdigest()
+
+def buildSymmetryMap(basePoints, axis=0, tolerance=1e-3) -> np.ndarray:
+    """버텍스마다 axis 기준 반대쪽 버텍스 인덱스 (tolerance 안에 없으면 -1)"""
+    points = np.asarray(basePoints, dtype=np.float64)
+    mirrored = points.copy()
+    mirrored[:, axis] *= -1
+
+    distances, indices = cKDTree(points).query(mirrored, distance_upper_bound=tolerance)
+
+    return np.where(np.isfinite(distances), indices, -1).astype(np.int32)
+
+def getSymmetryMap(basePoints, cacheDir: str | None = None, axis=0, tolerance=1e-3, topologyHash: str | None = None) -> np.ndarray:
+    """cacheDir 에 {토폴로지 해시}_{axis}.npy 로 캐시된 대칭 맵을 읽거나 새로 만든다."""
+    if cacheDir is None:
+        return buildSymmetryMap(basePoints, axis, tolerance)
+
+    topologyHash = topologyHash or getTopologyHash(basePoints)
+    path = os.path.join(cacheDir, f'{topologyHash}_{axis}.npy')
+
+    if os.path.exists(path):
+        return np.load(path)
+
+    symmetryMap = buildSymmetryMap(basePoints, axis, tolerance)
+    os.makedirs(cacheDir, exist_ok=True)
+    np.save(path, symmetryMap)
+
+    return symmetryMap
+
+def mirrorDelta(indices, deltas, symmetryMap: np.ndarray, axis=0) -> tuple[np.ndarray, np.ndarray]:
+    """sparse delta 를 반대쪽 버텍스로 옮기고 axis 성분의 부호를 바꾼다. (대칭 버텍스가 없는 버텍스는 버린다)"""
+    mirroredIndices = symmetryMap[np.asarray(indices)]
+    valid = mirroredIndices >= 0
+
+    mirroredDeltas = np.array(deltas, dtype=np.float32)[valid]
+    mirroredDeltas[:, axis] *= -1
+    mirroredIndices = mirroredIndices[valid]
+
+    order = np.argsort(mirroredIndices)
+    return mirroredIndices[order].astype(np.int32), mirroredDeltas[order]
+
+def getSideWeights(basePoints, axis=0, falloff=1.0) -> np.ndarray:
+    """버텍스마다 +axis 쪽 (캐릭터 Left) weight. 중심선에서 falloff 폭 안에서 smoothstep 으로 0 -> 1"""
+    coordinates = np.asarray(basePoints, dtype=np.float64)[:, axis]
+
+    if falloff <= 0:
+        return np.where(coordinates > 0, 1.0, np.where(coordinates == 0, 0.5, 0.0)).astype(np.float32)
+
+    t = np.clip(coordinates / falloff + 0.5, 0.0, 1.0)
+    return (t * t * (3 - 2 * t)).astype(np.float32)
+
+def splitDelta(indices, deltas, basePoints, axis=0, falloff=1.0, tolerance=1e-4) -> dict:
+    """대칭 타겟을 {'Left': (indices, deltas), 'Right': (indices, deltas)} 로 나눈다. 두 쪽의 합은 원래 delta 와 같다."""
+    indices = np.asarray(indices)
+    deltas = np.asarray(deltas, dtype=np.float32)
+    leftWeights = getSideWeights(basePoints, axis, falloff)[indices]
+
+    result = {}
+    for side, weights in zip(SIDES, (leftWeights, 1 - leftWeights)):
+        sideDeltas = deltas * weights[:, None]
+        keep = np.einsum('ij,ij->i', sideDeltas, sideDeltas) > tolerance * tolerance
+        result[side] = (indices[keep].astype(np.int32), sideDeltas[keep])
+
+    return result
+
+def getSidePairs(shapes: list[str]) -> list[tuple[str, str]]:
+    """('eyeBlinkLeft', 'eyeBlinkRight') 처럼 Left / Right 로 끝나는 shape 쌍 (한쪽만 있어도 포함)"""
+    baseNames = [shape[:-len(side)] for shape in shapes for side in SIDES if shape.endswith(side)]
+    return [(baseName + 'Left', baseName + 'Right') for baseName in dict.fromkeys(baseNames)]
+
+def mirrorTargets(targets: dict, basePoints: dict, shapes: list[str], source='Left', cacheDir: str | None = None, axis=0, tolerance=1e-3) -> dict:
+    """
+    Left / Right 쌍마다 source 쪽 타겟을 미러해서 반대쪽 타겟을 만든다. (기존 반대쪽 타겟은 교체)
+    targets: {(mesh, shape): (indices, deltas)}, basePoints: {mesh: (N, 3)}
+    """
+    result = dict(targets)
+    symmetryMaps = {}
+
+    for left, right in getSidePairs(shapes):
+        sourceShape, targetShape = (left, right) if source == 'Left' else (right, left)
+
+        for mesh in basePoints:
+            if (mesh, sourceShape) not in targets:
+                result.pop((mesh, targetShape), None)
+                continue
+
+            if mesh not in symmetryMaps:
+                symmetryMaps[mesh] = getSymmetryMap(basePoints[mesh], cacheDir, axis, tolerance)
+
+            result[(mesh, targetShape)] = mirrorDelta(*targets[(mesh, sourceShape)], symmetryMaps[mesh], axis)
+
+    return result
+
+def splitTargets(targets: dict, basePoints: dict, splitShapes: list[str], axis=0, falloff=1.0) -> dict:
+    """splitShapes 의 타겟을 {shape}Left / {shape}Right 타겟으로 나눠서 추가한다."""
+    result = dict(targets)
+
+    for (mesh, shape), (indices, deltas) in targets.items():
+        if shape not in splitShapes:
+            continue
+
+        for side, sideTarget in splitDelta(indices, deltas, basePoints[mesh], axis, falloff).items():
+            if len(sideTarget[0]):
+                result[(mesh, shape + side)] = sideTarget
+
+    return result
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Mirror Left/Right blendshape deltas or split symmetric ones')
+    parser.add_argument('archive', help='.npz saved by blendshapeDeltas.saveArchive (with base points)')
+    parser.add_argument('--out', required=True, help='output .npz')
+    parser.add_argument('--source', choices=SIDES, help='mirror this side of every Left/Right pair to the other')
+    parser.add_argument('--split', nargs='*', default=[], help='symmetric shapes to split into <shape>Left / <shape>Right')
+    parser.add_argument('--falloff', type=float, default=1.0, help='split blend width across the center line')
+    parser.add_argument('--axis', type=int, default=0, help='mirror axis (0 = x)')
+    parser.add_argument('--tolerance', type=float, default=1e-3, help='max distance to the mirrored vertex')
+    parser.add_argument('--cache-dir', help='symmetry map cache (default: symmetry/ next to the archive)')
+    options = parser.parse_args()
+
+    archive = blendshapeDeltas.loadArchive(options.archive)
+    if not archive['basePoints']:
+        parser.error(f'{options.archive} has no base points')
+
+    cacheDir = options.cache_dir or os.path.join(os.path.dirname(os.path.abspath(options.archive)), 'symmetry')
+    targets = archive['targets']
+
+    if options.split:
+        targets = splitTargets(targets, archive['basePoints'], options.split, options.axis, options.falloff)
+
+    if options.source:
+        targets = mirrorTargets(targets, archive['basePoints'], archive['shapes'], options.source, cacheDir, options.axis, options.tolerance)
+
+    blendshapeDeltas.saveArchive(options.out, targets, archive['vertexCounts'], archive['baseMeshes'], archive['tolerance'], archive['controlValue'], archive['basePoints'])
+    print(f"{len(archive['targets'])} -> {len(targets)} targets -> {options.out}")
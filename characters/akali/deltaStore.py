@@ -0,0 +1,214 @@
+#-----------------------------------------
+# Blendshape delta store
+# 메쉬별 기본 버텍스 위치와 타겟별 sparse delta 를 memory-map 가능한 파일 하나로 저장하고
+# 여러 프레임의 weight 로 최종 버텍스 위치를 numpy 로 계산한다. (maya 없이 사용 가능)
+#
+# 파일 구조
+#   MAGIC (8 bytes) | header 길이 (uint64) | JSON header | 데이터 (ALIGNMENT 단위 정렬)
+#   header = {'version', 'shapes', 'controlValue', 'meshes': [{'name', 'baseMesh', 'vertexCount', 'basePoints'}],
+#             'targets': [{'mesh', 'shape', 'indices', 'deltas', 'scale'}]}
+#   배열 항목은 {'offset', 'dtype', 'shape'} (offset 은 데이터 시작 기준)
+#   deltas 는 blendshapeDeltas.encodeDeltas 로 양자화할 수 있다. (delta = 저장값 * scale)
+#
+# delta 는 컨트롤 값 controlValue 에서 측정한 값이며 weight 1 에 해당한다.
+#
+# headless 평가:
+#   python deltaStore.py akali_arkit52.deltas --weights clip.npy [--mesh Face_Main_Mesh [--out points.npy]]
+#   (weights 는 (프레임 수, shape 수) .npy 또는 첫 줄이 shape 이름인 .csv)
+#-----------------------------------------
+
+import json
+import struct
+import numpy as np
+import blendshapeDeltas
+
+MAGIC = b'AKDELTA1'
+FORMAT_VERSION = 1
+ALIGNMENT = 64
+
+def _align(offset: int) -> int:
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+def writeStore(path: str, basePoints: dict, targets: dict, shapes: list[str], baseMeshes: dict | None = None, controlValue=10.0, encoding='float32', maxError=1e-3):
+    """
+    basePoints : {mesh: (N, 3)}
+    targets    : {(mesh, shape): (indices, deltas)}
+    shapes     : weight 열 순서가 되는 shape 이름 목록 (목록에 없는 shape 의 타겟은 저장하지 않는다)
+    encoding   : delta 양자화 방식 (blendshapeDeltas.ENCODINGS), maxError 는 허용하는 버텍스 위치 오차
+    """
+    baseMeshes = baseMeshes or {}
+    blobs = []
+    dataSize = 0
+
+    def addArray(array: np.ndarray) -> dict:
+        nonlocal dataSize
+        offset = _align(dataSize)
+        blobs.append((offset, array))
+        dataSize = offset + array.nbytes
+        return {'offset': offset, 'dtype': array.dtype.str, 'shape': list(array.shape)}
+
+    header = {'version': FORMAT_VERSION, 'shapes': list(shapes), 'controlValue': controlValue, 'meshes': [], 'targets': []}
+
+    for mesh, points in basePoints.items():
+        points = np.ascontiguousarray(points, dtype=np.float32)
+        header['meshes'].append({'name': mesh, 'baseMesh': baseMeshes.get(mesh, mesh), 'vertexCount': len(points), 'basePoints': addArray(points)})
+
+    for (mesh, shape), (indices, deltas) in targets.items():
+        if shape not in shapes:
+            continue
+
+        data, scale = blendshapeDeltas.encodeDeltas(deltas, encoding, maxError)
+        header['targets'].append({
+            'mesh': mesh,
+            'shape': shape,
+            'indices': addArray(np.ascontiguousarray(indices, dtype=np.int32)),
+            'deltas': addArray(np.ascontiguousarray(data)),
+            'scale': scale,
+        })
+
+    headerBytes = json.dumps(header).encode('utf-8')
+    dataStart = _align(len(MAGIC) + 8 + len(headerBytes))
+
+    with open(path, 'wb') as f:
+        f.write(MAGIC)
+        f.write(struct.pack('<Q', len(headerBytes)))
+        f.write(headerBytes)
+
+        for offset, array in blobs:
+            f.seek(dataStart + offset)
+            f.write(array.tobytes())
+
+        # 마지막 배열이 비어 있어도 파일 길이를 맞춘다
+        f.truncate(dataStart + dataSize)
+
+def convertArchive(archivePath: str, storePath: str, shapes: list[str] | None = None, encoding='float32', maxError=1e-3):
+    """blendshapeDeltas 의 .npz (basePoints 포함) 를 store 로 변환한다."""
+    archive = blendshapeDeltas.loadArchive(archivePath)
+    if not archive['basePoints']:
+        raise ValueError(f'{archivePath} has no base points')
+
+    writeStore(storePath, archive['basePoints'], archive['targets'], shapes or archive['shapes'], archive['baseMeshes'], archive['controlValue'], encoding, maxError)
+
+def openStore(path: str) -> dict:
+    """
+    파일을 memory-map 해서 {'shapes', 'controlValue', 'meshes': {mesh: {...}}} 로 연다.
+    meshes[mesh] = {'baseMesh', 'basePoints', 'targets': {shape: (indices, 저장된 deltas)}, 'scales': {shape: scale}}
+    (배열은 memmap view, 복원된 delta 는 getTargetDeltas 사용)
+    """
+    with open(path, 'rb') as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f'{path} is not a delta store')
+
+        headerLength = struct.unpack('<Q', f.read(8))[0]
+        header = json.loads(f.read(headerLength).decode('utf-8'))
+
+    raw = np.memmap(path, dtype=np.uint8, mode='r')
+    dataStart = _align(len(MAGIC) + 8 + headerLength)
+
+    def getArray(entry: dict) -> np.ndarray:
+        dtype = np.dtype(entry['dtype'])
+        count = int(np.prod(entry['shape']))
+        start = dataStart + entry['offset']
+        return raw[start:start + count * dtype.itemsize].view(dtype).reshape(entry['shape'])
+
+    meshes = {}
+    for entry in header['meshes']:
+        meshes[entry['name']] = {'baseMesh': entry['baseMesh'], 'basePoints': getArray(entry['basePoints']), 'targets': {}, 'scales': {}}
+
+    for entry in header['targets']:
+        meshes[entry['mesh']]['targets'][entry['shape']] = (getArray(entry['indices']), getArray(entry['deltas']))
+        meshes[entry['mesh']]['scales'][entry['shape']] = entry.get('scale', 1.0)
+
+    return {'shapes': header['shapes'], 'controlValue': header['controlValue'], 'meshes': meshes}
+
+def getTargetDeltas(store: dict, mesh: str, shape: str) -> tuple[np.ndarray, np.ndarray]:
+    """(indices, float32 delta)"""
+    meshData = store['meshes'][mesh]
+    indices, data = meshData['targets'][shape]
+
+    return indices, blendshapeDeltas.decodeDeltas(data, meshData['scales'][shape])
+
+def getDeltaMatrix(store: dict, mesh: str) -> tuple[np.ndarray, np.ndarray]:
+    """
+    mesh 의 타겟을 (shape 수, 움직이는 버텍스 수 * 3) 행렬로 모은다.
+    반환: (움직이는 버텍스 인덱스, 행렬). store 안에 캐시된다.
+    """
+    meshData = store['meshes'][mesh]
+
+    if 'deltaMatrix' not in meshData:
+        # weight 열이 없는 shape 는 평가에 쓰이지 않는다
+        shapes = [shape for shape in meshData['targets'] if shape in store['shapes']]
+        indices = np.unique(np.concatenate([meshData['targets'][shape][0] for shape in shapes])) if shapes else np.zeros(0, dtype=np.int32)
+
+        matrix = np.zeros((len(store['shapes']), len(indices), 3), dtype=np.float32)
+        for shape in shapes:
+            shapeIndices, deltas = getTargetDeltas(store, mesh, shape)
+            matrix[store['shapes'].index(shape), np.searchsorted(indices, shapeIndices)] = deltas
+
+        meshData['deltaMatrix'] = (indices, matrix.reshape(len(store['shapes']), -1))
+
+    return meshData['deltaMatrix']
+
+def evaluate(store: dict, mesh: str, weights) -> np.ndarray:
+    """
+    weights (프레임 수, shape 수) 로 mesh 의 최종 버텍스 위치 (프레임 수, N, 3) 를 구한다.
+    weight 열 순서는 store['shapes'] 이다.
+    """
+    weights = np.atleast_2d(np.asarray(weights, dtype=np.float32))
+    indices, matrix = getDeltaMatrix(store, mesh)
+
+    points = np.repeat(store['meshes'][mesh]['basePoints'][None], len(weights), axis=0)
+    points[:, indices] += (weights @ matrix).reshape(len(weights), len(indices), 3)
+
+    return points
+
+def iterEvaluate(store: dict, mesh: str, weights, chunkSize=256):
+    """긴 클립용. chunkSize 프레임씩 (시작 프레임, 위치) 를 돌려준다."""
+    weights = np.atleast_2d(np.asarray(weights, dtype=np.float32))
+
+    for start in range(0, len(weights), chunkSize):
+        yield start, evaluate(store, mesh, weights[start:start + chunkSize])
+
+def loadWeights(path: str, shapes: list[str]) -> np.ndarray:
+    """.npy (프레임 수, shape 수) 또는 첫 줄이 shape 이름인 .csv 를 shapes 순서의 weight 로 읽는다."""
+    if not path.endswith('.csv'):
+        return np.load(path).astype(np.float32)
+
+    with open(path, 'r', encoding='utf-8') as f:
+        columns = f.readline().strip().split(',')
+
+    values = np.loadtxt(path, delimiter=',', skiprows=1, dtype=np.float32, ndmin=2)
+    weights = np.zeros((len(values), len(shapes)), dtype=np.float32)
+
+    for column, name in enumerate(columns):
+        if name in shapes:
+            weights[:, shapes.index(name)] = values[:, column]
+
+    return weights
+
+if __name__ == '__main__':
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description='Evaluate blendshape weights against a delta store without Maya')
+    parser.add_argument('store', help='delta store path')
+    parser.add_argument('--weights', required=True, help='(frames, shapes) .npy or .csv with a shape name header')
+    parser.add_argument('--mesh', action='append', help='meshes to evaluate (default: all)')
+    parser.add_argument('--out', help='save the points to this .npy (needs a single --mesh)')
+    options = parser.parse_args()
+
+    if options.out and len(options.mesh or []) != 1:
+        parser.error('--out needs exactly one --mesh')
+
+    store = openStore(options.store)
+    weights = loadWeights(options.weights, store['shapes'])
+
+    for mesh in options.mesh or list(store['meshes']):
+        startTime = time.perf_counter()
+        chunks = [points if options.out else None for start, points in iterEvaluate(store, mesh, weights)]
+        elapsed = time.perf_counter() - startTime
+
+        print(f"{mesh}: {len(weights)} frames x {store['meshes'][mesh]['basePoints'].shape[0]} vertices in {elapsed * 1000:.1f} ms")
+
+        if options.out:
+            np.save(options.out, np.concatenate(chunks))
@@ -0,0 +1,375 @@
+#-----------------------------------------
+# SDK mirror
+# set driven key (animCurveUA / UL / UU) 네트워크를 좌우 반전해서 한 번에 복사한다.
+# 씬의 SDK 커브를 한 번 훑어서 이름 / driver 인덱스를 만들고, 규칙 (MIRROR_RULES) 으로 반대쪽 driver / driven 을 찾은 다음
+# 커브 생성과 연결은 MDGModifier 하나로, 키는 커브마다 한 번에 넣는다. (createSdkCurves)
+#
+#   sdkMirror.mirrorSdkCurves(['hand_l_ctrl'])                                 # 컨트롤러의 모든 SDK
+#   sdkMirror.mirrorSdkCurves(['hand_l_ctrl'], attributes=['pose_fist'], negateAttrs=['translateX'])
+#
+# blendWeighted (한 어트리뷰트에 SDK 가 여러 개) 와 unitConversion 은 따라가서 최종 어트리뷰트를 driven 으로 본다.
+# 만들 때는 한 어트리뷰트에 커브가 여러 개거나 이미 SDK 커브가 있으면 blendWeighted 를 만들고, 기존 blendWeighted 가 있으면 거기에 붙인다.
+# 커브 삭제 / 생성 modifier 와 키 변경은 apiUndo 로 undo chunk 하나에 기록되어 Ctrl+Z 한 번에 되돌려진다.
+#-----------------------------------------
+
+import maya.cmds as cmds
+import maya.api.OpenMaya as om
+import maya.api.OpenMayaAnim as oma
+import apiUndo
+
+SDK_CURVE_TYPES = {
+    'animCurveUA': oma.MFnAnimCurve.kAnimCurveUA,
+    'animCurveUL': oma.MFnAnimCurve.kAnimCurveUL,
+    'animCurveUU': oma.MFnAnimCurve.kAnimCurveUU,
+}
+
+# (원본 쪽, 반대쪽) 이름 토큰. 앞에서부터 처음 맞는 규칙 하나만 쓴다.
+MIRROR_RULES = [('_l_', '_r_'), ('_L_', '_R_'), ('Left', 'Right'), ('left', 'right')]
+
+def mirrorName(name: str, rules=MIRROR_RULES) -> str | None:
+    """규칙으로 바꾼 이름 (맞는 규칙이 없으면 None)"""
+    for source, target in rules:
+        if source in name:
+            return name.replace(source, target)
+
+    return None
+
+def _getNodeName(mobject: om.MObject) -> str:
+    return om.MFnDependencyNode(mobject).name()
+
+def _getPlugName(plug: om.MPlug) -> tuple[str, str]:
+    return _getNodeName(plug.node()), plug.partialName(useLongNames=True)
+
+def _getDrivenPlugs(outputPlug: om.MPlug) -> list[om.MPlug]:
+    """blendWeighted / unitConversion 을 지나 최종적으로 연결된 plug 들"""
+    drivenPlugs = []
+
+    for destination in outputPlug.destinations():
+        node = destination.node()
+
+        if node.hasFn(om.MFn.kBlendWeighted) or node.hasFn(om.MFn.kUnitConversion):
+            fnNode = om.MFnDependencyNode(node)
+            drivenPlugs += _getDrivenPlugs(fnNode.findPlug('output', False))
+        else:
+            drivenPlugs.append(destination)
+
+    return drivenPlugs
+
+def buildCurveIndex() -> dict:
+    """
+    씬의 SDK 커브를 한 번 훑는다.
+    {'names': {커브 이름: MObject}, 'byDriver': {(driver 노드, 어트리뷰트): [커브 정보]}}
+    커브 정보 = {'name', 'object', 'type', 'driver': (노드, 어트리뷰트), 'driven': [(노드, 어트리뷰트)]}
+    """
+    index = {'names': {}, 'byDriver': {}}
+    it = om.MItDependencyNodes(om.MFn.kAnimCurve)
+
+    while not it.isDone():
+        mobject = it.thisNode()
+        fnNode = om.MFnDependencyNode(mobject)
+        it.next()
+
+        if fnNode.typeName not in SDK_CURVE_TYPES:
+            continue
+
+        index['names'][fnNode.name()] = mobject
+
+        source = fnNode.findPlug('input', False).source()
+        if source.isNull:
+            continue
+
+        driver = _getPlugName(source)
+        index['byDriver'].setdefault(driver, []).append({
+            'name': fnNode.name(),
+            'object': mobject,
+            'type': fnNode.typeName,
+            'driver': driver,
+            'driven': [_getPlugName(plug) for plug in _getDrivenPlugs(fnNode.findPlug('output', False))],
+        })
+
+    return index
+
+def readCurve(mobject: om.MObject) -> dict:
+    """커브의 키, tangent 타입 / 방향, weight 여부, infinity 를 dict 로 읽는다."""
+    fnCurve = oma.MFnAnimCurve(mobject)
+    count = fnCurve.numKeys
+
+    return {
+        'inputs': [fnCurve.unitlessInput(i) for i in range(count)],
+        'values': [fnCurve.value(i) for i in range(count)],
+        'inTangentTypes': [fnCurve.inTangentType(i) for i in range(count)],
+        'outTangentTypes': [fnCurve.outTangentType(i) for i in range(count)],
+        'inTangents': [list(fnCurve.getTangentXY(i, True)) for i in range(count)],
+        'outTangents': [list(fnCurve.getTangentXY(i, False)) for i in range(count)],
+        'tangentsLocked': [fnCurve.tangentsLocked(i) for i in range(count)],
+        'weighted': fnCurve.isWeighted,
+        'preInfinity': fnCurve.preInfinityType,
+        'postInfinity': fnCurve.postInfinityType,
+    }
+
+def writeCurve(mobject: om.MObject, data: dict, negate=False, change: oma.MAnimCurveChange | None = None):
+    """
+    readCurve 의 dict 로 빈 커브에 키를 한 번에 넣는다. negate 면 값과 tangent 의 y 를 뒤집는다.
+    change 를 주면 키 변경을 기록해서 undo / redo 할 수 있다.
+    """
+    fnCurve = oma.MFnAnimCurve(mobject)
+    sign = -1.0 if negate else 1.0
+
+    fnCurve.setIsWeighted(data['weighted'], change)
+    fnCurve.addKeysWithUnitlessInput(om.MDoubleArray(data['inputs']), om.MDoubleArray([value * sign for value in data['values']]),
+                                     oma.MFnAnimCurve.kTangentGlobal, oma.MFnAnimCurve.kTangentGlobal, False, change)
+
+    # 방향을 먼저 넣고 타입을 되돌린다 (setTangent 는 타입을 fixed 로 바꾼다)
+    for i in range(len(data['inputs'])):
+        fnCurve.setTangentsLocked(i, False, change)
+        fnCurve.setTangent(i, data['inTangents'][i][0], data['inTangents'][i][1] * sign, True, change, False)
+        fnCurve.setTangent(i, data['outTangents'][i][0], data['outTangents'][i][1] * sign, False, change, False)
+        fnCurve.setInTangentType(i, data['inTangentTypes'][i], change)
+        fnCurve.setOutTangentType(i, data['outTangentTypes'][i], change)
+        fnCurve.setTangentsLocked(i, data['tangentsLocked'][i], change)
+
+    fnCurve.setPreInfinityType(data['preInfinity'], change)
+    fnCurve.setPostInfinityType(data['postInfinity'], change)
+
+def findPlug(node: str, attr: str) -> om.MPlug | None:
+    selList = om.MSelectionList()
+
+    try:
+        selList.add(f'{node}.{attr}')
+    except RuntimeError:
+        return None
+
+    return selList.getPlug(0)
+
+def _getSource(plug: om.MPlug) -> om.MPlug:
+    """plug 에 (unitConversion 을 지나) 연결된 source plug (없으면 null plug)"""
+    source = plug.source()
+
+    if not source.isNull and source.node().hasFn(om.MFn.kUnitConversion):
+        conversionSource = om.MFnDependencyNode(source.node()).findPlug('input', False).source()
+        source = conversionSource if not conversionSource.isNull else source
+
+    return source
+
+def _getBlendWeighted(plug: om.MPlug) -> om.MObject | None:
+    """plug 에 (unitConversion 을 지나) 연결된 blendWeighted"""
+    source = _getSource(plug)
+    return source.node() if not source.isNull and source.node().hasFn(om.MFn.kBlendWeighted) else None
+
+def _getSdkCurveOutput(plug: om.MPlug) -> om.MPlug | None:
+    """plug 에 (unitConversion 을 지나) 바로 연결된 SDK 커브의 output"""
+    source = _getSource(plug)
+    return source if not source.isNull and om.MFnDependencyNode(source.node()).typeName in SDK_CURVE_TYPES else None
+
+def getDrivenInputs(drivenNames: list[tuple[str, str]], modifier: om.MDGModifier) -> list[om.MPlug | None]:
+    """
+    새 SDK 커브 output 을 연결할 plug 를 drivenNames 순서대로 돌려준다.
+    blendWeighted 가 있으면 비어 있는 다음 input[i], 입력이 없으면 커브가 하나일 때는 그 plug,
+    여러 개면 modifier 로 blendWeighted 를 만들어 끼운다.
+    SDK 커브 하나가 바로 연결돼 있으면 setDrivenKeyframe 처럼 blendWeighted 를 끼우고 그 커브를 input[0] 으로 옮긴다.
+    다른 노드가 연결돼 있으면 None
+    """
+    inputs = {}
+
+    for name in dict.fromkeys(drivenNames):
+        count = drivenNames.count(name)
+        plug = findPlug(*name)
+        blendWeighted = _getBlendWeighted(plug)
+        curveOutput = _getSdkCurveOutput(plug) if blendWeighted is None else None
+
+        if blendWeighted is None and curveOutput is None and not plug.source().isNull:
+            inputs[name] = [None] * count
+            continue
+
+        if blendWeighted is None and curveOutput is None and count == 1:
+            inputs[name] = [plug]
+            continue
+
+        if blendWeighted is None:
+            blendWeighted = modifier.createNode('blendWeighted')
+            start = 0
+
+            if curveOutput is not None:
+                source = plug.source()
+                modifier.disconnect(source, plug)
+                if source.node().hasFn(om.MFn.kUnitConversion):
+                    modifier.deleteNode(source.node())
+
+                modifier.connect(curveOutput, om.MFnDependencyNode(blendWeighted).findPlug('input', False).elementByLogicalIndex(0))
+                start = 1
+
+            modifier.connect(om.MFnDependencyNode(blendWeighted).findPlug('output', False), plug)
+        else:
+            indices = om.MFnDependencyNode(blendWeighted).findPlug('input', False).getExistingArrayAttributeIndices()
+            start = max(indices) + 1 if indices else 0
+
+        inputPlug = om.MFnDependencyNode(blendWeighted).findPlug('input', False)
+        inputs[name] = [inputPlug.elementByLogicalIndex(start + i) for i in range(count)]
+
+    return [inputs[name].pop(0) for name in drivenNames]
+
+def deleteSdkCurves(curves: list[om.MObject], modifier: om.MDGModifier):
+    """
+    커브 삭제를 modifier 에 넣는다.
+    커브가 연결된 blendWeighted 의 input[i] / weight[i] 도 지워야 마지막 값이 남아 계속 더해지지 않는다.
+    """
+    for mobject in curves:
+        for plug in om.MFnDependencyNode(mobject).findPlug('output', False).destinations():
+            node = plug.node()
+            if node.hasFn(om.MFn.kUnitConversion):
+                plug = next(iter(om.MFnDependencyNode(node).findPlug('output', False).destinations()), plug)
+                node = plug.node()
+
+            if not node.hasFn(om.MFn.kBlendWeighted) or not plug.isElement:
+                continue
+
+            fnNode = om.MFnDependencyNode(node)
+            modifier.removeMultiInstance(plug, True)
+            weightPlug = fnNode.findPlug('weight', False)
+            if plug.logicalIndex() in weightPlug.getExistingArrayAttributeIndices():
+                modifier.removeMultiInstance(weightPlug.elementByLogicalIndex(plug.logicalIndex()), True)
+
+        modifier.deleteNode(mobject)
+
+def createSdkCurves(specs: list[dict]) -> tuple[list[str], list[tuple[str, str]]]:
+    """
+    specs = [{'name', 'type', 'driver': MPlug, 'driven': [(노드, 어트리뷰트)], 'data': readCurve dict, 'negate'}]
+    커브 생성과 driver / driven 연결은 MDGModifier 하나로 하고, 키는 커브마다 한 번에 넣는다.
+    modifier 와 키 변경은 apiUndo 로 undo 큐에 기록된다.
+    반환: (만든 커브 이름, [(건너뛴 이름, 이유)])
+    """
+    modifier = om.MDGModifier()
+    drivenInputs = iter(getDrivenInputs([name for spec in specs for name in spec['driven']], modifier))
+    fnCurve = oma.MFnAnimCurve()
+    created = []
+    skipped = []
+
+    for spec in specs:
+        plugs = [next(drivenInputs) for name in spec['driven']]
+
+        if any(plug is None for plug in plugs):
+            skipped.append((spec['name'], 'driven attribute has another input'))
+            continue
+
+        mobject = fnCurve.create(SDK_CURVE_TYPES[spec['type']], modifier)
+        modifier.renameNode(mobject, spec['name'])
+
+        fnNode = om.MFnDependencyNode(mobject)
+        modifier.connect(spec['driver'], fnNode.findPlug('input', False))
+        for plug in plugs:
+            modifier.connect(fnNode.findPlug('output', False), plug)
+
+        created.append((mobject, spec))
+
+    modifier.doIt()
+
+    # 키를 넣다 실패하면 만든 커브와 blendWeighted 를 남기지 않는다
+    change = oma.MAnimCurveChange()
+    try:
+        for mobject, spec in created:
+            writeCurve(mobject, spec['data'], spec.get('negate', False), change)
+    except:
+        change.undoIt()
+        modifier.undoIt()
+        raise
+
+    def undo():
+        change.undoIt()
+        modifier.undoIt()
+
+    def redo():
+        modifier.doIt()
+        change.redoIt()
+
+    apiUndo.commit(undo, redo)
+
+    return [_getNodeName(mobject) for mobject, spec in created], skipped
+
+def resolveMirrorTargets(curves: list[dict], index: dict, rules=MIRROR_RULES, replace=False) -> tuple[list[dict], dict]:
+    """
+    커브마다 반대쪽 커브 이름, driver, driven 을 찾는다.
+    반환: (대상 목록 [{'curve', 'name', 'driver': MPlug, 'driven': [(노드, 어트리뷰트)]}], 결과 {'skipped': [...]})
+    """
+    targets = []
+    results = {'skipped': []}
+
+    for curve in curves:
+        targetName = mirrorName(curve['name'], rules)
+        drivenNames = [(mirrorName(node, rules), attr) for node, attr in curve['driven']]
+
+        # driver 는 좌우 토큰이 없으면 (가운데 컨트롤러) 그대로 쓴다
+        driverNode = mirrorName(curve['driver'][0], rules) or curve['driver'][0]
+        driverPlug = findPlug(driverNode, curve['driver'][1])
+
+        if not targetName or not drivenNames or any(node is None for node, attr in drivenNames):
+            results['skipped'].append((curve['name'], 'no mirror token'))
+        elif targetName in index['names'] and not replace:
+            results['skipped'].append((curve['name'], f'{targetName} exists'))
+        elif driverPlug is None:
+            results['skipped'].append((curve['name'], f"{driverNode}.{curve['driver'][1]} missing"))
+        elif any(findPlug(node, attr) is None for node, attr in drivenNames):
+            results['skipped'].append((curve['name'], 'mirrored driven attribute missing'))
+        else:
+            targets.append({'curve': curve, 'name': targetName, 'driver': driverPlug, 'driven': drivenNames})
+
+    return targets, results
+
+def mirrorSdkCurves(controllers: list[str] | None = None, attributes: list[str] | None = None, rules=MIRROR_RULES, negateAttrs=(), replace=False, verbose=True) -> dict:
+    """
+    controllers 의 attributes (없으면 SDK 를 구동하는 모든 어트리뷰트) 로 구동되는 SDK 커브를 반대쪽에 만든다.
+    negateAttrs: 반대쪽 값의 부호를 바꿀 driven 어트리뷰트 (예: translateX)
+    replace: 반대쪽 커브가 이미 있으면 지우고 다시 만든다. (False 면 건너뜀)
+    반환: {'created': [...], 'skipped': [(커브, 이유)]}
+    """
+    controllers = controllers or cmds.ls(selection=True)
+    if not controllers:
+        cmds.warning('컨트롤러를 먼저 선택하세요.')
+        return {'created': [], 'skipped': []}
+
+    index = buildCurveIndex()
+    curves = [curve for (node, attr), driverCurves in index['byDriver'].items()
+              if node in controllers and (attributes is None or attr in attributes)
+              for curve in driverCurves]
+
+    targets, results = resolveMirrorTargets(curves, index, rules, replace)
+
+    cmds.undoInfo(openChunk=True, chunkName='mirrorSdkCurves')
+
+    try:
+        results['created'], skipped = _replaceSdkCurves(targets, index, negateAttrs)
+    finally:
+        cmds.undoInfo(closeChunk=True)
+
+    results['skipped'] += skipped
+
+    if verbose:
+        for target in targets:
+            if target['name'] in results['created']:
+                print(f"  [OK] {target['curve']['name']}  →  {target['name']}  →  {', '.join(f'{node}.{attr}' for node, attr in target['driven'])}")
+
+    print(f"[mirrorSdkCurves] {len(curves)} curves: {len(results['created'])} created, {len(results['skipped'])} skipped")
+    if verbose:
+        for name, reason in results['skipped']:
+            print(f'  [SKIP] {name} - {reason}')
+
+    return results
+
+def _replaceSdkCurves(targets: list[dict], index: dict, negateAttrs) -> tuple[list[str], list[tuple[str, str]]]:
+    # 바꿀 커브를 먼저 지워야 blendWeighted / driven 입력이 비워진다
+    oldCurves = [index['names'][target['name']] for target in targets if target['name'] in index['names']]
+    if oldCurves:
+        modifier = om.MDGModifier()
+        deleteSdkCurves(oldCurves, modifier)
+        modifier.doIt()
+        apiUndo.commitModifier(modifier)
+
+    specs = [{
+        'name': target['name'],
+        'type': target['curve']['type'],
+        'driver': target['driver'],
+        'driven': target['driven'],
+        'data': readCurve(target['curve']['object']),
+        'negate': any(attr in negateAttrs for node, attr in target['driven']),
+    } for target in targets]
+
+    return createSdkCurves(specs)
@@ -0,0 +1,185 @@
+#-----------------------------------------
+# SDK pose library
+# 컨트롤러가 구동하는 set driven key 커브 (pose_fist 같은 포즈) 를 JSON 파일로 내보내고 다시 만든다.
+# 파일은 커브마다 driver / driven plug 과 한 줄에 키 하나씩 적어서 diff 와 버전 관리가 가능하다.
+#
+#   sdkPoseLibrary.exportPoses('D:/rig/akali_hand_poses.json', ['hand_l_ctrl', 'hand_r_ctrl'])
+#   sdkPoseLibrary.importPoses('D:/rig/akali_hand_poses.json', replace=True)
+#
+# 가져올 때 커브 생성과 연결은 MDGModifier 하나로 한다. (sdkMirror.createSdkCurves)
+# 커브 삭제 / 생성은 apiUndo 로 undo chunk 하나에 기록되고, 바꾸다 실패하면 그 chunk 를 undo 해서 기존 커브를 되살린다.
+#-----------------------------------------
+
+import sys
+import maya.mel as mel
+
+modulePath = mel.eval('getenv "MAYA_MY_SCRIPT_PATH"')
+if modulePath not in sys.path:
+    sys.path.append(modulePath)
+
+import json
+import importlib
+import maya.cmds as cmds
+import maya.api.OpenMaya as om
+import maya.api.OpenMayaAnim as oma
+import apiUndo
+import sdkMirror
+
+importlib.reload(apiUndo)
+importlib.reload(sdkMirror)
+
+FORMAT_VERSION = 1
+IMPORT_CHUNK_NAME = 'importPoses'
+
+TANGENT_TYPES = {name: getattr(oma.MFnAnimCurve, 'kTangent' + name[0].upper() + name[1:]) for name in
+                 ['global', 'fixed', 'linear', 'flat', 'smooth', 'step', 'slow', 'fast', 'clamped', 'plateau', 'stepNext', 'auto']
+                 if hasattr(oma.MFnAnimCurve, 'kTangent' + name[0].upper() + name[1:])}
+INFINITY_TYPES = {name: getattr(oma.MFnAnimCurve, 'k' + name[0].upper() + name[1:]) for name in
+                  ['constant', 'linear', 'cycle', 'cycleRelative', 'oscillate']}
+
+def _getName(value: int, types: dict, curveName: str) -> str:
+    for name, typeValue in types.items():
+        if typeValue == value:
+            return name
+
+    raise ValueError(f'{curveName}: unsupported tangent / infinity type {value}')
+
+def curveToEntry(curve: dict) -> dict:
+    """sdkMirror.buildCurveIndex 의 커브 정보를 파일 항목으로 바꾼다. 키 = [input, value, in 타입, out 타입, inX, inY, outX, outY, 잠금]"""
+    data = sdkMirror.readCurve(curve['object'])
+
+    return {
+        'name': curve['name'],
+        'type': curve['type'],
+        'driver': '.'.join(curve['driver']),
+        'driven': ['.'.join(name) for name in curve['driven']],
+        'weighted': data['weighted'],
+        'preInfinity': _getName(data['preInfinity'], INFINITY_TYPES, curve['name']),
+        'postInfinity': _getName(data['postInfinity'], INFINITY_TYPES, curve['name']),
+        'keys': [[data['inputs'][i], data['values'][i],
+                  _getName(data['inTangentTypes'][i], TANGENT_TYPES, curve['name']), _getName(data['outTangentTypes'][i], TANGENT_TYPES, curve['name']),
+                  *data['inTangents'][i], *data['outTangents'][i], data['tangentsLocked'][i]]
+                 for i in range(len(data['inputs']))],
+    }
+
+def entryToCurveData(entry: dict) -> dict:
+    """파일 항목을 sdkMirror.writeCurve 가 받는 dict 로 바꾼다."""
+    keys = entry['keys']
+
+    return {
+        'inputs': [key[0] for key in keys],
+        'values': [key[1] for key in keys],
+        'inTangentTypes': [TANGENT_TYPES[key[2]] for key in keys],
+        'outTangentTypes': [TANGENT_TYPES[key[3]] for key in keys],
+        'inTangents': [key[4:6] for key in keys],
+        'outTangents': [key[6:8] for key in keys],
+        'tangentsLocked': [key[8] for key in keys],
+        'weighted': entry['weighted'],
+        'preInfinity': INFINITY_TYPES[entry['preInfinity']],
+        'postInfinity': INFINITY_TYPES[entry['postInfinity']],
+    }
+
+def formatLibrary(entries: list[dict]) -> str:
+    """커브 하나에 헤더 한 줄, 키마다 한 줄인 JSON"""
+    lines = ['{', f'  "version": {FORMAT_VERSION},', '  "curves": [']
+
+    for i, entry in enumerate(entries):
+        header = json.dumps({key: value for key, value in entry.items() if key != 'keys'})
+        keys = ',\n'.join(f'      {json.dumps(key)}' for key in entry['keys'])
+        comma = ',' if i < len(entries) - 1 else ''
+        lines.append(f'    {header[:-1]}, "keys": [\n{keys}\n    ]}}{comma}')
+
+    lines += ['  ]', '}']
+    return '\n'.join(lines) + '\n'
+
+def exportPoses(path: str, controllers: list[str] | None = None, attributes: list[str] | None = None) -> list[dict]:
+    """controllers 의 attributes (없으면 모두) 가 구동하는 SDK 커브를 path 에 저장한다."""
+    controllers = controllers or cmds.ls(selection=True)
+    if not controllers:
+        cmds.warning('컨트롤러를 먼저 선택하세요.')
+        return []
+
+    index = sdkMirror.buildCurveIndex()
+    entries = [curveToEntry(curve) for (node, attr), curves in sorted(index['byDriver'].items())
+               if node in controllers and (attributes is None or attr in attributes)
+               for curve in sorted(curves, key=lambda curve: curve['name'])]
+
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(formatLibrary(entries))
+
+    print(f'[exportPoses] {len(entries)} curves -> {path}')
+    return entries
+
+def importPoses(path: str, attributes: list[str] | None = None, namespace='', replace=False, verbose=True) -> dict:
+    """
+    path 의 SDK 커브를 다시 만든다. attributes 를 주면 그 driver 어트리뷰트의 커브만 만든다.
+    namespace: driver / driven 노드 이름 앞에 붙일 namespace (예: 'akali:')
+    replace: 같은 이름의 커브가 있으면 지우고 다시 만든다. (False 면 건너뜀)
+    반환: {'created': [...], 'skipped': [(커브, 이유)]}
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        library = json.load(f)
+
+    if library.get('version') != FORMAT_VERSION:
+        raise ValueError(f"{path}: unsupported pose library version {library.get('version')}")
+
+    index = sdkMirror.buildCurveIndex()
+    results = {'created': [], 'skipped': []}
+    specs = []
+
+    for entry in library['curves']:
+        driverNode, driverAttr = entry['driver'].split('.', 1)
+        if attributes is not None and driverAttr not in attributes:
+            continue
+
+        driverPlug = sdkMirror.findPlug(namespace + driverNode, driverAttr)
+        driven = [(namespace + node, attr) for node, attr in (name.split('.', 1) for name in entry['driven'])]
+
+        if entry['name'] in index['names'] and not replace:
+            results['skipped'].append((entry['name'], 'exists'))
+        elif driverPlug is None:
+            results['skipped'].append((entry['name'], f"{namespace}{entry['driver']} missing"))
+        elif not driven or any(sdkMirror.findPlug(node, attr) is None for node, attr in driven):
+            results['skipped'].append((entry['name'], 'driven attribute missing'))
+        else:
+            specs.append({'name': entry['name'], 'type': entry['type'], 'driver': driverPlug, 'driven': driven, 'data': entryToCurveData(entry)})
+
+    try:
+        results['created'], skipped = _replaceCurves(specs, index)
+    except:
+        # 지운 커브와 새로 만든 커브 / blendWeighted 를 함께 되돌린다 (chunk 에 기록된 것이 없으면 이전 작업은 그대로)
+        if cmds.undoInfo(query=True, undoName=True) == IMPORT_CHUNK_NAME:
+            cmds.undo()
+        raise
+
+    results['skipped'] += skipped
+
+    print(f"[importPoses] {len(specs)} curves: {len(results['created'])} created, {len(results['skipped'])} skipped")
+    if verbose:
+        for name, reason in results['skipped']:
+            print(f'  [SKIP] {name} - {reason}')
+
+    return results
+
+def _replaceCurves(specs: list[dict], index: dict) -> tuple[list[str], list[tuple[str, str]]]:
+    """같은 이름의 커브를 지우고 specs 를 만든다. 삭제와 생성은 apiUndo 로 undo chunk 하나에 기록된다."""
+    cmds.undoInfo(openChunk=True, chunkName=IMPORT_CHUNK_NAME)
+
+    try:
+        # 바꿀 커브를 먼저 지워야 blendWeighted / driven 입력이 비워진다
+        oldCurves = [index['names'][spec['name']] for spec in specs if spec['name'] in index['names']]
+        if oldCurves:
+            modifier = om.MDGModifier()
+            sdkMirror.deleteSdkCurves(oldCurves, modifier)
+            modifier.doIt()
+            apiUndo.commitModifier(modifier)
+
+        created, skipped = sdkMirror.createSdkCurves(specs)
+
+        replaced = [name for name, reason in skipped if name in index['names']]
+        if replaced:
+            raise RuntimeError(f'importPoses: could not replace {replaced}, existing curves were restored')
+    finally:
+        cmds.undoInfo(closeChunk=True)
+
+    return created, skipped
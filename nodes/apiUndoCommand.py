@@ -0,0 +1,71 @@
+#-----------------------------------------
+# apiUndo command
+# MDGModifier / MFn 함수로 바로 실행한 작업은 undo 큐에 남지 않는다.
+# 작업을 실행한 뒤 되돌리기 / 다시 실행 함수를 큐에 넣고 apiUndo 명령을 호출하면
+# 그 명령이 undo 큐에 기록되어 Ctrl+Z / Ctrl+Shift+Z 때 해당 함수가 호출된다.
+#
+#   cmds.loadPlugin('apiUndoCommand.py', quiet=True)
+#   modifier.doIt()
+#   sys.modules['apiUndoCommandQueue'].pending.append((modifier.undoIt, modifier.doIt))
+#   cmds.apiUndo()
+#
+# 큐 모듈은 sys.modules 에 두어서 플러그인이 어떤 이름으로 import 되어도 호출하는 쪽과 같은 큐를 쓴다.
+#-----------------------------------------
+
+import sys
+import types
+import maya.api.OpenMaya as om
+
+def maya_useNewAPI():
+    pass
+
+COMMAND_NAME = 'apiUndo'
+QUEUE_MODULE = 'apiUndoCommandQueue'
+
+# 플러그인을 다시 로드해도 같은 큐를 쓴다
+queue = sys.modules.setdefault(QUEUE_MODULE, types.ModuleType(QUEUE_MODULE))
+if not hasattr(queue, 'pending'):
+    queue.pending = []
+
+class ApiUndoCommand(om.MPxCommand):
+    """이미 실행된 작업의 (undo, redo) 함수를 받아서 undo 큐에 기록한다."""
+
+    def __init__(self):
+        super().__init__()
+        self.undo = None
+        self.redo = None
+
+    @staticmethod
+    def creator():
+        return ApiUndoCommand()
+
+    def doIt(self, args):
+        if not queue.pending:
+            raise RuntimeError(f'{COMMAND_NAME}: nothing to record')
+
+        self.undo, self.redo = queue.pending.pop(0)
+
+    def undoIt(self):
+        self.undo()
+
+    def redoIt(self):
+        self.redo()
+
+    def isUndoable(self):
+        return True
+
+def initializePlugin(obj):
+    plugin: om.MFnPlugin = om.MFnPlugin(obj, 'Suyeon', '1.0', 'Any')
+
+    try:
+        plugin.registerCommand(COMMAND_NAME, ApiUndoCommand.creator)
+    except:
+        raise RuntimeError('Failed to register command')
+
+def uninitializePlugin(obj):
+    plugin: om.MFnPlugin = om.MFnPlugin(obj)
+
+    try:
+        plugin.deregisterCommand(COMMAND_NAME)
+    except:
+        raise RuntimeError('Failed to deregister command')
@@ -0,0 +1,160 @@
+import maya.api.OpenMaya as om
+
+def maya_useNewAPI():
+    pass
+
+STRETCH_TYPE_FULL = 0
+STRETCH_TYPE_STRETCH_ONLY = 1
+STRETCH_TYPE_SQUASH_ONLY = 2
+
+class LimbStretchNode(om.MPxNode):
+    """
+    autoLimb 의 stretch / volume 유틸리티 노드 네트워크(distanceBetween, plusMinusAverage,
+    multiplyDivide, condition, blendColors, set driven key)를 노드 하나로 대체한다.
+    """
+    id = om.MTypeId(0x00000002)
+
+    inputMatrix: om.MObject
+    endMatrix: om.MObject
+    stretchiness: om.MObject
+    stretchType: om.MObject
+    volumeOffset: om.MObject
+
+    outputScale: om.MObject
+    outputVolume: om.MObject
+
+    @staticmethod
+    def creator():
+        return LimbStretchNode()
+
+    @staticmethod
+    def initialize():
+        mAttr: om.MFnMatrixAttribute = om.MFnMatrixAttribute()
+        nAttr: om.MFnNumericAttribute = om.MFnNumericAttribute()
+        eAttr: om.MFnEnumAttribute = om.MFnEnumAttribute()
+
+        LimbStretchNode.inputMatrix = mAttr.create('inputMatrix', 'inMat')
+        mAttr.array = True
+        mAttr.storable = True
+        mAttr.readable = True
+        mAttr.writable = True
+
+        LimbStretchNode.endMatrix = mAttr.create('endMatrix', 'endMat')
+        mAttr.storable = True
+        mAttr.readable = True
+        mAttr.writable = True
+
+        LimbStretchNode.stretchiness = nAttr.create('stretchiness', 'str', om.MFnNumericData.kDouble, 0.0)
+        nAttr.setMin(0.0)
+        nAttr.setMax(1.0)
+        nAttr.keyable = True
+        nAttr.storable = True
+        nAttr.readable = True
+        nAttr.writable = True
+
+        LimbStretchNode.stretchType = eAttr.create('stretchType', 'strT', STRETCH_TYPE_FULL)
+        eAttr.addField('Full', STRETCH_TYPE_FULL)
+        eAttr.addField('Stretch Only', STRETCH_TYPE_STRETCH_ONLY)
+        eAttr.addField('Squash Only', STRETCH_TYPE_SQUASH_ONLY)
+        eAttr.keyable = True
+        eAttr.storable = True
+        eAttr.readable = True
+        eAttr.writable = True
+
+        LimbStretchNode.volumeOffset = nAttr.create('volumeOffset', 'volOff', om.MFnNumericData.kDouble, -0.5)
+        nAttr.keyable = True
+        nAttr.storable = True
+        nAttr.readable = True
+        nAttr.writable = True
+
+        LimbStretchNode.outputScale = nAttr.create('outputScale', 'outS', om.MFnNumericData.kDouble, 1.0)
+        nAttr.keyable = False
+        nAttr.storable = False
+        nAttr.readable = True
+        nAttr.writable = False
+
+        LimbStretchNode.outputVolume = nAttr.create('outputVolume', 'outV', om.MFnNumericData.kDouble, 1.0)
+        nAttr.keyable = False
+        nAttr.storable = False
+        nAttr.readable = True
+        nAttr.writable = False
+
+        om.MPxNode.addAttribute(LimbStretchNode.inputMatrix)
+        om.MPxNode.addAttribute(LimbStretchNode.endMatrix)
+        om.MPxNode.addAttribute(LimbStretchNode.stretchiness)
+        om.MPxNode.addAttribute(LimbStretchNode.stretchType)
+        om.MPxNode.addAttribute(LimbStretchNode.volumeOffset)
+
+        om.MPxNode.addAttribute(LimbStretchNode.outputScale)
+        om.MPxNode.addAttribute(LimbStretchNode.outputVolume)
+
+        for inputAttr in (LimbStretchNode.inputMatrix, LimbStretchNode.endMatrix, LimbStretchNode.stretchiness, LimbStretchNode.stretchType, LimbStretchNode.volumeOffset):
+            om.MPxNode.attributeAffects(inputAttr, LimbStretchNode.outputScale)
+            om.MPxNode.attributeAffects(inputAttr, LimbStretchNode.outputVolume)
+
+    def __init__(self):
+        om.MPxNode.__init__(self)
+
+    def compute(self, plug: om.MPlug, data: om.MDataBlock):
+        if plug != LimbStretchNode.outputScale and plug != LimbStretchNode.outputVolume:
+            return None
+
+        # 관절 사이 길이의 합 (rest length)
+        matrixArrayHandle: om.MArrayDataHandle = data.inputArrayValue(LimbStretchNode.inputMatrix)
+        positions = []
+
+        for i in range(len(matrixArrayHandle)):
+            matrixArrayHandle.jumpToPhysicalElement(i)
+            matrix: om.MMatrix = matrixArrayHandle.inputValue().asMatrix()
+            positions.append(om.MPoint(matrix[12], matrix[13], matrix[14]))
+
+        restLength = sum(positions[i].distanceTo(positions[i + 1]) for i in range(len(positions) - 1))
+
+        endMatrix: om.MMatrix = data.inputValue(LimbStretchNode.endMatrix).asMatrix()
+        endPosition = om.MPoint(endMatrix[12], endMatrix[13], endMatrix[14])
+
+        stretchiness = data.inputValue(LimbStretchNode.stretchiness).asDouble()
+        stretchType = data.inputValue(LimbStretchNode.stretchType).asShort()
+        volumeOffset = data.inputValue(LimbStretchNode.volumeOffset).asDouble()
+
+        scale = 1.0
+        volume = 1.0
+
+        if positions and restLength > 0:
+            scaleFactor = positions[0].distanceTo(endPosition) / restLength
+
+            # condition 노드의 operation (Not Equal / Greater or Equal / Less or Equal)
+            if stretchType == STRETCH_TYPE_STRETCH_ONLY:
+                isActive = scaleFactor >= 1
+            elif stretchType == STRETCH_TYPE_SQUASH_ONLY:
+                isActive = scaleFactor <= 1
+            else:
+                isActive = scaleFactor != 1
+
+            if isActive:
+                # blendColors (color1 = scaleFactor, color2 = 1) 와 multiplyDivide (power)
+                scale = scaleFactor * stretchiness + (1 - stretchiness)
+                volume = scale ** volumeOffset if scale > 0 else 1.0
+
+        data.outputValue(LimbStretchNode.outputScale).setDouble(scale)
+        data.outputValue(LimbStretchNode.outputVolume).setDouble(volume)
+        data.setClean(LimbStretchNode.outputScale)
+        data.setClean(LimbStretchNode.outputVolume)
+
+        return self
+
+def initializePlugin(obj):
+    plugin: om.MFnPlugin = om.MFnPlugin(obj, 'Suyeon', '1.0', 'Any')
+
+    try:
+        plugin.registerNode('limbStretch', LimbStretchNode.id, LimbStretchNode.creator, LimbStretchNode.initialize)
+    except:
+        raise RuntimeError('Failed to register node')
+
+def uninitializePlugin(obj):
+    plugin: om.MFnPlugin = om.MFnPlugin(obj)
+
+    try:
+        plugin.deregisterNode(LimbStretchNode.id)
+    except:
+        raise RuntimeError('Failed to deregister node')
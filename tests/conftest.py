@@ -0,0 +1,15 @@
+#-----------------------------------------
+# maya 없이 import 가능한 모듈만 테스트한다.
+# 스크립트들은 MAYA_MY_SCRIPT_PATH 로 폴더를 sys.path 에 넣고 이름으로 import 하므로 같은 폴더들을 넣는다.
+#-----------------------------------------
+
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIXTURES = os.path.join(ROOT, 'tests', 'fixtures')
+
+for folder in ('antcgi', 'tools', os.path.join('characters', 'akali')):
+    path = os.path.join(ROOT, folder)
+    if path not in sys.path:
+        sys.path.insert(0, path)
@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+import arkitCapture
+import arkitShapes
+
+def _interpolationError(times, values, kept) -> float:
+    return float(np.abs(np.interp(times, times[kept], values[kept]) - values).max())
+
+@pytest.mark.parametrize('tolerance', [0.001, 0.005, 0.05])
+def test_reduceKeysErrorBound(tolerance):
+    rng = np.random.default_rng(2)
+    times = np.arange(600) * 0.4 + 1001
+    values = np.clip(np.sin(times * 0.05) * 0.6 + 0.4 + np.cumsum(rng.normal(scale=0.01, size=len(times))), 0, 1)
+
+    kept = arkitCapture.reduceKeys(times, values, tolerance)
+
+    assert kept[0] == 0 and kept[-1] == len(values) - 1
+    assert np.all(np.diff(kept) > 0)
+    assert _interpolationError(times, values, kept) <= tolerance
+    assert len(kept) < len(values)
+
+def test_reduceKeysLinearAndConstant():
+    times = np.arange(100, dtype=float)
+
+    np.testing.assert_array_equal(arkitCapture.reduceKeys(times, times * 0.01, 1e-6), [0, 99])
+    np.testing.assert_array_equal(arkitCapture.reduceKeys(times, np.full(100, 0.3), 1e-6), [0, 99])
+
+    # 하나만 튀는 키는 남는다
+    values = np.zeros(100)
+    values[40] = 1
+    np.testing.assert_array_equal(arkitCapture.reduceKeys(times, values, 0.01), [0, 39, 40, 41, 99])
+
+def test_reduceKeysKeepsEverythingWithoutTolerance():
+    times = np.arange(5, dtype=float)
+    values = np.array([0, 1, 0, 1, 0], dtype=float)
+
+    for tolerance in (None, 0):
+        np.testing.assert_array_equal(arkitCapture.reduceKeys(times, values, tolerance), np.arange(5))
+
+    np.testing.assert_array_equal(arkitCapture.reduceKeys(times[:2], values[:2], 0.1), [0, 1])
+
+def test_loadFrames(tmp_path):
+    frames = np.random.default_rng(0).random((6, arkitCapture.FRAME_SIZE)).astype(np.float32)
+
+    binPath = tmp_path / 'clip.bin'
+    frames.astype('<f4').tofile(binPath)
+    np.testing.assert_array_equal(arkitCapture.loadFrames(str(binPath)), frames)
+
+    npyPath = tmp_path / 'clip.npy'
+    np.save(npyPath, frames)
+    np.testing.assert_array_equal(arkitCapture.loadFrames(str(npyPath)), frames)
+
+    csvPath = tmp_path / 'clip.csv'
+    csvPath.write_text('jawOpen,unknown,tongueOut\n0.5,9,1\n0.25,9,0\n', encoding='utf-8')
+    loaded = arkitCapture.loadFrames(str(csvPath))
+
+    assert loaded.shape == (2, arkitCapture.FRAME_SIZE)
+    np.testing.assert_array_equal(loaded[:, arkitShapes.ARKIT_SHAPES.index('jawOpen')], [0.5, 0.25])
+    np.testing.assert_array_equal(loaded[:, arkitShapes.ARKIT_SHAPES.index('tongueOut')], [1, 0])
+    assert loaded.sum() == 1.75
@@ -0,0 +1,101 @@
+import json
+import os
+import pytest
+import autoLimbPlan
+from conftest import FIXTURES
+
+JOINTS = ['l_leg_femur', 'l_leg_tibia', 'l_leg_metatarsus', 'l_leg_ankle']
+
+# 섹션으로 나누기 전 (단일 plan) 의 IK op 목록
+with open(os.path.join(FIXTURES, 'baselineAutoLimbIkOps.json'), 'r', encoding='utf-8') as f:
+    BASELINE_IK_OPS = json.load(f)
+
+def _normalize(plan: list) -> list:
+    # 섹션 재빌드용으로 constraint 에 붙인 이름은 Maya 기본 이름과 같으므로 비교에서 뺀다
+    ops = []
+
+    for op in plan:
+        kwargs = dict(op['kwargs'])
+        if op['command'].endswith('Constraint'):
+            kwargs.pop('name', None)
+
+        ops.append({'command': op['command'], 'args': list(op['args']), 'kwargs': kwargs})
+
+    return ops
+
+@pytest.mark.parametrize('isRearLeg', [False, True], ids=['front', 'rear'])
+def test_ikSectionMatchesBaseline(isRearLeg):
+    sections = autoLimbPlan.buildAutoLimbSections(JOINTS, isRearLeg)
+    assert _normalize(sections['ik']) == BASELINE_IK_OPS['rear' if isRearLeg else 'front']
+
+@pytest.mark.parametrize('isRearLeg', [False, True], ids=['front', 'rear'])
+def test_ikSectionCreatesEveryNodeItUses(isRearLeg):
+    plan = autoLimbPlan.buildAutoLimbPlan(JOINTS, isRearLeg)
+    created = {op['kwargs']['name'] for op in plan if 'name' in op['kwargs']}
+
+    limbName = autoLimbPlan.getLimbName(JOINTS[0], isRearLeg)
+    for op in autoLimbPlan.buildAutoLimbSections(JOINTS, isRearLeg)['ik']:
+        if op['command'] in ('connectAttr', 'setAttr'):
+            for plug in op['args'][:2 if op['command'] == 'connectAttr' else 1]:
+                node = plug.split('.')[0]
+                # 컨트롤러는 quadrupedControllerGenerator 가 미리 만든다
+                assert node in created or node.endswith('_ctrl'), node
+
+    assert limbName + '_hock_multi' in created
+
+@pytest.mark.parametrize('isRearLeg', [False, True], ids=['front', 'rear'])
+@pytest.mark.parametrize('numJoints', [3, 4, 5, 6])
+def test_ikSectionForEveryChainLength(numJoints, isRearLeg):
+    joints = [f'l_leg_joint{i}' for i in range(numJoints)]
+    limbName = autoLimbPlan.getLimbName(joints[0], isRearLeg)
+
+    plan = autoLimbPlan.buildAutoLimbPlan(joints, isRearLeg)
+    created = {op['kwargs']['name'] for op in plan if 'name' in op['kwargs']}
+    ikOps = autoLimbPlan.buildAutoLimbSections(joints, isRearLeg)['ik']
+    commands = [op['command'] for op in ikOps]
+
+    assert commands.count('orientConstraint') == 1
+    assert commands.count('poleVectorConstraint') == 1
+    assert limbName + '_hock_multi' in created
+
+    orientConstraint = next(op for op in ikOps if op['command'] == 'orientConstraint')
+    assert orientConstraint['args'] == [limbName + '_ik_ctrl', joints[-1] + '_ik']
+
+    # parent / 연결 대상은 plan 이 만들었거나 미리 만들어진 컨트롤러
+    for op in ikOps:
+        if op['command'] == 'parent':
+            assert all(node in created or node.endswith('_ctrl') for node in op['args']), op
+
+        if op['command'] in ('connectAttr', 'setAttr'):
+            for plug in op['args'][:2 if op['command'] == 'connectAttr' else 1]:
+                node = plug.split('.')[0]
+                assert node in created or node.endswith('_ctrl'), op
+
+    hasHock = numJoints > autoLimbPlan.MIN_LIMB_JOINTS
+    assert (limbName + '_hock_ikHandle' in created) == hasHock
+
+    if isRearLeg:
+        kneeEndJoint = joints[-2] if hasHock else joints[-1]
+        assert {'command': 'parent', 'args': [limbName + '_knee_ctrl_offset', kneeEndJoint + '_driver'], 'kwargs': {}} in ikOps
+
+def _chainMatrices(count: int) -> list[list[float]]:
+    return [[1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1, 0, 0, 10 - i * 3, i, 1] for i in range(count)]
+
+def _changedSections(before: dict, after: dict) -> set:
+    return {section for section in before if before[section] != after[section]}
+
+def test_fingerprintsOnlyTrackSectionInputs():
+    matrices = _chainMatrices(len(JOINTS))
+    fingerprints = autoLimbPlan.getSectionFingerprints(JOINTS, matrices, True)
+
+    # 가운데 조인트 (metatarsus) 위치는 joints 와 그 섹션에 붙는 섹션만 바꾼다
+    moved = [list(matrix) for matrix in matrices]
+    moved[2][12] += 1
+    assert _changedSections(fingerprints, autoLimbPlan.getSectionFingerprints(JOINTS, moved, True)) == {'joints', 'blend', 'ik', 'stretch'}
+
+    # roll 은 root / 두 번째 / 끝 조인트 위치를 쓴다
+    moved = [list(matrix) for matrix in matrices]
+    moved[1][12] += 1
+    assert 'roll' in _changedSections(fingerprints, autoLimbPlan.getSectionFingerprints(JOINTS, moved, True))
+
+    assert _changedSections(fingerprints, autoLimbPlan.getSectionFingerprints(JOINTS, matrices, True, useStretchNode=True)) == {'stretch'}
@@ -0,0 +1,81 @@
+import numpy as np
+import pytest
+import blendshapeDeltas
+import deltaStore
+
+def _deltas(scale=0.5, count=200, seed=3) -> np.ndarray:
+    return np.random.default_rng(seed).normal(scale=scale, size=(count, 3)).astype(np.float32)
+
+def test_extractSparseDelta():
+    base = np.zeros((5, 3))
+    deformed = base.copy()
+    deformed[1] = [0, 1e-5, 0]
+    deformed[3] = [0.5, 0, 0]
+
+    indices, deltas = blendshapeDeltas.extractSparseDelta(base, deformed, tolerance=1e-4)
+
+    np.testing.assert_array_equal(indices, [3])
+    np.testing.assert_array_equal(deltas, [[0.5, 0, 0]])
+    assert indices.dtype == np.int32 and deltas.dtype == np.float32
+
+@pytest.mark.parametrize('encoding, dtype', [('int16', np.int16), ('float16', np.float16)])
+def test_encodeRoundTripWithinMaxError(encoding, dtype):
+    deltas = _deltas()
+    data, scale = blendshapeDeltas.encodeDeltas(deltas, encoding, maxError=1e-3)
+
+    assert data.dtype == dtype
+    assert blendshapeDeltas.getVertexErrors(deltas, data, scale).max() <= 1e-3
+    np.testing.assert_allclose(blendshapeDeltas.decodeDeltas(data, scale), deltas, atol=1e-3)
+
+def test_encodeFallsBackToFloat32():
+    # 큰 delta 는 int16 step (최대값 / 32767) 이 커서 maxError 를 넘는다
+    deltas = _deltas(scale=500)
+    data, scale = blendshapeDeltas.encodeDeltas(deltas, 'int16', maxError=1e-4)
+
+    assert data.dtype == np.float32 and scale == 1.0
+    np.testing.assert_array_equal(data, deltas)
+
+def test_encodeEdgeCases():
+    data, scale = blendshapeDeltas.encodeDeltas(np.zeros((0, 3)), 'int16')
+    assert len(data) == 0 and scale == 1.0
+
+    data, scale = blendshapeDeltas.encodeDeltas(np.zeros((4, 3)), 'int16')
+    np.testing.assert_array_equal(blendshapeDeltas.decodeDeltas(data, scale), 0)
+
+    with pytest.raises(ValueError):
+        blendshapeDeltas.encodeDeltas(_deltas(), 'int8')
+
+def test_verifyEncodingReport():
+    targets = {('Face', 'jawOpen'): (np.arange(200, dtype=np.int32) * 2, _deltas()), ('Face', 'big'): (np.arange(200, dtype=np.int32), _deltas(scale=500))}
+    report = blendshapeDeltas.verifyEncoding(targets, 'int16', maxError=1e-4)
+
+    error, vertex, dtype = report[('Face', 'jawOpen')]
+    assert dtype == 'int16' and error <= 1e-4 and vertex % 2 == 0
+    assert report[('Face', 'big')] == (0.0, 0, 'float32')
+
+@pytest.mark.parametrize('encoding', blendshapeDeltas.ENCODINGS)
+def test_archiveRoundTrip(tmp_path, encoding):
+    basePoints = {'Face': np.random.default_rng(1).random((300, 3))}
+    targets = {('Face', 'jawOpen'): (np.arange(0, 300, 3, dtype=np.int32), _deltas(count=100)), ('Face', 'mouthLeft'): (np.arange(50, dtype=np.int32), _deltas(scale=0.01, count=50))}
+    path = str(tmp_path / 'deltas.npz')
+
+    blendshapeDeltas.saveArchive(path, targets, {'Face': 300}, {'Face': 'Face_Mesh'}, 1e-4, 10.0, basePoints, encoding, maxError=1e-3)
+    archive = blendshapeDeltas.loadArchive(path)
+
+    assert archive['shapes'] == ['jawOpen', 'mouthLeft']
+    assert archive['vertexCounts'] == {'Face': 300} and archive['baseMeshes'] == {'Face': 'Face_Mesh'}
+    np.testing.assert_allclose(archive['basePoints']['Face'], basePoints['Face'], atol=1e-6)
+
+    for key, (indices, deltas) in targets.items():
+        loadedIndices, loadedDeltas = archive['targets'][key]
+        np.testing.assert_array_equal(loadedIndices, indices)
+        assert loadedDeltas.dtype == np.float32
+        assert np.linalg.norm(loadedDeltas - deltas, axis=1).max() <= 1e-3
+
+    # 양자화된 archive 를 store 로 변환해도 같은 delta
+    storePath = str(tmp_path / 'deltas.store')
+    deltaStore.convertArchive(path, storePath, encoding=encoding)
+    store = deltaStore.openStore(storePath)
+
+    for (mesh, shape), (indices, deltas) in archive['targets'].items():
+        np.testing.assert_allclose(deltaStore.getTargetDeltas(store, mesh, shape)[1], deltas, atol=1e-3)
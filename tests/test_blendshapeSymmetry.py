@@ -0,0 +1,96 @@
+import os
+import numpy as np
+import pytest
+import blendshapeSymmetry
+
+@pytest.fixture
+def symmetricPoints() -> np.ndarray:
+    """x 기준 대칭인 점들 (x > 0 쪽을 섞어서 미러 쪽 순서와 다르게) + 중심선 점 + 짝이 없는 점"""
+    rng = np.random.default_rng(11)
+    left = rng.random((40, 3)) + [0.1, 0, 0]
+    right = left[rng.permutation(len(left))] * [-1, 1, 1]
+    center = np.array([[0, 0.5, 0.5], [0, 1.5, 0.2]])
+    unpaired = np.array([[3.0, 3.0, 3.0]])
+
+    return np.concatenate([left, right, center, unpaired])
+
+def test_symmetryMapPairsMirroredVertices(symmetricPoints):
+    symmetryMap = blendshapeSymmetry.buildSymmetryMap(symmetricPoints)
+
+    paired = symmetryMap >= 0
+    np.testing.assert_allclose(symmetricPoints[symmetryMap[paired]], symmetricPoints[paired] * [-1, 1, 1])
+
+    # 짝이 있는 버텍스끼리는 서로를 가리키고, 중심선 버텍스는 자기 자신, 짝이 없으면 -1
+    np.testing.assert_array_equal(symmetryMap[symmetryMap[paired]], np.flatnonzero(paired))
+    np.testing.assert_array_equal(symmetryMap[80:82], [80, 81])
+    assert symmetryMap[82] == -1
+
+def test_symmetryMapCache(tmp_path, symmetricPoints):
+    cacheDir = str(tmp_path / 'symmetry')
+    symmetryMap = blendshapeSymmetry.getSymmetryMap(symmetricPoints, cacheDir)
+
+    topologyHash = blendshapeSymmetry.getTopologyHash(symmetricPoints)
+    assert os.listdir(cacheDir) == [f'{topologyHash}_0.npy']
+    np.testing.assert_array_equal(blendshapeSymmetry.getSymmetryMap(symmetricPoints, cacheDir), symmetryMap)
+
+    # 위치가 바뀌면 다른 해시
+    assert blendshapeSymmetry.getTopologyHash(symmetricPoints + 0.01) != topologyHash
+
+def test_mirrorDelta(symmetricPoints):
+    symmetryMap = blendshapeSymmetry.buildSymmetryMap(symmetricPoints)
+    indices = np.array([0, 5, 82], dtype=np.int32)
+    deltas = np.array([[1, 2, 3], [-1, 0.5, 0], [9, 9, 9]], dtype=np.float32)
+
+    mirroredIndices, mirroredDeltas = blendshapeSymmetry.mirrorDelta(indices, deltas, symmetryMap)
+
+    # 짝이 없는 82 번은 버려지고 나머지는 반대쪽 버텍스로 x 부호가 바뀌어 옮겨진다
+    expected = sorted(zip(symmetryMap[[0, 5]], [[-1, 2, 3], [1, 0.5, 0]]))
+    np.testing.assert_array_equal(mirroredIndices, [index for index, delta in expected])
+    np.testing.assert_array_equal(mirroredDeltas, [delta for index, delta in expected])
+
+    # 두 번 미러하면 원래대로
+    backIndices, backDeltas = blendshapeSymmetry.mirrorDelta(mirroredIndices, mirroredDeltas, symmetryMap)
+    np.testing.assert_array_equal(backIndices, [0, 5])
+    np.testing.assert_array_equal(backDeltas, deltas[:2])
+
+@pytest.mark.parametrize('falloff', [0.0, 0.5, 2.0])
+def test_splitSumsToOriginal(symmetricPoints, falloff):
+    indices = np.arange(len(symmetricPoints), dtype=np.int32)
+    deltas = np.random.default_rng(5).normal(size=(len(indices), 3)).astype(np.float32)
+
+    split = blendshapeSymmetry.splitDelta(indices, deltas, symmetricPoints, falloff=falloff, tolerance=0)
+
+    total = np.zeros_like(deltas)
+    for side in blendshapeSymmetry.SIDES:
+        sideIndices, sideDeltas = split[side]
+        total[sideIndices] += sideDeltas
+
+    np.testing.assert_allclose(total, deltas, atol=1e-6)
+
+    # 중심선에서 먼 버텍스는 한쪽에만 있다
+    leftIndices = set(split['Left'][0].tolist())
+    assert 82 in leftIndices and 82 not in set(split['Right'][0].tolist())
+
+def test_sideWeights():
+    points = np.array([[-2, 0, 0], [-0.25, 0, 0], [0, 0, 0], [0.25, 0, 0], [2, 0, 0]])
+    weights = blendshapeSymmetry.getSideWeights(points, falloff=1.0)
+
+    np.testing.assert_allclose(weights[[0, 2, 4]], [0, 0.5, 1])
+    np.testing.assert_allclose(weights[1] + weights[3], 1.0)
+
+def test_mirrorAndSplitTargets(symmetricPoints):
+    basePoints = {'Face': symmetricPoints}
+    indices = np.array([0, 1, 2], dtype=np.int32)
+    deltas = np.ones((3, 3), dtype=np.float32)
+    targets = {('Face', 'eyeBlinkLeft'): (indices, deltas), ('Face', 'eyeBlinkRight'): (indices, deltas * 5), ('Face', 'jawOpen'): (indices, deltas)}
+
+    assert blendshapeSymmetry.getSidePairs(['eyeBlinkLeft', 'eyeBlinkRight', 'jawOpen', 'mouthLeft']) == [('eyeBlinkLeft', 'eyeBlinkRight'), ('mouthLeft', 'mouthRight')]
+
+    mirrored = blendshapeSymmetry.mirrorTargets(targets, basePoints, ['eyeBlinkLeft', 'eyeBlinkRight', 'jawOpen'])
+    symmetryMap = blendshapeSymmetry.buildSymmetryMap(symmetricPoints)
+    np.testing.assert_array_equal(mirrored[('Face', 'eyeBlinkRight')][0], np.sort(symmetryMap[indices]))
+    np.testing.assert_array_equal(mirrored[('Face', 'eyeBlinkRight')][1][:, 0], -1)
+    assert mirrored[('Face', 'jawOpen')] is targets[('Face', 'jawOpen')]
+
+    split = blendshapeSymmetry.splitTargets(targets, basePoints, ['jawOpen'])
+    assert ('Face', 'jawOpenLeft') in split and ('Face', 'eyeBlinkLeftLeft') not in split
@@ -0,0 +1,55 @@
+import json
+import os
+import numpy as np
+import pytest
+import controllerShapes
+from conftest import FIXTURES
+
+# 기존 controllerMaker.createCurve 의 cmds.curve 인자 (d, p, k) 를 그대로 옮긴 것
+with open(os.path.join(FIXTURES, 'baselineControllerShapes.json'), 'r', encoding='utf-8') as f:
+    BASELINE_SHAPES = json.load(f)
+
+def _normalize(knots) -> np.ndarray:
+    knots = np.asarray(knots, dtype=float)
+    return (knots - knots[0]) / (knots[-1] - knots[0])
+
+def test_catalogHasEveryBaselineShape():
+    assert set(BASELINE_SHAPES) | {'Circle'} == set(controllerShapes.getShapeNames())
+
+@pytest.mark.parametrize('name', list(BASELINE_SHAPES))
+def test_catalogMatchesBaseline(name):
+    baseline = BASELINE_SHAPES[name]
+    shape = controllerShapes.getShape(name)
+
+    assert shape['degree'] == baseline['degree']
+    assert not shape['periodic']
+    np.testing.assert_allclose(shape['points'], baseline['points'])
+
+    # knot 값의 간격 (0.1 / 1) 은 달라도 같은 형태의 커브가 된다
+    assert len(shape['knots']) == len(baseline['knots'])
+    np.testing.assert_allclose(_normalize(shape['knots']), _normalize(baseline['knots']))
+
+def test_circleMatchesMayaCircle():
+    """cmds.circle(r=1, d=3, s=8) 과 같은 periodic 커브: knot 위치의 점이 반지름 1 위에 있다."""
+    shape = controllerShapes.getShape('Circle')
+    points = np.asarray(shape['points'][:-shape['degree']])
+
+    assert shape['degree'] == 3 and shape['periodic'] and len(points) == 8
+    assert len(shape['knots']) == len(shape['points']) + shape['degree'] - 1
+
+    # uniform cubic B-spline 의 knot 위치 점 = (P[i-1] + 4 P[i] + P[i+1]) / 6
+    curvePoints = (np.roll(points, 1, axis=0) + 4 * points + np.roll(points, -1, axis=0)) / 6
+    np.testing.assert_allclose(np.linalg.norm(curvePoints, axis=1), 1.0, atol=1e-3)
+    np.testing.assert_allclose(curvePoints[:, 1], 0.0)
+
+def test_getKnots():
+    assert controllerShapes.getKnots(1, 5) == [0, 1, 2, 3, 4]
+    assert controllerShapes.getKnots(3, 6) == [0, 0, 0, 1, 2, 3, 3, 3]
+    assert controllerShapes.getKnots(3, 11, periodic=True) == list(range(-2, 11))
+
+    with pytest.raises(ValueError):
+        controllerShapes.getKnots(3, 3)
+
+def test_unknownShape():
+    with pytest.raises(KeyError):
+        controllerShapes.getShape('Nope')
@@ -0,0 +1,90 @@
+import numpy as np
+import pytest
+import curveGeometry
+
+def _knotPoints(shape) -> np.ndarray:
+    """uniform 주기 3차 B-spline 의 knot 위치 점 = (P[i-1] + 4 P[i] + P[i+1]) / 6"""
+    points = shape['points'][:-shape['degree']]
+    return (np.roll(points, 1, axis=0) + 4 * points + np.roll(points, -1, axis=0)) / 6
+
+def test_knots():
+    np.testing.assert_array_equal(curveGeometry.knots(1, 4), [0, 1, 2, 3])
+    np.testing.assert_array_equal(curveGeometry.knots(3, 5), [0, 0, 0, 1, 2, 2, 2])
+    np.testing.assert_array_equal(curveGeometry.knots(3, 11, periodic=True), np.arange(-2, 11))
+
+def test_periodicShapeRepeatsFirstPoints():
+    points = np.random.default_rng(0).random((6, 3))
+    shape = curveGeometry.shape(points, degree=3, periodic=True)
+
+    assert len(shape['points']) == 9
+    np.testing.assert_array_equal(shape['points'][-3:], points[:3])
+    # Maya 규칙: knot 수 = CV 수 + degree - 1
+    assert len(shape['knots']) == len(shape['points']) + shape['degree'] - 1
+
+@pytest.mark.parametrize('sections', [6, 8, 16])
+@pytest.mark.parametrize('normal', [(0, 1, 0), (1, 0, 0), (0, 0, 1), (1, 1, 0)])
+def test_circlePassesThroughRadius(sections, normal):
+    shape, = curveGeometry.circle(2.5, sections, normal)
+    curvePoints = _knotPoints(shape)
+
+    np.testing.assert_allclose(np.linalg.norm(curvePoints, axis=1), 2.5)
+
+    # 모든 점이 normal 에 수직인 평면 위에 있다
+    normal = np.asarray(normal, dtype=float) / np.linalg.norm(normal)
+    np.testing.assert_allclose(shape['points'] @ normal, 0.0, atol=1e-12)
+
+def test_cubeAndPyramidSize():
+    cube, = curveGeometry.cube(4.0)
+    np.testing.assert_allclose(cube['points'].min(axis=0), [-2, -2, -2])
+    np.testing.assert_allclose(cube['points'].max(axis=0), [2, 2, 2])
+    assert cube['degree'] == 1 and not cube['periodic']
+
+    pyramid, = curveGeometry.pyramid(2.0)
+    np.testing.assert_allclose(pyramid['points'].min(axis=0), [-1, 0, -1])
+    np.testing.assert_allclose(pyramid['points'].max(axis=0), [1, np.sqrt(2.0 / 3.0) * 2.0, 1])
+    np.testing.assert_array_equal(pyramid['points'][0], pyramid['points'][2])
+
+@pytest.mark.parametrize('builder', [curveGeometry.arrow, curveGeometry.twoDirArrow])
+def test_arrowsAreClosedAndCentered(builder):
+    shape, = builder(2.0)
+
+    np.testing.assert_array_equal(shape['points'][0], shape['points'][-1])
+    np.testing.assert_allclose(shape['points'][:, 1], 0.0)
+    np.testing.assert_allclose(curveGeometry.boundingBoxCenter([shape]), 0.0, atol=1e-12)
+
+def test_radialArrow():
+    shapes = curveGeometry.radialArrow(centerRadius=2.0, numArrows=4, sections=16)
+    assert len(shapes) == 5
+
+    circleShape, *arrows = shapes
+    np.testing.assert_allclose(np.linalg.norm(_knotPoints(circleShape), axis=1), 2.0)
+
+    # 화살표는 원 바깥 (반지름 + 간격) 에서 시작해서 머리 끝 (+ 길이) 까지
+    for arrow in arrows:
+        distances = np.linalg.norm(arrow['points'], axis=1)
+        assert distances.min() >= 2.2 - 1e-9
+        assert distances.max() == pytest.approx(2.2 + 1.2)
+
+def test_boundingBoxCenter():
+    shapes = [curveGeometry.shape([[0, 0, 0], [2, 0, 0]]), curveGeometry.shape([[0, 4, -2], [0, 0, 0]])]
+    np.testing.assert_allclose(curveGeometry.boundingBoxCenter(shapes), [1, 2, -1])
+
+def test_evaluateMatchesEndPointsAndLines():
+    shape = curveGeometry.shape([[0, 0, 0], [1, 2, 0], [2, -1, 0], [3, 0, 0], [4, 1, 0]], degree=3)
+    points = curveGeometry.evaluate(shape, samplesPerSpan=4)
+
+    assert len(points) == 2 * 4 + 1
+    np.testing.assert_allclose(points[0], [0, 0, 0])
+    np.testing.assert_allclose(points[-1], [4, 1, 0])
+
+    line = curveGeometry.shape([[0, 0, 0], [2, 0, 0]])
+    np.testing.assert_allclose(curveGeometry.evaluate(line, samplesPerSpan=2), [[0, 0, 0], [1, 0, 0], [2, 0, 0]])
+
+def test_boundingBoxUsesCurveNotCVs():
+    shape, = curveGeometry.circle(2.0)
+    minPoint, maxPoint = curveGeometry.boundingBox([shape])
+
+    # CV 박스는 반지름 2.216 까지, 실제 원은 2 까지
+    assert shape['points'][:, 0].max() > 2.2
+    np.testing.assert_allclose(minPoint, [-2, 0, -2], atol=1e-3)
+    np.testing.assert_allclose(maxPoint, [2, 0, 2], atol=1e-3)
@@ -0,0 +1,96 @@
+import numpy as np
+import pytest
+import blendshapeDeltas
+import deltaStore
+
+SHAPES = ['jawOpen', 'mouthLeft', 'tongueOut']
+
+@pytest.fixture
+def meshData():
+    rng = np.random.default_rng(7)
+    basePoints = {'Face': rng.random((50, 3)), 'Teeth': rng.random((20, 3))}
+
+    # 타겟마다 일부 버텍스만 움직인다
+    fullDeltas = {}
+    targets = {}
+    for mesh, shape, moved in [('Face', 'jawOpen', 30), ('Face', 'mouthLeft', 12), ('Teeth', 'jawOpen', 20)]:
+        deltas = np.zeros_like(basePoints[mesh])
+        deltas[rng.choice(len(deltas), moved, replace=False)] = rng.normal(scale=0.2, size=(moved, 3))
+        fullDeltas[(mesh, shape)] = deltas
+        targets[(mesh, shape)] = blendshapeDeltas.extractSparseDelta(basePoints[mesh], basePoints[mesh] + deltas)
+
+    return basePoints, targets, fullDeltas
+
+def test_storeRoundTrip(tmp_path, meshData):
+    basePoints, targets, fullDeltas = meshData
+    path = str(tmp_path / 'test.deltas')
+    deltaStore.writeStore(path, basePoints, targets, SHAPES, {'Face': 'Face_Mesh'}, controlValue=10.0)
+
+    store = deltaStore.openStore(path)
+
+    assert store['shapes'] == SHAPES
+    assert store['controlValue'] == 10.0
+    assert store['meshes']['Face']['baseMesh'] == 'Face_Mesh'
+    assert store['meshes']['Teeth']['baseMesh'] == 'Teeth'
+
+    for mesh, points in basePoints.items():
+        np.testing.assert_allclose(store['meshes'][mesh]['basePoints'], points, atol=1e-6)
+
+    for (mesh, shape), (indices, deltas) in targets.items():
+        storedIndices, storedDeltas = deltaStore.getTargetDeltas(store, mesh, shape)
+        np.testing.assert_array_equal(storedIndices, indices)
+        np.testing.assert_array_equal(storedDeltas, deltas)
+
+    assert 'tongueOut' not in store['meshes']['Face']['targets']
+
+def test_evaluateMatchesDenseSum(tmp_path, meshData):
+    basePoints, targets, fullDeltas = meshData
+    path = str(tmp_path / 'test.deltas')
+    deltaStore.writeStore(path, basePoints, targets, SHAPES)
+    store = deltaStore.openStore(path)
+
+    weights = np.array([[0, 0, 0], [1, 0, 0], [0.5, -1, 2], [0.25, 0.75, 0]], dtype=np.float32)
+
+    for mesh in basePoints:
+        expected = np.repeat(basePoints[mesh][None], len(weights), axis=0)
+        for column, shape in enumerate(SHAPES):
+            if (mesh, shape) in fullDeltas:
+                expected += weights[:, column, None, None] * fullDeltas[(mesh, shape)]
+
+        np.testing.assert_allclose(deltaStore.evaluate(store, mesh, weights), expected, atol=1e-5)
+
+        # chunk 로 나눠 계산해도 같은 결과
+        chunks = np.concatenate([points for start, points in deltaStore.iterEvaluate(store, mesh, weights, chunkSize=3)])
+        np.testing.assert_allclose(chunks, expected, atol=1e-5)
+
+def test_openRejectsOtherFiles(tmp_path):
+    path = tmp_path / 'other.bin'
+    path.write_bytes(b'not a store at all')
+
+    with pytest.raises(ValueError):
+        deltaStore.openStore(str(path))
+
+def test_loadWeightsFromCsv(tmp_path):
+    path = tmp_path / 'clip.csv'
+    path.write_text('tongueOut,unknown,jawOpen\n1,5,0.5\n0,5,1\n', encoding='utf-8')
+
+    np.testing.assert_array_equal(deltaStore.loadWeights(str(path), SHAPES), [[0.5, 0, 1], [1, 0, 0]])
+
+def test_storeWithShapeSubset(tmp_path, meshData):
+    basePoints, targets, fullDeltas = meshData
+    path = str(tmp_path / 'subset.deltas')
+    deltaStore.writeStore(path, basePoints, targets, ['mouthLeft'])
+    store = deltaStore.openStore(path)
+
+    # 목록에 없는 shape (jawOpen) 의 타겟은 저장되지 않는다
+    assert list(store['meshes']['Face']['targets']) == ['mouthLeft']
+    assert store['meshes']['Teeth']['targets'] == {}
+
+    np.testing.assert_allclose(deltaStore.evaluate(store, 'Face', [[1]])[0], basePoints['Face'] + fullDeltas[('Face', 'mouthLeft')], atol=1e-5)
+    np.testing.assert_allclose(deltaStore.evaluate(store, 'Teeth', [[1]])[0], basePoints['Teeth'], atol=1e-6)
+
+    # 이전에 shape 목록 밖의 타겟까지 저장된 파일도 평가할 수 있다
+    store['meshes']['Face']['targets']['jawOpen'] = targets[('Face', 'jawOpen')]
+    store['meshes']['Face']['scales']['jawOpen'] = 1.0
+    store['meshes']['Face'].pop('deltaMatrix', None)
+    np.testing.assert_allclose(deltaStore.evaluate(store, 'Face', [[1]])[0], basePoints['Face'] + fullDeltas[('Face', 'mouthLeft')], atol=1e-5)
@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+import limbMath
+
+def test_solvePoleVectors():
+    # 무릎이 +z 로 굽은 다리 두 개를 한 번에 계산
+    legs = np.array([
+        [[0, 10, 0], [0, 5, 1], [0, 0, 0]],
+        [[4, 10, 0], [4, 5, 2], [4, 0, 0]],
+    ])
+    matrices = limbMath.solvePoleVectors(legs, distance=[3, 5])
+
+    assert matrices.shape == (2, 4, 4)
+    np.testing.assert_allclose(matrices[:, 3, :3], [[0, 5, 4], [4, 5, 7]])
+
+    # x 축은 다리 평면의 normal, 나머지 축과 직교
+    for matrix, leg in zip(matrices, legs):
+        np.testing.assert_allclose(matrix[:3, :3] @ matrix[:3, :3].T, np.eye(3), atol=1e-12)
+        np.testing.assert_allclose((leg - leg[0]) @ matrix[0, :3], 0.0, atol=1e-12)
+
+def test_solvePoleVectorsRejectsCollinearJoints():
+    legs = np.array([
+        [[0, 10, 0], [0, 5, 1], [0, 0, 0]],
+        [[4, 10, 0], [4, 5, 0], [4, 0, 0]],
+    ])
+
+    with pytest.raises(ValueError, match=r'\[1\]'):
+        limbMath.solvePoleVectors(legs)
+
+def test_aimMatricesParallelUpVector():
+    # aim 이 up 과 평행하면 다른 world 축을 up 으로 써서 직교 행렬을 만든다
+    matrices = limbMath.aimMatrices([[0, 1, 0], [0, -3, 0], [1, 0, 0]])
+
+    for matrix in matrices:
+        np.testing.assert_allclose(matrix[:3, :3] @ matrix[:3, :3].T, np.eye(3), atol=1e-12)
+
+    np.testing.assert_allclose(matrices[:2, 0, :3], [[0, 1, 0], [0, -1, 0]])
+    np.testing.assert_allclose(matrices[2, :3, :3], np.eye(3))
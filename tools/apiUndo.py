@@ -0,0 +1,30 @@
+#-----------------------------------------
+# API 작업 undo 기록
+# nodes/apiUndoCommand.py 플러그인의 apiUndo 명령으로 이미 실행한 API 작업을 undo 큐에 올린다.
+#-----------------------------------------
+
+import sys
+import maya.cmds as cmds
+
+UNDO_PLUGIN = 'apiUndoCommand.py'
+QUEUE_MODULE = 'apiUndoCommandQueue'
+
+def commit(undo, redo):
+    """이미 실행한 작업의 되돌리기 / 다시 실행 함수를 undo 큐에 기록한다. (열려 있는 undo chunk 에 포함된다)"""
+    if not cmds.pluginInfo(UNDO_PLUGIN, query=True, loaded=True):
+        cmds.loadPlugin(UNDO_PLUGIN, quiet=True)
+
+    sys.modules[QUEUE_MODULE].pending.append((undo, redo))
+    cmds.apiUndo()
+
+def commitModifier(modifier, after=None):
+    """
+    doIt 까지 끝난 modifier 를 undo 큐에 기록한다.
+    after 는 modifier 밖에서 한 작업 (plug 잠금 등) 을 다시 실행할 때 redo 에서 modifier.doIt() 다음에 호출된다.
+    """
+    def redo():
+        modifier.doIt()
+        if after:
+            after()
+
+    commit(modifier.undoIt, redo)
@@ -0,0 +1,78 @@
+#-----------------------------------------
+# Controller shape catalog
+# controllerShapes.json 에 정의된 커브 형태를 한 번만 읽어서 이름으로 조회한다.
+# maya 없이도 import 가능 (순수 파이썬)
+#-----------------------------------------
+
+import json
+import os
+import time
+
+CATALOG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'controllerShapes.json')
+
+_catalog = None
+_loadTime = 0.0
+
+def getKnots(degree: int, numPoints: int, periodic=False) -> list[float]:
+    """Maya 형식(CV 수 + degree - 1 개)의 knot vector 를 만든다."""
+    if periodic:
+        return list(range(-(degree - 1), numPoints))
+
+    spans = numPoints - degree
+
+    if spans < 1:
+        raise ValueError(f'Not enough points ({numPoints}) for a degree {degree} curve')
+
+    return [0] * (degree - 1) + list(range(spans + 1)) + [spans] * (degree - 1)
+
+def _buildShape(name: str, data: dict) -> dict:
+    degree = data.get('degree', 1)
+    periodic = data.get('form', 'open') == 'periodic'
+    points = [tuple(point) for point in data['points']]
+
+    # periodic 커브는 처음 degree 개의 CV 를 끝에 다시 붙여서 닫는다
+    if periodic:
+        points += points[:degree]
+
+    return {
+        'name': name,
+        'degree': degree,
+        'periodic': periodic,
+        'points': points,
+        'knots': getKnots(degree, len(points), periodic),
+    }
+
+def loadCatalog(path: str | None = None, reload=False) -> dict:
+    global _catalog, _loadTime
+
+    if _catalog is not None and not reload and path is None:
+        return _catalog
+
+    startTime = time.perf_counter()
+
+    with open(path or CATALOG_PATH, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    catalog = {name: _buildShape(name, shape) for name, shape in data['shapes'].items()}
+
+    _loadTime = time.perf_counter() - startTime
+
+    if path is None:
+        _catalog = catalog
+
+    return catalog
+
+def getLoadTime() -> float:
+    """마지막 카탈로그 로드에 걸린 시간(초)"""
+    return _loadTime
+
+def getShapeNames() -> list[str]:
+    return list(loadCatalog())
+
+def getShape(name: str) -> dict:
+    catalog = loadCatalog()
+
+    if name not in catalog:
+        raise KeyError(f"Unknown controller shape '{name}'")
+
+    return catalog[name]
@@ -0,0 +1,168 @@
+#-----------------------------------------
+# Shape template cache
+# 같은 (shape, size, normal) 조합의 커브를 반복해서 만들 때 숨겨진 템플릿을 한 번만 만들고,
+# 이후 요청은 템플릿의 CV 데이터를 새 shape 노드로 복사해서 처리한다.
+# 템플릿은 파일에 저장되지 않고(doNotWrite) 씬을 닫을 때 캐시에서 제거된다.
+# API 로 복사한 노드는 apiUndo 로 undo 큐에 기록된다.
+#-----------------------------------------
+
+from collections import OrderedDict
+import maya.cmds as cmds
+import maya.api.OpenMaya as om
+import apiUndo
+
+TEMPLATE_NAME = 'shapeCacheTemplate'
+DEFAULT_MAX_SIZE = 32
+
+# importlib.reload 시에도 기존 템플릿과 콜백을 이어받는다
+_templates = globals().get('_templates') or OrderedDict()
+_stats = globals().get('_stats') or {'hits': 0, 'misses': 0, 'evictions': 0}
+_maxSize = globals().get('_maxSize', DEFAULT_MAX_SIZE)
+
+def _getObject(name: str) -> om.MObject:
+    selList = om.MSelectionList()
+    selList.add(name)
+    return selList.getDependNode(0)
+
+def _deleteTemplate(template: dict):
+    handle = template['transform']
+    if not handle.isValid():
+        return
+
+    # 만들 때처럼 undo 큐에 남기지 않는다 (undo 로 되살아나면 캐시가 모르는 템플릿이 남는다)
+    undoState = cmds.undoInfo(query=True, state=True)
+    cmds.undoInfo(stateWithoutFlush=False)
+
+    try:
+        cmds.delete(om.MFnDagNode(handle.object()).fullPathName())
+    finally:
+        cmds.undoInfo(stateWithoutFlush=undoState)
+
+def _buildTemplate(builder) -> dict:
+    # 템플릿은 캐시 상태이므로 undo 큐에 남기지 않는다 (undo 로 지워지면 캐시가 빈 노드를 가리키게 된다)
+    undoState = cmds.undoInfo(query=True, state=True)
+    cmds.undoInfo(stateWithoutFlush=False)
+
+    try:
+        return _buildTemplateNode(builder)
+    finally:
+        cmds.undoInfo(stateWithoutFlush=undoState)
+
+def _buildTemplateNode(builder) -> dict:
+    transform = builder(TEMPLATE_NAME)
+    transformObj = _getObject(transform)
+    transformFn = om.MFnTransform(transformObj)
+
+    shapes = []
+    for i in range(transformFn.childCount()):
+        child = transformFn.child(i)
+        if child.hasFn(om.MFn.kNurbsCurve) and not om.MFnDagNode(child).isIntermediateObject:
+            shapes.append(child)
+            om.MFnDependencyNode(child).setDoNotWrite(True)
+
+    transformFn.setDoNotWrite(True)
+    cmds.setAttr(f'{transform}.visibility', False)
+    cmds.setAttr(f'{transform}.hiddenInOutliner', True)
+
+    return {
+        'transform': om.MObjectHandle(transformObj),
+        'shapes': shapes,
+        'rotatePivot': transformFn.rotatePivot(om.MSpace.kTransform),
+        'scalePivot': transformFn.scalePivot(om.MSpace.kTransform),
+    }
+
+def _instantiate(template: dict, name: str) -> str:
+    modifier = om.MDagModifier()
+    transformObj = modifier.createNode('transform')
+    modifier.renameNode(transformObj, name)
+    modifier.doIt()
+
+    curveFn = om.MFnNurbsCurve()
+    shapeName = om.MFnDependencyNode(transformObj).name() + 'Shape'
+
+    for i, shapeObj in enumerate(template['shapes']):
+        copyObj = curveFn.copy(shapeObj, transformObj)
+        modifier.renameNode(copyObj, shapeName + (str(i) if i > 0 else ''))
+
+    modifier.doIt()
+
+    transformFn = om.MFnTransform(transformObj)
+    transformFn.setRotatePivot(template['rotatePivot'], om.MSpace.kTransform, False)
+    transformFn.setScalePivot(template['scalePivot'], om.MSpace.kTransform, False)
+
+    # 복사한 노드 전체를 지우는 modifier 로 undo / redo 한다 (redo 는 삭제의 undo)
+    deleteModifier = om.MDagModifier()
+    deleteModifier.deleteNode(transformObj)
+    apiUndo.commit(deleteModifier.doIt, deleteModifier.undoIt)
+
+    return transformFn.partialPathName()
+
+def create(key: tuple, builder, name: str) -> str:
+    """
+    key 에 해당하는 템플릿을 복사해서 name 이름의 커브 트랜스폼을 만든다.
+    템플릿이 없으면 builder(templateName) 로 한 번 만든다.
+    builder 는 커브 트랜스폼 이름을 반환해야 한다.
+    이름이 겹치면 Maya 가 번호를 붙이므로 실제로 만들어진 이름을 반환한다.
+    """
+    cmds.undoInfo(openChunk=True, chunkName='shapeCache.create')
+
+    try:
+        return _create(key, builder, name)
+    finally:
+        cmds.undoInfo(closeChunk=True)
+
+def _create(key: tuple, builder, name: str) -> str:
+    template = _templates.get(key)
+
+    if template is not None and template['transform'].isValid():
+        _stats['hits'] += 1
+        _templates.move_to_end(key)
+    else:
+        _stats['misses'] += 1
+        template = _buildTemplate(builder)
+        _templates[key] = template
+
+        while len(_templates) > _maxSize:
+            _, evicted = _templates.popitem(last=False)
+            _deleteTemplate(evicted)
+            _stats['evictions'] += 1
+
+    return _instantiate(template, name)
+
+def setMaxSize(maxSize: int):
+    global _maxSize
+    _maxSize = max(1, maxSize)
+
+    while len(_templates) > _maxSize:
+        _, evicted = _templates.popitem(last=False)
+        _deleteTemplate(evicted)
+        _stats['evictions'] += 1
+
+def getStats() -> dict:
+    return dict(_stats, size=len(_templates), maxSize=_maxSize)
+
+def resetStats():
+    for key in _stats:
+        _stats[key] = 0
+
+def clear(deleteNodes=True):
+    if deleteNodes:
+        for template in _templates.values():
+            _deleteTemplate(template)
+
+    _templates.clear()
+
+#-----------------------------------------
+# 씬을 닫을 때 캐시 비우기
+#-----------------------------------------
+def _onSceneClose(*_):
+    # 씬과 함께 템플릿 노드도 사라지므로 노드 삭제 없이 캐시만 비운다
+    clear(deleteNodes=False)
+
+for callbackId in globals().get('_callbackIds', []):
+    om.MMessage.removeCallback(callbackId)
+
+_callbackIds = [
+    om.MSceneMessage.addCallback(message, _onSceneClose)
+    for message in (om.MSceneMessage.kBeforeNew, om.MSceneMessage.kBeforeOpen, om.MSceneMessage.kMayaExiting)
+]